@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Set
 from domain.models.article import Article
 from core.domain.models.user import User
 from domain.value_objects.article_status import ArticleStatus
@@ -65,4 +66,27 @@ class ArticleRepository(ABC):
     @abstractmethod
     def get_popular_articles(self, limit: int = 5) -> List[Article]:
         """دریافت پر بازدیدترین مقالات"""
-        pass
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    def get_updated_since(
+        self,
+        since: Optional[datetime],
+        after_id: Optional[str] = None,
+        limit: int = 500
+    ) -> List[Article]:
+        """
+        دریافت مقالات تغییرکرده (با هر وضعیتی) به ترتیب (updated_at, id)
+        برای پیمایش بسته‌ای، آخرین updated_at و شناسه بسته قبل ارسال می‌شود
+        """
+        pass
+    
+    @abstractmethod
+    def mark_indexed(self, article_id: str, fingerprint: str) -> None:
+        """ثبت اثر انگشت نسخه‌ای که با موفقیت در موتور جستجو نوشته شد"""
+        pass
+    
+    @abstractmethod
+    def get_existing_ids(self, article_ids: List[str]) -> Set[str]:
+        """شناسه‌هایی از فهرست که مقاله‌ای (با هر وضعیتی) در دیتابیس دارند"""
+        pass
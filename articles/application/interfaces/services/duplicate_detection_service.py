@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Iterable, List
+from domain.models.article import Article
+
+@dataclass
+class DuplicateMatch:
+    """مقاله تقریبا تکراری یافت‌شده"""
+    article_id: str
+    similar_article_id: str
+    distance: int  # فاصله همینگ اثر انگشت‌ها (صفر یعنی یکسان)
+
+class DuplicateDetectionService(ABC):
+    """اینترفیس سرویس تشخیص مقالات تقریبا تکراری"""
+
+    @abstractmethod
+    def find_similar(self, article: Article) -> List[DuplicateMatch]:
+        """یافتن مقالات موجود مشابه با محتوای این مقاله"""
+        pass
+
+    @abstractmethod
+    def add_article(self, article: Article) -> None:
+        """افزودن یا به‌روزرسانی اثر انگشت مقاله در ایندکس"""
+        pass
+
+    @abstractmethod
+    def remove_article(self, article_id: str) -> None:
+        """حذف مقاله از ایندکس"""
+        pass
+
+    @abstractmethod
+    def audit(self, articles: Iterable[Article]) -> List[DuplicateMatch]:
+        """ممیزی گروهی: تمام جفت‌های تقریبا تکراری در میان مقالات داده‌شده"""
+        pass
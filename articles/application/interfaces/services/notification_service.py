@@ -17,6 +17,11 @@ class NotificationService(Protocol):
         """ارسال گروهی اطلاع‌رسانی"""
         pass
 
+    @abstractmethod
+    def send_saved_search_notification(self, user_id: str, article, saved_searches: list) -> bool:
+        """اعلان انتشار مقاله منطبق با جستجوهای ذخیره‌شده کاربر (یک اعلان برای همه جستجوهای منطبق)"""
+        pass
+
     @property
     @abstractmethod
     def service_name(self) -> str:
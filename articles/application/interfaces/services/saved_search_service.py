@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import List
+from domain.models.article import Article
+
+@dataclass
+class SavedSearch:
+    """جستجوی ذخیره‌شده کاربر برای دریافت اعلان مقالات جدید"""
+    id: str
+    user_id: str
+    query: str
+    tags: List[str] = field(default_factory=list)
+
+class SavedSearchService(ABC):
+    """اینترفیس سرویس جستجوهای ذخیره‌شده (اعلان مقالات جدید منطبق)"""
+
+    @abstractmethod
+    def subscribe(self, user_id: str, query: str, tags: List[str] = None) -> SavedSearch:
+        """ذخیره جستجو برای کاربر"""
+        pass
+
+    @abstractmethod
+    def unsubscribe(self, saved_search_id: str) -> bool:
+        """حذف جستجوی ذخیره‌شده"""
+        pass
+
+    @abstractmethod
+    def match_article(self, article: Article) -> List[SavedSearch]:
+        """
+        تطبیق یک مقاله با تمام جستجوهای ذخیره‌شده در یک فراخوانی
+        (بدون اجرای دوباره تک‌تک جستجوها)
+        """
+        pass
@@ -1,19 +1,69 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Union
+from dataclasses import dataclass, field
 from domain.models.article import Article
 
+# نام فیلدهایی که می‌توان شمارش نتایج (facet) را برای آن‌ها درخواست کرد
+SEARCH_FACETS = ('tags', 'categories', 'author', 'status', 'published')
+
+@dataclass
+class SearchHit:
+    """
+    نتیجه سبک جستجو
+    فقط فیلدهای لازم برای نمایش در لیست نتایج، بدون بارگذاری کامل مقاله
+    """
+    id: str
+    title: str
+    slug: str
+    author_id: str
+    status: str
+    published_at: Optional[str] = None
+    updated_at: Optional[str] = None
+    view_count: int = 0
+    comment_count: int = 0
+    score: Optional[float] = None
+    highlights: List[str] = field(default_factory=list)
+
+@dataclass
+class FacetBucket:
+    """شمارش نتایج جستجو برای یک مقدار از یک فیلد"""
+    value: str
+    count: int
+
 @dataclass
 class SearchResult:
     """نتیجه جستجو"""
-    articles: List[Article]
+    hits: List[SearchHit]
     total_results: int
     page: int
     page_size: int
+    next_cursor: Optional[str] = None  # نشانگر مبهم برای دریافت صفحه بعد
+    facets: Dict[str, List[FacetBucket]] = field(default_factory=dict)
+    is_degraded: bool = False  # نتیجه از مسیر جایگزین (کش قدیمی یا دیتابیس) آمده است
+
+@dataclass
+class SearchQuery:
+    """یک جستجوی مقالات در درخواست گروهی"""
+    query: str
+    page: int = 1
+    page_size: int = 10
+    filters: Optional[dict] = None
+    sort_by: Optional[str] = None
+    cursor: Optional[str] = None
+    facets: Optional[List[str]] = None
+
+@dataclass
+class SuggestionQuery:
+    """درخواست پیشنهادهای جستجو در درخواست گروهی"""
+    query: str
+    limit: int = 5
 
 class SearchService(ABC):
     """اینترفیس سرویس جستجوی مقالات"""
     
+    # موتوری که ایندکس جدا از دیتابیس دارد و باید با reconcile_search_index همگام شود
+    supports_reconciliation: bool = False
+    
     @abstractmethod
     def search_articles(
         self,
@@ -21,7 +71,9 @@ class SearchService(ABC):
         page: int = 1,
         page_size: int = 10,
         filters: Optional[dict] = None,
-        sort_by: Optional[str] = None
+        sort_by: Optional[str] = None,
+        cursor: Optional[str] = None,
+        facets: Optional[List[str]] = None
     ) -> SearchResult:
         """
         جستجوی مقالات با قابلیت فیلتر و مرتب‌سازی
@@ -32,12 +84,44 @@ class SearchService(ABC):
             page_size: تعداد نتایج در هر صفحه
             filters: فیلترهای جستجو (مثلا {'status': 'published', 'author_id': '...'})
             sort_by: فیلد مرتب‌سازی (مثلا 'newest', 'popular')
+            cursor: نشانگر صفحه بعد از نتیجه قبلی (در صورت وجود، page نادیده گرفته می‌شود)
+            facets: فیلدهایی از SEARCH_FACETS که شمارش نتایج برایشان لازم است
             
         Returns:
             SearchResult: نتیجه جستجو
         """
         pass
     
+    def multi_search(
+        self,
+        queries: List[Union[SearchQuery, SuggestionQuery]]
+    ) -> List[Union[SearchResult, List[str]]]:
+        """
+        اجرای چند جستجو در یک درخواست
+        
+        پیاده‌سازی پیش‌فرض درخواست‌ها را یکی‌یکی اجرا می‌کند؛ موتورهایی که
+        اجرای گروهی را پشتیبانی می‌کنند آن را بازنویسی می‌کنند
+        
+        Returns:
+            لیست نتایج به همان ترتیب درخواست‌ها: SearchResult برای SearchQuery
+            و لیست پیشنهادها برای SuggestionQuery
+        """
+        results = []
+        for item in queries:
+            if isinstance(item, SuggestionQuery):
+                results.append(self.get_suggestions(item.query, item.limit))
+            else:
+                results.append(self.search_articles(
+                    query=item.query,
+                    page=item.page,
+                    page_size=item.page_size,
+                    filters=item.filters,
+                    sort_by=item.sort_by,
+                    cursor=item.cursor,
+                    facets=item.facets
+                ))
+        return results
+    
     @abstractmethod
     def index_article(self, article: Article) -> bool:
         """ایندکس کردن مقاله در موتور جستجو"""
@@ -53,6 +137,39 @@ class SearchService(ABC):
         """حذف مقاله از موتور جستجو"""
         pass
     
+    def bulk_index_articles(self, articles: List[Article]) -> int:
+        """
+        ایندکس گروهی مقالات (ایجاد یا جایگزینی سند)
+        پیاده‌سازی پیش‌فرض مقالات را یکی‌یکی ایندکس می‌کند
+        
+        Returns:
+            int: تعداد مقالات ایندکس‌شده
+        """
+        return sum(1 for article in articles if self.index_article(article))
+    
+    def bulk_remove_articles(self, article_ids: List[str]) -> int:
+        """حذف گروهی مقالات از ایندکس؛ تعداد حذف‌شده‌ها را برمی‌گرداند"""
+        return sum(1 for article_id in article_ids if self.remove_article_from_index(article_id))
+    
+    @abstractmethod
+    def get_indexed_versions(self, article_ids: List[str]) -> Dict[str, str]:
+        """
+        نسخه ایندکس‌شده مقالات برای مقایسه با دیتابیس
+        
+        Returns:
+            دیکشنری {شناسه مقاله: اثر انگشت سند (search_fingerprint)}؛
+            مقالاتی که در ایندکس نیستند در خروجی نمی‌آیند
+        """
+        pass
+    
+    @abstractmethod
+    def get_indexed_ids(self, after_id: Optional[str] = None, limit: int = 500) -> List[str]:
+        """
+        شناسه اسناد ایندکس با ترتیب ثابت برای پیمایش بسته‌ای
+        برای بسته بعد آخرین شناسه بسته قبل ارسال می‌شود
+        """
+        pass
+    
     @abstractmethod
     def get_suggestions(self, query: str, limit: int = 5) -> List[str]:
         """دریافت پیشنهادات جستجو"""
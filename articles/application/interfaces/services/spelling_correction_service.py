@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+class SpellingCorrectionService(ABC):
+    """اینترفیس سرویس اصلاح املایی عبارت‌های جستجو"""
+
+    @abstractmethod
+    def suggest_correction(self, query: str) -> Optional[str]:
+        """
+        عبارت اصلاح‌شده پیشنهادی («منظورتان ... بود؟»)
+        Returns:
+            عبارت اصلاح‌شده، یا None اگر اصلاحی لازم یا ممکن نباشد
+        """
+        pass
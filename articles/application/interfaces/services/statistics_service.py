@@ -2,13 +2,20 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 from datetime import datetime, timedelta
 from domain.models.article import Article
+from domain.services.engagement_scoring import EngagementWeights
 
 class StatisticsService(ABC):
     """اینترفیس سرویس آمار و گزارشات"""
     
     @abstractmethod
-    def record_article_view(self, article_id: str) -> bool:
-        """ثبت بازدید یک مقاله"""
+    def record_article_view(self, article_id: str, viewer_id: Optional[str] = None) -> bool:
+        """
+        ثبت بازدید یک مقاله
+
+        Args:
+            article_id: شناسه مقاله
+            viewer_id: شناسه بازدیدکننده برای شمارش بازدید یکتا (کاربر یا نشست)
+        """
         pass
     
     @abstractmethod
@@ -31,7 +38,8 @@ class StatisticsService(ABC):
         دریافت پر بازدیدترین مقالات در بازه زمانی
         
         Args:
-            time_range: بازه زمانی (day/week/month/year/all)
+            time_range: بازه زمانی (day/week/month/year/all) یا trending
+                (بازدیدهای اخیر با وزن کاهشی بر حسب زمان)
             limit: تعداد مقالات
         """
         pass
@@ -46,6 +54,21 @@ class StatisticsService(ABC):
         """دریافت آمار یک دسته‌بندی"""
         pass
     
+    @abstractmethod
+    def get_engagement_leaderboard(self, days: int = 30, limit: int = 10) -> List[dict]:
+        """
+        پرتعامل‌ترین مقالات در بازه اخیر
+
+        Args:
+            days: طول بازه (روز)
+            limit: تعداد مقالات
+        """
+        pass
+
+    def get_engagement_weights(self) -> EngagementWeights:
+        """وزن‌های نمره تعامل؛ نمره تکی مقاله و جدول برترین‌ها باید با همین وزن‌ها حساب شوند"""
+        return EngagementWeights()
+
     @abstractmethod
     def get_site_stats(self) -> dict:
         """دریافت آمار کلی سایت"""
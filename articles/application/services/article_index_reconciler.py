@@ -0,0 +1,139 @@
+from datetime import datetime, timedelta
+from typing import List
+from domain.models.article import Article
+from domain.value_objects.article_status import ArticleStatus
+from domain.services.search_fingerprint import search_fingerprint
+from domain.repositories.index_checkpoint_repository import IndexCheckpointRepository
+from application.interfaces.services.search_service import SearchService
+from application.interfaces.repositories.article_repository import ArticleRepository
+
+class ArticleIndexReconciler:
+    """
+    همگام‌سازی تدریجی ایندکس جستجو با دیتابیس
+
+    مقالات تغییرکرده پس از آخرین نقطه ذخیره‌شده (updated_at) بسته به بسته خوانده و
+    با اثر انگشت اسناد ایندکس مقایسه می‌شوند؛ فقط اختلاف‌ها به صورت گروهی اصلاح می‌شوند.
+    جایگزین رویدادهای از دست رفته ArticleIndexer بدون نیاز به بازسازی کامل ایندکس است.
+    مقالاتی که از دیتابیس حذف شده‌اند در این پیمایش دیده نمی‌شوند؛ برای آن‌ها شناسه‌های
+    ایندکس بسته به بسته با دیتابیس مقایسه و اسناد بدون مقاله حذف می‌شوند.
+    """
+
+    CHECKPOINT_NAME = 'articles_search_index'
+
+    def __init__(
+        self,
+        search_service: SearchService,
+        article_repository: ArticleRepository,
+        checkpoint_repository: IndexCheckpointRepository,
+        batch_size: int = 500,
+        safety_lag: timedelta = timedelta(minutes=5),
+        prune_deleted: bool = True
+    ):
+        self.search_service = search_service
+        self.article_repository = article_repository
+        self.checkpoint_repository = checkpoint_repository
+        self.batch_size = batch_size
+        # تراکنش‌هایی که دیرتر از updated_at خود commit می‌شوند در این بازه دوباره بررسی می‌شوند
+        self.safety_lag = safety_lag
+        # پیمایش کل ایندکس پرهزینه‌تر است و می‌تواند در اجراهای پرتکرار خاموش شود
+        self.prune_deleted = prune_deleted
+
+    def reconcile(self) -> dict:
+        """
+        اجرای یک دور همگام‌سازی
+        Returns:
+            dict: آمار اختلاف‌ها و اصلاح‌ها
+        """
+        stats = {
+            'scanned': 0,
+            'in_sync': 0,
+            'missing': 0,    # منتشرشده ولی در ایندکس نیست
+            'stale': 0,      # اثر انگشت سند ایندکس با دیتابیس یکی نیست
+            'orphaned': 0,   # منتشرنشده ولی هنوز در ایندکس است
+            'deleted': 0,    # از دیتابیس حذف شده ولی هنوز در ایندکس است
+            'repaired': 0,
+            'failed': 0,
+            'start_time': datetime.now(),
+            'end_time': None,
+            'high_water_mark': None,
+            'success': True
+        }
+
+        high_water_mark, _ = self.checkpoint_repository.get(self.CHECKPOINT_NAME)
+        since = high_water_mark - self.safety_lag if high_water_mark else None
+        after_id = None
+
+        while True:
+            articles = self.article_repository.get_updated_since(since, after_id, self.batch_size)
+            if not articles:
+                break
+
+            batch_failed = self._reconcile_batch(articles, stats)
+            since, after_id = articles[-1].updated_at, articles[-1].id
+            if batch_failed:
+                # نقطه ذخیره‌شده جلو نمی‌رود تا دور بعد این بسته دوباره بررسی شود
+                stats['success'] = False
+            elif stats['success']:
+                self.checkpoint_repository.save(self.CHECKPOINT_NAME, since, after_id)
+                stats['high_water_mark'] = since
+
+            if len(articles) < self.batch_size:
+                break
+
+        if self.prune_deleted and not self._prune_deleted(stats):
+            stats['success'] = False
+
+        stats['end_time'] = datetime.now()
+        return stats
+
+    def _reconcile_batch(self, articles: List[Article], stats: dict) -> bool:
+        versions = self.search_service.get_indexed_versions([article.id for article in articles])
+        to_index, to_remove = [], []
+
+        for article in articles:
+            indexed_version = versions.get(article.id)
+            if article.status == ArticleStatus.PUBLISHED:
+                if indexed_version is None:
+                    stats['missing'] += 1
+                    to_index.append(article)
+                elif indexed_version != search_fingerprint(article):
+                    stats['stale'] += 1
+                    to_index.append(article)
+                else:
+                    stats['in_sync'] += 1
+            elif indexed_version is not None:
+                stats['orphaned'] += 1
+                to_remove.append(article.id)
+            else:
+                stats['in_sync'] += 1
+        stats['scanned'] += len(articles)
+
+        repaired = self.search_service.bulk_index_articles(to_index)
+        repaired += self.search_service.bulk_remove_articles(to_remove)
+        failed = len(to_index) + len(to_remove) - repaired
+        stats['repaired'] += repaired
+        stats['failed'] += failed
+        return failed > 0
+
+    def _prune_deleted(self, stats: dict) -> bool:
+        """حذف اسناد ایندکس که مقاله‌ای در دیتابیس ندارند؛ False اگر حذفی شکست خورد"""
+        all_removed = True
+        after_id = None
+        while True:
+            indexed_ids = self.search_service.get_indexed_ids(after_id, self.batch_size)
+            if not indexed_ids:
+                break
+
+            existing_ids = self.article_repository.get_existing_ids(indexed_ids)
+            to_remove = [article_id for article_id in indexed_ids if article_id not in existing_ids]
+            if to_remove:
+                stats['deleted'] += len(to_remove)
+                removed = self.search_service.bulk_remove_articles(to_remove)
+                stats['repaired'] += removed
+                stats['failed'] += len(to_remove) - removed
+                all_removed = all_removed and removed == len(to_remove)
+
+            after_id = indexed_ids[-1]
+            if len(indexed_ids) < self.batch_size:
+                break
+        return all_removed
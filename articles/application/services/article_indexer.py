@@ -1,20 +1,30 @@
+import logging
+from collections import defaultdict
 from typing import Optional
 from datetime import datetime
 from domain.models.article import Article
 from application.interfaces.services.search_service import SearchService
 from application.interfaces.repositories.article_repository import ArticleRepository
+from application.interfaces.services.saved_search_service import SavedSearchService
+from application.interfaces.services.notification_service import NotificationService
 from infrastructure.event_handlers.article_events import ArticlePublishedEvent, ArticleUpdatedEvent
 
+logger = logging.getLogger(__name__)
+
 class ArticleIndexer:
     """سرویس ایندکس کردن مقالات در موتور جستجو"""
     
     def __init__(
         self,
         search_service: SearchService,
-        article_repository: ArticleRepository
+        article_repository: ArticleRepository,
+        saved_search_service: Optional[SavedSearchService] = None,
+        notification_service: Optional[NotificationService] = None
     ):
         self.search_service = search_service
         self.article_repository = article_repository
+        self.saved_search_service = saved_search_service
+        self.notification_service = notification_service
 
     def handle_article_published(self, event: ArticlePublishedEvent) -> bool:
         """
@@ -28,7 +38,37 @@ class ArticleIndexer:
         if not article:
             return False
         
-        return self.search_service.index_article(article)
+        indexed = self.search_service.index_article(article)
+        self._notify_saved_searches(article)
+        return indexed
+
+    def _notify_saved_searches(self, article: Article) -> None:
+        """
+        تطبیق مقاله با تمام جستجوهای ذخیره‌شده در یک فراخوانی و ارسال یک اعلان به هر کاربر
+        خطای اعلان نباید ایندکس شدن مقاله را ناموفق نشان دهد
+        """
+        if not self.saved_search_service or not self.notification_service:
+            return
+        try:
+            matches = self.saved_search_service.match_article(article)
+        except Exception as e:
+            logger.error(f"Saved search matching failed for article {article.id}: {str(e)}")
+            return
+
+        by_user = defaultdict(list)
+        for saved_search in matches:
+            by_user[saved_search.user_id].append(saved_search)
+        for user_id, saved_searches in by_user.items():
+            if user_id == str(article.author.id):
+                continue
+            try:
+                self.notification_service.send_saved_search_notification(
+                    user_id=user_id,
+                    article=article,
+                    saved_searches=saved_searches
+                )
+            except Exception as e:
+                logger.error(f"Saved search notification failed for user {user_id}: {str(e)}")
 
     def handle_article_updated(self, event: ArticleUpdatedEvent) -> bool:
         """
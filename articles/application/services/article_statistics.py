@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from domain.models.article import Article
+from domain.services.engagement_scoring import EngagementWeights, engagement_scores
 from application.interfaces.repositories.article_repository import ArticleRepository
 from application.interfaces.repositories.comment_repository import CommentRepository
 from application.interfaces.services.statistics_service import StatisticsService
@@ -12,11 +13,14 @@ class ArticleStatistics:
         self,
         article_repo: ArticleRepository,
         comment_repo: CommentRepository,
-        stats_service: StatisticsService
+        stats_service: StatisticsService,
+        engagement_weights: Optional[EngagementWeights] = None
     ):
         self.article_repo = article_repo
         self.comment_repo = comment_repo
         self.stats_service = stats_service
+        # بدون وزن صریح، وزن‌های تنظیم‌شده در سرویس آمار استفاده می‌شوند
+        self.engagement_weights = engagement_weights or stats_service.get_engagement_weights()
 
     def get_article_engagement(self, article_id: str) -> Dict:
         """
@@ -35,11 +39,11 @@ class ArticleStatistics:
         
         return {
             'article_id': article_id,
-            'view_count': stats.get('view_count', 0),
+            'view_count': stats.get('total_views', 0),
             'comment_count': comment_count,
             'average_read_time': stats.get('average_read_time', 0),
             'engagement_score': self._calculate_engagement_score(
-                stats.get('view_count', 0),
+                stats.get('total_views', 0),
                 comment_count,
                 stats.get('average_read_time', 0)
             ),
@@ -54,71 +58,35 @@ class ArticleStatistics:
         Returns:
             Dict: آمار عملکرد
         """
-        articles = self.article_repo.get_by_author(author_id)
-        stats = {
-            'total_articles': len(articles),
-            'published_articles': 0,
-            'total_views': 0,
-            'total_comments': 0,
-            'articles': []
-        }
-        
-        for article in articles:
-            if article.status == 'published':
-                stats['published_articles'] += 1
-            
-            article_stats = self.stats_service.get_article_stats(article.id)
-            comment_count = self.comment_repo.count_by_article(article.id)
-            
-            stats['total_views'] += article_stats.get('view_count', 0)
-            stats['total_comments'] += comment_count
-            
-            stats['articles'].append({
-                'article_id': article.id,
-                'title': article.title,
-                'views': article_stats.get('view_count', 0),
-                'comments': comment_count,
-                'published_at': article.published_at.isoformat() if article.published_at else None
-            })
-        
-        return stats
+        # گزارش در سرویس آمار با یک کوئری تجمیعی ساخته و کش می‌شود
+        return self.stats_service.get_author_stats(author_id)
 
     def get_category_analytics(self, category_id: str) -> Dict:
         """
-        تحلیل آمار یک دسته‌بندی
+        تحلیل آمار یک دسته‌بندی (شامل زیردسته‌ها)
         Args:
             category_id: شناسه دسته‌بندی
         Returns:
             Dict: آمار دسته‌بندی
         """
-        articles = self.article_repo.get_by_category(category_id)
-        stats = {
-            'total_articles': len(articles),
-            'total_views': 0,
-            'total_comments': 0,
-            'trending_articles': [],
+        # مجموع‌ها و پنج مقاله پربازدید در دیتابیس محاسبه می‌شوند
+        stats = self.stats_service.get_category_stats(category_id)
+        return {
+            **stats,
             'last_updated': datetime.now().isoformat()
         }
-        
-        for article in articles:
-            article_stats = self.stats_service.get_article_stats(article.id)
-            comment_count = self.comment_repo.count_by_article(article.id)
-            
-            stats['total_views'] += article_stats.get('view_count', 0)
-            stats['total_comments'] += comment_count
-            
-            stats['trending_articles'].append({
-                'article_id': article.id,
-                'title': article.title,
-                'views': article_stats.get('view_count', 0),
-                'comments': comment_count
-            })
-        
-        # مرتب‌سازی مقالات پرطرفدار
-        stats['trending_articles'].sort(key=lambda x: x['views'], reverse=True)
-        stats['trending_articles'] = stats['trending_articles'][:5]
-        
-        return stats
+
+    def get_most_engaging(self, days: int = 30, limit: int = 10) -> List[Dict]:
+        """
+        پرتعامل‌ترین مقالات سایت در بازه اخیر
+        Args:
+            days: طول بازه (روز)
+            limit: تعداد مقالات
+        Returns:
+            List[Dict]: مقالات به ترتیب نمره تعامل
+        """
+        # نمره همه مقالات به صورت برداری در سرویس آمار محاسبه می‌شود
+        return self.stats_service.get_engagement_leaderboard(days, limit)
 
     def _calculate_engagement_score(
         self,
@@ -135,18 +103,5 @@ class ArticleStatistics:
         Returns:
             float: نمره تعامل
         """
-        # وزن‌دهی عوامل مختلف
-        view_weight = 0.4
-        comment_weight = 0.3
-        read_time_weight = 0.3
-        
-        # نرمالایز کردن مقادیر
-        normalized_views = min(views / 1000, 1.0)  # حداکثر 1000 بازدید
-        normalized_comments = min(comments / 50, 1.0)  # حداکثر 50 کامنت
-        normalized_read_time = min(avg_read_time / 300, 1.0)  # حداکثر 5 دقیقه
-        
-        return (
-            (normalized_views * view_weight) +
-            (normalized_comments * comment_weight) +
-            (normalized_read_time * read_time_weight)
-        ) * 100  # تبدیل به درصد
\ No newline at end of file
+        # همان فرمول رتبه‌بندی گروهی تا نمره تکی و جدول برترین‌ها یکسان باشند
+        return float(engagement_scores([views], [comments], [avg_read_time], self.engagement_weights)[0])
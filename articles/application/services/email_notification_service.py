@@ -1,18 +1,42 @@
 # application/services/email_notification_service.py
 from application.interfaces.services.notification_service import NotificationService
-from infrastructure.external_services.email_provider import BaseEmailProvider
+from domain.entities.notification import Notification
+from core.domain.value_objects.email import UserId
+from infrastructure.external_services.email_provider import BaseEmailProvider, EmailMessage
 
 class EmailNotificationService(NotificationService):
-    def __init__(self, email_provider: BaseEmailProvider):
+    def __init__(self, email_provider: BaseEmailProvider, user_repository=None):
         self._provider = email_provider
+        self._user_repository = user_repository
+
+    @property
+    def user_repository(self):
+        if self._user_repository is None:
+            from core.infrastructure.repositories.user.django_user_repository import DjangoUserRepository
+            self._user_repository = DjangoUserRepository()
+        return self._user_repository
 
     def send(self, user, notification) -> bool:
-        return self._provider.send_email(
-            to=user.email,
+        return self._provider.send_email(EmailMessage(
+            to=str(user.email),
             subject=notification.title,
-            body=notification.content
-        )
+            body=notification.content,
+            metadata=notification.metadata
+        ))
+
+    def broadcast(self, users: list, notification) -> dict:
+        # موجودیت User قابل hash نیست؛ نتیجه با شناسه کاربر برگردانده می‌شود
+        return {str(user.id): self.send(user, notification) for user in users}
+
+    def send_saved_search_notification(self, user_id: str, article, saved_searches: list) -> bool:
+        """ارسال یک ایمیل به کاربر برای همه جستجوهای ذخیره‌شده منطبق با مقاله"""
+        if not saved_searches:
+            return False
+        user = self.user_repository.get(UserId(str(user_id)))
+        if not user.is_active:
+            return False
+        return self.send(user, Notification.for_saved_search(article, saved_searches))
 
     @property
     def service_name(self) -> str:
-        return "EmailNotificationService"
\ No newline at end of file
+        return "EmailNotificationService"
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 from articles.domain.value_objects.article_status import ArticleStatus
 from core.domain.models.user import User
 from domain.models.article import Article
@@ -6,11 +7,13 @@ from domain.exceptions.article_errors import (
     ArticleNotFoundError,
     ArticlePermissionError,
     ArticleAlreadyPublishedError,
-    ArticleValidationError
+    ArticleValidationError,
+    ArticleDuplicateContentError
 )
 from application.interfaces.repositories.article_repository import ArticleRepository
 from application.interfaces.services.search_service import SearchService
 from application.interfaces.services.notification_service import NotificationService
+from application.interfaces.services.duplicate_detection_service import DuplicateDetectionService
 
 @dataclass
 class PublishArticleDTO:
@@ -25,11 +28,13 @@ class PublishArticleUseCase:
         self,
         article_repository: ArticleRepository,
         search_service: SearchService,
-        notification_service: NotificationService
+        notification_service: NotificationService,
+        duplicate_detector: Optional[DuplicateDetectionService] = None
     ):
         self.article_repository = article_repository
         self.search_service = search_service
         self.notification_service = notification_service
+        self.duplicate_detector = duplicate_detector
 
     def execute(self, dto: PublishArticleDTO) -> Article:
         """
@@ -46,6 +51,7 @@ class PublishArticleUseCase:
             ArticlePermissionError: اگر کاربر مجوز انتشار نداشته باشد
             ArticleAlreadyPublishedError: اگر مقاله قبلا منتشر شده باشد
             ArticleValidationError: اگر مقاله قابل انتشار نباشد
+            ArticleDuplicateContentError: اگر محتوا تقریبا تکراری باشد
         """
         # یافتن مقاله
         article = self.article_repository.get_by_id(dto.article_id)
@@ -75,6 +81,10 @@ class PublishArticleUseCase:
         # اندیس کردن مقاله در موتور جستجو
         self.search_service.index_article(published_article)
         
+        # ثبت اثر انگشت محتوا برای تشخیص تکراری‌های بعدی
+        if self.duplicate_detector:
+            self.duplicate_detector.add_article(published_article)
+        
         # ارسال نوتیفیکیشن
         self.notification_service.send_article_published_notification(
             article=published_article,
@@ -103,4 +113,9 @@ class PublishArticleUseCase:
             raise ArticleValidationError(
                 field_name="tags",
                 error_message="برای انتشار، مقاله باید حداقل یک تگ داشته باشد"
-            )
\ No newline at end of file
+            )
+        
+        if self.duplicate_detector:
+            matches = self.duplicate_detector.find_similar(article)
+            if matches:
+                raise ArticleDuplicateContentError(matches[0].similar_article_id)
\ No newline at end of file
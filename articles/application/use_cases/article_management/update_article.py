@@ -2,6 +2,7 @@ from typing import Optional
 from dataclasses import dataclass
 from articles.domain.value_objects.article_status import ArticleStatus
 from domain.models.article import Article
+from domain.services.search_fingerprint import search_fingerprint
 from core.domain.models.user import User
 from domain.exceptions.article_errors import (
     ArticleNotFoundError,
@@ -10,16 +11,17 @@ from domain.exceptions.article_errors import (
 )
 from application.interfaces.repositories.article_repository import ArticleRepository
 from application.interfaces.services.search_service import SearchService
+from application.interfaces.services.duplicate_detection_service import DuplicateDetectionService
 
 @dataclass
 class UpdateArticleDTO:
     """شیء انتقال داده برای به‌روزرسانی مقاله"""
     article_id: str
+    editor: User  # کاربری که در حال ویرایش است
     title: Optional[str] = None
     content: Optional[str] = None
     tags: Optional[list[str]] = None
     categories: Optional[list[str]] = None
-    editor: User  # کاربری که در حال ویرایش است
 
 class UpdateArticleUseCase:
     """یوزکیس به‌روزرسانی مقاله"""
@@ -27,10 +29,12 @@ class UpdateArticleUseCase:
     def __init__(
         self,
         article_repository: ArticleRepository,
-        search_service: SearchService
+        search_service: SearchService,
+        duplicate_detector: Optional[DuplicateDetectionService] = None
     ):
         self.article_repository = article_repository
         self.search_service = search_service
+        self.duplicate_detector = duplicate_detector
 
     def execute(self, dto: UpdateArticleDTO) -> Article:
         """
@@ -78,9 +82,16 @@ class UpdateArticleUseCase:
         # ذخیره تغییرات
         updated_article = self.article_repository.save(article)
         
-        # به‌روزرسانی اندکس جستجو
+        # به‌روزرسانی اندکس جستجو؛ ذخیره‌های بدون تغییر در فیلدهای ایندکس‌شده (مثل ذخیره خودکار ویرایشگر) نادیده گرفته می‌شوند
+        # اثر انگشت ذخیره‌شده مربوط به آخرین نسخه ایندکس‌شده است و فقط پس از نوشتن موفق جایگزین می‌شود
         if updated_article.status == ArticleStatus.PUBLISHED:
-            self.search_service.update_indexed_article(updated_article)
+            fingerprint = search_fingerprint(updated_article)
+            if fingerprint != updated_article.search_fingerprint:
+                if self.search_service.update_indexed_article(updated_article):
+                    self.article_repository.mark_indexed(updated_article.id, fingerprint)
+                    updated_article.search_fingerprint = fingerprint
+            if self.duplicate_detector and dto.content is not None:
+                self.duplicate_detector.add_article(updated_article)
         
         return updated_article
 
@@ -1,9 +1,16 @@
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
 from datetime import datetime
-from domain.models.article import Article
-from application.interfaces.services.search_service import SearchService
+from application.interfaces.services.search_service import (
+    SearchService,
+    SearchHit,
+    FacetBucket,
+    SearchQuery,
+    SuggestionQuery,
+    SEARCH_FACETS
+)
 from application.interfaces.services.statistics_service import StatisticsService
+from application.interfaces.services.spelling_correction_service import SpellingCorrectionService
 
 @dataclass
 class SearchArticlesDTO:
@@ -13,25 +20,38 @@ class SearchArticlesDTO:
     page_size: int = 10
     filters: Optional[dict] = None
     sort_by: Optional[str] = None
+    cursor: Optional[str] = None  # نشانگر صفحه بعد برای صفحه‌بندی عمیق
+    facets: Optional[List[str]] = None  # مثلا ['tags', 'categories', 'author']
+    include_suggestions: bool = False  # پیشنهادهای جستجو در همان درخواست گروهی
 
 @dataclass
 class SearchResult:
     """نتیجه جستجو"""
-    articles: List[Article]
+    hits: List[SearchHit]
     total_results: int
     page: int
     page_size: int
+    next_cursor: Optional[str] = None
+    facets: Dict[str, List[FacetBucket]] = field(default_factory=dict)
+    suggestions: List[str] = field(default_factory=list)
+    is_degraded: bool = False
+    did_you_mean: Optional[str] = None  # عبارت اصلاح‌شده برای جستجوهای بی‌نتیجه
 
 class SearchArticlesUseCase:
     """یوزکیس جستجوی پیشرفته مقالات"""
+
+    # حداکثر عمق صفحه‌بندی با شماره صفحه (max_result_window در Elasticsearch)
+    MAX_OFFSET_RESULTS = 10000
     
     def __init__(
         self,
         search_service: SearchService,
-        statistics_service: StatisticsService
+        statistics_service: StatisticsService,
+        spelling_corrector: Optional[SpellingCorrectionService] = None
     ):
         self.search_service = search_service
         self.statistics_service = statistics_service
+        self.spelling_corrector = spelling_corrector
 
     def execute(self, dto: SearchArticlesDTO) -> SearchResult:
         """
@@ -46,14 +66,31 @@ class SearchArticlesUseCase:
         # اعتبارسنجی داده‌های ورودی
         self._validate_input(dto)
         
-        # انجام جستجو
-        search_results = self.search_service.search_articles(
-            query=dto.query,
-            page=dto.page,
-            page_size=dto.page_size,
-            filters=dto.filters,
-            sort_by=dto.sort_by
-        )
+        # انجام جستجو؛ اگر موارد اضافی خواسته شده باشد همه در یک درخواست گروهی
+        suggestions = []
+        if dto.include_suggestions:
+            search_results, suggestions = self.search_service.multi_search([
+                SearchQuery(
+                    query=dto.query,
+                    page=dto.page,
+                    page_size=dto.page_size,
+                    filters=dto.filters,
+                    sort_by=dto.sort_by,
+                    cursor=dto.cursor,
+                    facets=dto.facets
+                ),
+                SuggestionQuery(query=dto.query)
+            ])
+        else:
+            search_results = self.search_service.search_articles(
+                query=dto.query,
+                page=dto.page,
+                page_size=dto.page_size,
+                filters=dto.filters,
+                sort_by=dto.sort_by,
+                cursor=dto.cursor,
+                facets=dto.facets
+            )
         
         # ثبت آمار جستجو
         self.statistics_service.record_search(
@@ -61,11 +98,21 @@ class SearchArticlesUseCase:
             result_count=search_results.total_results
         )
         
+        # پیشنهاد اصلاح املایی فقط برای جستجوهای بی‌نتیجه
+        did_you_mean = None
+        if search_results.total_results == 0 and self.spelling_corrector:
+            did_you_mean = self.spelling_corrector.suggest_correction(dto.query)
+        
         return SearchResult(
-            articles=search_results.articles,
+            hits=search_results.hits,
             total_results=search_results.total_results,
             page=dto.page,
-            page_size=dto.page_size
+            page_size=dto.page_size,
+            next_cursor=search_results.next_cursor,
+            facets=search_results.facets,
+            suggestions=suggestions,
+            is_degraded=search_results.is_degraded,
+            did_you_mean=did_you_mean
         )
 
     def _validate_input(self, dto: SearchArticlesDTO) -> None:
@@ -77,4 +124,11 @@ class SearchArticlesUseCase:
             raise ValueError("شماره صفحه نمی‌تواند کمتر از ۱ باشد")
             
         if dto.page_size < 1 or dto.page_size > 100:
-            raise ValueError("تعداد نتایج در هر صفحه باید بین ۱ تا ۱۰۰ باشد")
\ No newline at end of file
+            raise ValueError("تعداد نتایج در هر صفحه باید بین ۱ تا ۱۰۰ باشد")
+
+        if not dto.cursor and dto.page * dto.page_size > self.MAX_OFFSET_RESULTS:
+            raise ValueError("برای صفحات عمیق از نشانگر صفحه بعد (cursor) استفاده کنید")
+
+        unknown_facets = set(dto.facets or []) - set(SEARCH_FACETS)
+        if unknown_facets:
+            raise ValueError(f"فیلدهای facet نامعتبر: {', '.join(sorted(unknown_facets))}")
\ No newline at end of file
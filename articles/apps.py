@@ -4,3 +4,13 @@ from django.apps import AppConfig
 class ArticlesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'articles'
+
+    def ready(self):
+        # مدل‌ها در لایه‌های domain و infrastructure تعریف شده‌اند نه در articles.models؛
+        # پس از ثبت مدل کاربر core ایمپورت می‌شوند تا مایگریشن‌ها همه آن‌ها را ببینند
+        import domain.models.search  # noqa: F401
+        import infrastructure.repositories.article.models  # noqa: F401
+        import infrastructure.repositories.comment.models  # noqa: F401
+
+        # ایمپورت سیگنال‌ها
+        import articles.signals
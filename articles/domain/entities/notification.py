@@ -19,4 +19,21 @@ class Notification:
         self.title = title
         self.content = content
         self.created_at = datetime.now()
-        self.metadata = metadata or {}
\ No newline at end of file
+        self.metadata = metadata or {}
+
+    @classmethod
+    def for_saved_search(cls, article, saved_searches: list) -> 'Notification':
+        """Single notification for an article matching one or more of a user's saved searches"""
+        queries = [saved_search.query for saved_search in saved_searches if saved_search.query]
+        lines = [f'مقاله «{article.title}» منتشر شد.']
+        if queries:
+            lines.append('جستجوهای منطبق: ' + '، '.join(queries))
+        return cls(
+            title=f'مقاله جدید: {article.title}',
+            content='\n'.join(lines),
+            metadata={
+                'type': 'saved_search',
+                'article_id': str(article.id),
+                'saved_search_ids': [str(saved_search.id) for saved_search in saved_searches]
+            }
+        )
@@ -75,4 +75,15 @@ class ArticleTitleDuplicateError(ArticleValidationError):
         super().__init__(
             field_name="title",
             error_message=f"مقاله با عنوان '{title}' از قبل وجود دارد"
+        )
+
+
+class ArticleDuplicateContentError(ArticleValidationError):
+    """محتوای مقاله تقریبا تکراری است"""
+    
+    def __init__(self, similar_article_id):
+        self.similar_article_id = similar_article_id
+        super().__init__(
+            field_name="content",
+            error_message=f"محتوای مقاله مشابه مقاله موجود با شناسه {similar_article_id} است"
         )
\ No newline at end of file
@@ -28,6 +28,7 @@ class Article:
     updated_at: datetime
     published_at: datetime | None
     view_count: int
+    search_fingerprint: str | None  # اثر انگشت آخرین نسخه‌ای که با موفقیت ایندکس شده است
 
     def __init__(
         self,
@@ -51,6 +52,7 @@ class Article:
         self.updated_at = datetime.now()
         self.published_at = None
         self.view_count = 0
+        self.search_fingerprint = None
 
     def publish(self) -> None:
         """انتشار مقاله با اعتبارسنجی وضعیت فعلی"""
@@ -1,18 +1,63 @@
 # models.py
+import uuid
 from django.db import models
-from django.contrib.postgres.fields import JSONField  # For Django < 3.1
-# from django.db.models import JSONField  # For Django ≥ 3.1
+from django.utils import timezone
 
 class DjangoSearchLog(models.Model):
     query = models.CharField(max_length=255)
     user_id = models.CharField(max_length=36, null=True, blank=True)
-    timestamp = models.DateTimeField(auto_now_add=True)
+    timestamp = models.DateTimeField(default=timezone.now)  # زمان جستجو، نه زمان درج گروهی
     results_count = models.PositiveIntegerField(default=0)
-    metadata = JSONField(default=dict)
+    metadata = models.JSONField(default=dict)
     
     class Meta:
+        app_label = 'articles'
         indexes = [
             models.Index(fields=['user_id']),
             models.Index(fields=['timestamp']),
             models.Index(fields=['query']),
-        ]
\ No newline at end of file
+        ]
+
+class DjangoSearchQueryRollup(models.Model):
+    """شمارش تجمیعی جستجوها به ازای هر عبارت نرمال‌شده در هر ساعت/روز"""
+    HOUR = 'hour'
+    DAY = 'day'
+    GRANULARITY_CHOICES = [(HOUR, 'Hour'), (DAY, 'Day')]
+
+    normalized_query = models.CharField(max_length=255)
+    granularity = models.CharField(max_length=4, choices=GRANULARITY_CHOICES)
+    bucket_start = models.DateTimeField()
+    search_count = models.PositiveIntegerField(default=0)
+    zero_result_count = models.PositiveIntegerField(default=0)
+    total_results = models.BigIntegerField(default=0)
+
+    class Meta:
+        app_label = 'articles'
+        unique_together = ('granularity', 'bucket_start', 'normalized_query')
+        indexes = [
+            models.Index(fields=['granularity', 'bucket_start']),
+        ]
+
+class DjangoIndexCheckpoint(models.Model):
+    """آخرین نقطه پیمایش‌شده (high-water mark) برای همگام‌سازی تدریجی ایندکس جستجو"""
+    name = models.CharField(max_length=100, unique=True)
+    high_water_mark = models.DateTimeField(null=True, blank=True)
+    last_article_id = models.CharField(max_length=36, null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        app_label = 'articles'
+
+class DjangoSavedSearch(models.Model):
+    """جستجوی ذخیره‌شده کاربر؛ در زمان انتشار مقاله با آن تطبیق داده می‌شود"""
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4)
+    user_id = models.CharField(max_length=36)
+    query = models.CharField(max_length=255, blank=True)
+    tags = models.JSONField(default=list)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        app_label = 'articles'
+        indexes = [
+            models.Index(fields=['user_id']),
+        ]
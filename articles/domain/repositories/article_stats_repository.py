@@ -1,6 +1,8 @@
 # domain/repositories/article_stats_repository.py
 from abc import ABC, abstractmethod
-from ...domain.entities.article_stats import ArticleStats
+from dataclasses import fields
+from typing import Dict, Iterable, List
+from ..entities.article_stats import ArticleStats
 
 class ArticleStatsRepository(ABC):
     @abstractmethod
@@ -9,4 +11,33 @@ class ArticleStatsRepository(ABC):
 
     @abstractmethod
     def get_by_article(self, article_id: str) -> ArticleStats:
-        pass
\ No newline at end of file
+        pass
+
+    def save_many(self, stats: List[ArticleStats], add_fields: Iterable[str] = ()) -> int:
+        """
+        ذخیره گروهی آمار مقالات
+        فیلدهای add_fields با مقدار ذخیره‌شده جمع و بقیه جایگزین می‌شوند.
+        پیاده‌سازی پیش‌فرض هر مورد را جداگانه می‌خواند و ذخیره می‌کند؛
+        مخزن‌های دیتابیسی باید آن را با یک دستور گروهی جایگزین کنند.
+        """
+        stats_fields = [field.name for field in fields(ArticleStats) if field.name != 'article_id']
+        add_fields = set(add_fields)
+        unknown = add_fields - set(stats_fields)
+        if unknown:
+            raise ValueError(f"Unknown stats fields: {', '.join(sorted(unknown))}")
+
+        merged: Dict[str, ArticleStats] = {}
+        for item in stats:
+            current = merged.get(item.article_id)
+            if current is None:
+                current = self.get_by_article(item.article_id) if add_fields else ArticleStats(item.article_id)
+                merged[item.article_id] = current
+            for field in stats_fields:
+                value = getattr(item, field)
+                if field in add_fields:
+                    value += getattr(current, field)
+                setattr(current, field, value)
+
+        for item in merged.values():
+            self.save(item)
+        return len(merged)
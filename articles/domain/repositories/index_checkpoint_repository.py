@@ -0,0 +1,17 @@
+# domain/repositories/index_checkpoint_repository.py
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional, Tuple
+
+class IndexCheckpointRepository(ABC):
+    """Interface for persisting search index reconciliation progress"""
+
+    @abstractmethod
+    def get(self, name: str) -> Tuple[Optional[datetime], Optional[str]]:
+        """Return the (high-water mark, last article id) pair, or (None, None) if never run"""
+        pass
+
+    @abstractmethod
+    def save(self, name: str, high_water_mark: datetime, last_article_id: Optional[str]) -> None:
+        """Persist the position of the last fully processed article"""
+        pass
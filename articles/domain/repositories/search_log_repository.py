@@ -19,4 +19,9 @@ class SearchLogRepository(ABC):
     @abstractmethod
     def get_popular_searches(self, limit: int = 10) -> List[str]:
         """Get most popular search queries"""
+        pass
+    
+    @abstractmethod
+    def get_trending_searches(self, limit: int = 10) -> List[str]:
+        """Get approximate most frequent queries of the recent window"""
         pass
\ No newline at end of file
@@ -0,0 +1,51 @@
+# domain/services/engagement_scoring.py
+from dataclasses import dataclass
+from typing import Sequence
+import numpy as np
+
+
+@dataclass(frozen=True)
+class EngagementWeights:
+    """وزن هر عامل و سقفی که بالاتر از آن عامل اشباع می‌شود"""
+    views: float = 0.4
+    comments: float = 0.3
+    read_time: float = 0.3
+    views_cap: float = 1000
+    comments_cap: float = 50
+    read_time_cap: float = 300  # ثانیه
+
+    @classmethod
+    def from_dict(cls, config: dict) -> 'EngagementWeights':
+        return cls(**{key.lower(): value for key, value in config.items()})
+
+
+def engagement_scores(
+    views: Sequence[float],
+    comments: Sequence[float],
+    avg_read_time: Sequence[float],
+    weights: EngagementWeights = EngagementWeights()
+) -> np.ndarray:
+    """
+    نمره تعامل (۰ تا ۱۰۰) برای آرایه‌ای از مقالات به صورت برداری
+    هر عامل بر سقف خود تقسیم و به ۱ محدود می‌شود و سپس وزن‌دار جمع می‌شود
+    """
+    def normalized(values, cap):
+        return np.minimum(np.asarray(values, dtype=np.float64) / cap, 1.0)
+
+    return (
+        normalized(views, weights.views_cap) * weights.views
+        + normalized(comments, weights.comments_cap) * weights.comments
+        + normalized(avg_read_time, weights.read_time_cap) * weights.read_time
+    ) * 100
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    اندیس k نمره برتر به ترتیب نزولی
+    با argpartition انتخاب و فقط همان k مورد مرتب می‌شوند (نمره‌های برابر به ترتیب اندیس)
+    """
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    candidates = np.argpartition(-scores, k - 1)[:k]
+    return candidates[np.lexsort((candidates, -scores[candidates]))]
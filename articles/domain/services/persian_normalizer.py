@@ -0,0 +1,41 @@
+# domain/services/persian_normalizer.py
+import re
+import unicodedata
+from typing import List
+
+# یکسان‌سازی حروف عربی با معادل فارسی و ارقام فارسی/عربی با ارقام لاتین
+_CHAR_MAP = str.maketrans({
+    'ي': 'ی', 'ى': 'ی', 'ك': 'ک', 'ۀ': 'ه', 'ة': 'ه',
+    'أ': 'ا', 'إ': 'ا', 'ٱ': 'ا', 'ؤ': 'و',
+    '۰': '0', '۱': '1', '۲': '2', '۳': '3', '۴': '4',
+    '۵': '5', '۶': '6', '۷': '7', '۸': '8', '۹': '9',
+    '٠': '0', '١': '1', '٢': '2', '٣': '3', '٤': '4',
+    '٥': '5', '٦': '6', '٧': '7', '٨': '8', '٩': '9',
+    'ـ': None,  # کشیده
+})
+
+_ZERO_WIDTH = re.compile('[‌‍‎‏﻿]')
+_NON_WORD = re.compile(r'[^\w\s]')
+_SPACES = re.compile(r'\s+')
+
+
+def normalize_text(text: str) -> str:
+    """
+    نرمال‌سازی متن فارسی برای مقایسه و جستجو
+    حروف و ارقام یکسان، اعراب و نیم‌فاصله حذف و فاصله‌ها یکی می‌شوند
+    """
+    if not text:
+        return ''
+    text = text.translate(_CHAR_MAP).lower()
+    text = ''.join(
+        char for char in unicodedata.normalize('NFKD', text)
+        if not unicodedata.combining(char)
+    )
+    text = _ZERO_WIDTH.sub(' ', text)
+    text = _NON_WORD.sub(' ', text)
+    return _SPACES.sub(' ', text).strip()
+
+
+def tokenize(text: str) -> List[str]:
+    """تقسیم متن نرمال‌شده به کلمات"""
+    return normalize_text(text).split()
@@ -0,0 +1,79 @@
+# domain/services/saved_search_matcher.py
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from .persian_normalizer import normalize_text, tokenize
+
+
+class SavedSearchMatcher:
+    """
+    تطبیق معکوس: یک مقاله در برابر تمام جستجوهای ذخیره‌شده
+
+    هر جستجو فقط زیر یک «کلمه لنگر» (طولانی‌ترین و معمولا کم‌تکرارترین کلمه آن)
+    ایندکس می‌شود. برای هر مقاله فقط جستجوهایی که لنگرشان در متن مقاله هست بررسی
+    می‌شوند؛ هزینه تطبیق با اندازه مقاله و تعداد نامزدها رشد می‌کند نه با تعداد کل جستجوها.
+
+    معنای تطبیق: همه کلمات عبارت جستجو در عنوان یا محتوا باشند و اگر تگ‌هایی
+    تعیین شده باشد، مقاله حداقل یکی از آن‌ها را داشته باشد.
+    """
+
+    TAG_PREFIX = '#'
+
+    def __init__(self):
+        # شناسه جستجو -> (کلمات، تگ‌ها)
+        self._subscriptions: Dict[str, Tuple[Set[str], Set[str]]] = {}
+        # کلمه لنگر -> شناسه جستجوها
+        self._anchors: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._subscriptions)
+
+    def __contains__(self, subscription_id: str) -> bool:
+        return subscription_id in self._subscriptions
+
+    def add(self, subscription_id: str, query: str, tags: Optional[Iterable[str]] = None) -> None:
+        terms = set(tokenize(query))
+        tag_set = {normalize_text(tag) for tag in tags or () if normalize_text(tag)}
+        if not terms and not tag_set:
+            raise ValueError("جستجوی ذخیره‌شده باید حداقل یک کلمه یا تگ داشته باشد")
+
+        self.remove(subscription_id)
+        self._subscriptions[subscription_id] = (terms, tag_set)
+        for anchor in self._anchor_keys(terms, tag_set):
+            self._anchors.setdefault(anchor, set()).add(subscription_id)
+
+    def remove(self, subscription_id: str) -> None:
+        subscription = self._subscriptions.pop(subscription_id, None)
+        if subscription is None:
+            return
+        for anchor in self._anchor_keys(*subscription):
+            ids = self._anchors.get(anchor)
+            if ids is not None:
+                ids.discard(subscription_id)
+                if not ids:
+                    del self._anchors[anchor]
+
+    def match(self, title: str, content: str, tags: Iterable[str] = ()) -> List[str]:
+        """شناسه جستجوهای ذخیره‌شده‌ای که با این مقاله تطبیق دارند"""
+        words = set(tokenize(title)) | set(tokenize(content))
+        tag_set = {normalize_text(tag) for tag in tags}
+
+        candidates: Set[str] = set()
+        for word in words:
+            candidates |= self._anchors.get(word, set())
+        for tag in tag_set:
+            candidates |= self._anchors.get(self.TAG_PREFIX + tag, set())
+
+        return sorted(
+            subscription_id for subscription_id in candidates
+            if self._matches(self._subscriptions[subscription_id], words, tag_set)
+        )
+
+    def _matches(self, subscription: Tuple[Set[str], Set[str]], words: Set[str], tags: Set[str]) -> bool:
+        terms, required_tags = subscription
+        return terms <= words and (not required_tags or bool(required_tags & tags))
+
+    def _anchor_keys(self, terms: Set[str], tags: Set[str]) -> List[str]:
+        # با وجود کلمه، یک لنگر کافی است چون همه کلمات باید در مقاله باشند؛
+        # جستجوی فقط‌تگ زیر همه تگ‌هایش ایندکس می‌شود (کافی است یکی تطبیق کند)
+        if terms:
+            return [max(terms, key=lambda term: (len(term), term))]
+        return [self.TAG_PREFIX + tag for tag in tags]
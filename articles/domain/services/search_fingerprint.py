@@ -0,0 +1,27 @@
+# domain/services/search_fingerprint.py
+import hashlib
+import json
+
+
+def search_fingerprint(article) -> str:
+    """
+    اثر انگشت فیلدهای ایندکس‌شده مقاله
+    اگر اثر انگشت تغییر نکرده باشد، نوشتن دوباره سند در ایندکس لازم نیست.
+    شمارنده‌ها و updated_at عمدا حذف شده‌اند تا تغییر آن‌ها باعث ایندکس مجدد نشود
+    """
+    status = getattr(article.status, 'value', article.status)
+    slug = getattr(article.slug, 'value', article.slug)
+    payload = json.dumps(
+        [
+            article.title,
+            slug,
+            article.content,
+            str(article.author.id),
+            status,
+            sorted(str(tag) for tag in article.tags),
+            sorted(str(category) for category in article.categories),
+            article.published_at.isoformat() if article.published_at else None,
+        ],
+        ensure_ascii=False
+    )
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
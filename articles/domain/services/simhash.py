@@ -0,0 +1,130 @@
+# domain/services/simhash.py
+import hashlib
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from .persian_normalizer import tokenize
+
+FINGERPRINT_BITS = 64
+
+
+def simhash(text: str, shingle_size: int = 3) -> int:
+    """
+    اثر انگشت SimHash شصت‌وچهار بیتی از shingleهای کلمات متن نرمال‌شده
+    متن‌های تقریبا یکسان اثر انگشت‌هایی با فاصله همینگ کم دارند
+    """
+    tokens = tokenize(text)
+    if len(tokens) < shingle_size:
+        shingles = [' '.join(tokens)] if tokens else []
+    else:
+        shingles = [
+            ' '.join(tokens[i:i + shingle_size])
+            for i in range(len(tokens) - shingle_size + 1)
+        ]
+
+    weights = [0] * FINGERPRINT_BITS
+    for shingle in shingles:
+        digest = int.from_bytes(
+            hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big'
+        )
+        for bit in range(FINGERPRINT_BITS):
+            weights[bit] += 1 if digest >> bit & 1 else -1
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(first: int, second: int) -> int:
+    return (first ^ second).bit_count()
+
+
+def fingerprint_bands(max_distance: int) -> List[Tuple[int, int]]:
+    """
+    (شروع، عرض) max_distance + 1 باند اثر انگشت؛ طبق اصل لانه کبوتری هر دو اثر
+    انگشت با فاصله حداکثر max_distance دست‌کم در یک باند کاملا یکسان‌اند
+    """
+    band_count = max_distance + 1
+    band_width = FINGERPRINT_BITS // band_count
+    return [
+        (index * band_width, band_width if index < band_count - 1
+         else FINGERPRINT_BITS - index * band_width)
+        for index in range(band_count)
+    ]
+
+
+class SimHashIndex:
+    """
+    ایندکس اثر انگشت‌های SimHash برای یافتن متن‌های تقریبا تکراری بدون پیمایش کل مجموعه
+
+    اثر انگشت به max_distance + 1 باند تقسیم می‌شود (fingerprint_bands) و فقط
+    اعضای باندهای مشترک مقایسه می‌شوند.
+    """
+
+    def __init__(self, max_distance: int = 3):
+        self.max_distance = max_distance
+        self._bands = fingerprint_bands(max_distance)
+        self._tables: List[Dict[int, Set[str]]] = [{} for _ in self._bands]
+        self._fingerprints: Dict[str, int] = {}
+        self._lock = threading.RLock()
+
+    def add(self, key: str, fingerprint: int) -> None:
+        with self._lock:
+            self.remove(key)
+            self._fingerprints[key] = fingerprint
+            for table, band_value in zip(self._tables, self._band_values(fingerprint)):
+                table.setdefault(band_value, set()).add(key)
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            fingerprint = self._fingerprints.pop(key, None)
+            if fingerprint is None:
+                return
+            for table, band_value in zip(self._tables, self._band_values(fingerprint)):
+                members = table.get(band_value)
+                if members:
+                    members.discard(key)
+                    if not members:
+                        del table[band_value]
+
+    def query(
+        self,
+        fingerprint: int,
+        exclude: Optional[str] = None
+    ) -> List[Tuple[str, int]]:
+        """کلیدهای مشابه به صورت (کلید، فاصله همینگ) به ترتیب شباهت"""
+        with self._lock:
+            candidates = set()
+            for table, band_value in zip(self._tables, self._band_values(fingerprint)):
+                candidates |= table.get(band_value, set())
+            candidates.discard(exclude)
+            matches = [
+                (key, hamming_distance(fingerprint, self._fingerprints[key]))
+                for key in candidates
+            ]
+        return sorted(
+            [match for match in matches if match[1] <= self.max_distance],
+            key=lambda match: match[1]
+        )
+
+    def pairs(self) -> List[Tuple[str, str, int]]:
+        """تمام جفت‌های مشابه موجود در ایندکس (برای ممیزی گروهی)"""
+        with self._lock:
+            keys = list(self._fingerprints)
+            found = []
+            for key in keys:
+                for other, distance in self.query(self._fingerprints[key], exclude=key):
+                    if key < other:
+                        found.append((key, other, distance))
+        return found
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._fingerprints
+
+    def _band_values(self, fingerprint: int) -> Iterable[int]:
+        for offset, width in self._bands:
+            yield fingerprint >> offset & ((1 << width) - 1)
@@ -0,0 +1,141 @@
+# domain/services/symspell.py
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set
+from .persian_normalizer import normalize_text
+
+
+@dataclass
+class SpellingSuggestion:
+    term: str
+    distance: int
+    count: int
+
+
+class SymSpell:
+    """
+    اصلاح املایی با الگوریتم Symmetric Delete (SymSpell)
+
+    برای هر کلمه واژگان، تمام حالت‌های حذف تا max_edit_distance حرف از پیشوند آن
+    از پیش محاسبه می‌شود؛ در زمان جستجو فقط حذف‌های کلمه ورودی در همین دیکشنری
+    جستجو می‌شوند و فاصله ویرایشی فقط برای همان چند نامزد محاسبه می‌شود.
+    کلمات پیش از ورود نرمال‌سازی می‌شوند تا گونه‌های عربی/فارسی حروف خطا حساب نشوند.
+    """
+
+    def __init__(self, max_edit_distance: int = 2, prefix_length: int = 7):
+        if prefix_length <= max_edit_distance:
+            raise ValueError("prefix_length باید از max_edit_distance بزرگ‌تر باشد")
+        self.max_edit_distance = max_edit_distance
+        self.prefix_length = prefix_length
+        self._words: Dict[str, int] = {}
+        self._deletes: Dict[str, List[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def __contains__(self, word: str) -> bool:
+        return normalize_text(word) in self._words
+
+    def add_word(self, word: str, count: int = 1) -> None:
+        word = normalize_text(word)
+        if not word or ' ' in word:
+            return
+        if word in self._words:
+            self._words[word] += count
+            return
+        self._words[word] = count
+        prefix = word[:self.prefix_length]
+        for deleted in self._edits(prefix) | {prefix}:
+            self._deletes.setdefault(deleted, []).append(word)
+
+    def add_words(self, counts: Dict[str, int]) -> None:
+        for word, count in counts.items():
+            self.add_word(word, count)
+
+    def lookup(self, word: str, max_distance: Optional[int] = None) -> List[SpellingSuggestion]:
+        """
+        نزدیک‌ترین کلمات واژگان به کلمه ورودی
+        به ترتیب فاصله ویرایشی و سپس تعداد تکرار
+        """
+        word = normalize_text(word)
+        max_distance = self.max_edit_distance if max_distance is None else min(max_distance, self.max_edit_distance)
+        if not word:
+            return []
+        if word in self._words:
+            return [SpellingSuggestion(word, 0, self._words[word])]
+
+        prefix = word[:self.prefix_length]
+        checked: Set[str] = set()
+        suggestions: Dict[str, SpellingSuggestion] = {}
+        for candidate in {prefix} | self._edits(prefix):
+            for term in self._deletes.get(candidate, ()):
+                if term in checked:
+                    continue
+                checked.add(term)
+                if abs(len(term) - len(word)) > max_distance:
+                    continue
+                distance = damerau_levenshtein(word, term, max_distance)
+                if distance <= max_distance:
+                    suggestions[term] = SpellingSuggestion(term, distance, self._words[term])
+
+        return sorted(suggestions.values(), key=lambda item: (item.distance, -item.count, item.term))
+
+    def correct(self, text: str) -> Optional[str]:
+        """
+        اصلاح کلمه به کلمه یک عبارت جستجو
+        Returns:
+            عبارت اصلاح‌شده، یا None اگر هیچ کلمه‌ای تغییر نکرده یا قابل اصلاح نباشد
+        """
+        words = normalize_text(text).split()
+        corrected = []
+        changed = False
+        for word in words:
+            best = self.lookup(word)
+            if best and best[0].distance > 0:
+                corrected.append(best[0].term)
+                changed = True
+            else:
+                corrected.append(word)
+        return ' '.join(corrected) if changed else None
+
+    def _edits(self, word: str) -> Set[str]:
+        """تمام حالت‌های حذف ۱ تا max_edit_distance حرف"""
+        result: Set[str] = set()
+        frontier = {word}
+        for _ in range(self.max_edit_distance):
+            next_frontier = set()
+            for item in frontier:
+                if len(item) <= 1:
+                    continue
+                for i in range(len(item)):
+                    deleted = item[:i] + item[i + 1:]
+                    if deleted not in result:
+                        result.add(deleted)
+                        next_frontier.add(deleted)
+            frontier = next_frontier
+        return result
+
+
+def damerau_levenshtein(source: str, target: str, max_distance: int) -> int:
+    """
+    فاصله ویرایشی با جابه‌جایی حروف مجاور (optimal string alignment)
+    اگر فاصله از max_distance بیشتر شود، max_distance + 1 برگردانده می‌شود
+    """
+    if source == target:
+        return 0
+    if abs(len(source) - len(target)) > max_distance:
+        return max_distance + 1
+
+    previous_previous: List[int] = []
+    previous = list(range(len(target) + 1))
+    for i in range(1, len(source) + 1):
+        current = [i] + [0] * len(target)
+        for j in range(1, len(target) + 1):
+            cost = 0 if source[i - 1] == target[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (i > 1 and j > 1 and source[i - 1] == target[j - 2]
+                    and source[i - 2] == target[j - 1]):
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+    return min(previous[-1], max_distance + 1)
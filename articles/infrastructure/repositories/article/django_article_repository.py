@@ -1,10 +1,14 @@
+from datetime import datetime
 from django.db import transaction
-from typing import List, Optional
+from django.db.models import Q
+from typing import List, Optional, Set
 from uuid import UUID
 from domain.models.article import Article
 from core.domain.models.user import User
 from domain.value_objects.article_status import ArticleStatus
+from domain.services.simhash import simhash
 from application.interfaces.repositories.article_repository import ArticleRepository
+from infrastructure.services.duplicate_detection.simhash_duplicate_detector import to_signed
 from .models import DjangoArticle, DjangoArticleTag, DjangoArticleCategory
 
 class DjangoArticleRepository(ArticleRepository):
@@ -40,7 +44,10 @@ class DjangoArticleRepository(ArticleRepository):
                 'author_id': article.author.id,
                 'status': article.status.value,
                 'published_at': article.published_at,
-                'view_count': article.view_count
+                'view_count': article.view_count,
+                'content_simhash': to_signed(simhash(article.content)),
+                # فقط پس از نوشتن موفق در ایندکس با mark_indexed تغییر می‌کند
+                'search_fingerprint': article.search_fingerprint
             }
         )
         
@@ -92,11 +99,9 @@ class DjangoArticleRepository(ArticleRepository):
 
     def _to_domain(self, db_article: DjangoArticle) -> Article:
         """تبدیل مدل دیتابیس به مدل دامنه"""
-        from domain.models.article import Article
-        from core.domain.models.user import User
         from domain.value_objects.slug import Slug
         
-        return Article(
+        article = Article(
             title=db_article.title,
             content=db_article.content,
             author=User(
@@ -104,11 +109,50 @@ class DjangoArticleRepository(ArticleRepository):
                 username=db_article.author.username,
                 # سایر ویژگی‌های کاربر
             ),
-            tags=list(db_article.tags.values_list('tag_name', flat=True)),
-            categories=list(db_article.categories.values_list('category_id', flat=True)),
-            status=ArticleStatus(db_article.status),
-            published_at=db_article.published_at,
-            view_count=db_article.view_count
+            # با all() از داده‌های prefetch شده استفاده می‌شود
+            tags=[tag.tag_name for tag in db_article.djangoarticletag_set.all()],
+            categories=[str(category.category_id) for category in db_article.djangoarticlecategory_set.all()],
+            status=ArticleStatus(db_article.status)
         )
+        # سازنده موجودیت شناسه و تاریخ‌های جدید می‌سازد؛ مقادیر ذخیره‌شده بازگردانده می‌شوند
+        article.id = str(db_article.id)
+        article.slug = Slug(db_article.slug)
+        article.created_at = db_article.created_at
+        article.updated_at = db_article.updated_at
+        article.published_at = db_article.published_at
+        article.view_count = db_article.view_count
+        article.search_fingerprint = db_article.search_fingerprint
+        return article
+
+    def mark_indexed(self, article_id: str, fingerprint: str) -> None:
+        # بدون تغییر updated_at تا پیمایش reconcile_search_index دوباره آن را نبیند
+        DjangoArticle.objects.filter(id=article_id).update(search_fingerprint=fingerprint)
+
+    def get_existing_ids(self, article_ids: List[str]) -> Set[str]:
+        if not article_ids:
+            return set()
+        return {
+            str(article_id)
+            for article_id in DjangoArticle.objects.filter(id__in=article_ids).values_list('id', flat=True)
+        }
+
+    def get_updated_since(
+        self,
+        since: Optional[datetime],
+        after_id: Optional[str] = None,
+        limit: int = 500
+    ) -> List[Article]:
+        """مقالات تغییرکرده پس از (since, after_id) به ترتیب (updated_at, id)"""
+        queryset = DjangoArticle.objects.select_related('author').prefetch_related(
+            'djangoarticletag_set', 'djangoarticlecategory_set'
+        ).order_by('updated_at', 'id')
+        if since is not None:
+            keyset = Q(updated_at__gt=since)
+            if after_id is not None:
+                keyset |= Q(updated_at=since, id__gt=after_id)
+            else:
+                keyset |= Q(updated_at=since)
+            queryset = queryset.filter(keyset)
+        return [self._to_domain(db_article) for db_article in queryset[:limit]]
 
     # سایر متدهای ریپازیتوری...
\ No newline at end of file
@@ -1,27 +1,101 @@
 # infrastructure/repositories/django_article_stats_repository.py
+from typing import Iterable, List
+from django.db import transaction
+from django.db.models import Q, Sum
+from django.utils import timezone
 from domain.repositories.article_stats_repository import ArticleStatsRepository
 from domain.entities.article_stats import ArticleStats
-from models import ArticleStats  # Your Django model
+from infrastructure.repositories.article.models import DjangoArticleDailyStats, DjangoArticleStats
+from infrastructure.repositories.bulk_upsert import bulk_upsert
+from infrastructure.services.statistics.article_stats_summary import refresh_article_stats
 
 class DjangoArticleStatsRepository(ArticleStatsRepository):
+    """
+    ردیف خلاصه (article_stats) فقط با refresh_article_stats از روی آمار روزانه ساخته می‌شود؛
+    این مخزن تغییرات را به صورت اختلاف در ردیف امروز آمار روزانه می‌نویسد و سپس
+    خلاصه همان مقالات را بازسازی می‌کند تا هر دو مسیر یک منبع داده داشته باشند
+    """
+    STATS_FIELDS = ('view_count', 'share_count', 'average_read_time')
+    # فیلد شمارنده و نام مجموع آن در کوئری تجمیعی
+    COUNT_FIELDS = {'view_count': 'views', 'share_count': 'shares'}
+    DELTA_FIELDS = ('view_count', 'share_count', 'read_time_total', 'read_count')
+
     def save(self, stats: ArticleStats) -> None:
-        django_stats, _ = ArticleStats.objects.update_or_create(
-            article_id=stats.article_id,
-            defaults={
-                'view_count': stats.view_count,
-                'share_count': stats.share_count,
-                'average_read_time': stats.average_read_time
-            }
-        )
-    
+        self.save_many([stats])
+
+    def save_many(self, stats: List[ArticleStats], add_fields: Iterable[str] = ()) -> int:
+        """
+        ذخیره گروهی با یک INSERT ... ON CONFLICT روی آمار روزانه در هر بسته
+        فیلدهای add_fields با مقدار موجود جمع و بقیه جایگزین می‌شوند؛
+        میانگین زمان مطالعه قابل جمع نیست و همیشه جایگزین می‌شود
+        """
+        add_fields = set(add_fields)
+        unknown = add_fields - set(self.STATS_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown stats fields: {', '.join(sorted(unknown))}")
+        if 'average_read_time' in add_fields:
+            raise ValueError("average_read_time is an average and cannot be added")
+        # اگر یک مقاله چند بار آمده باشد، ON CONFLICT در یک دستور دو بار به یک ردیف نمی‌رسد
+        merged = {}
+        for item in stats:
+            article_id = str(item.article_id)
+            row = merged.get(article_id)
+            if row is None:
+                merged[article_id] = {field: getattr(item, field) for field in self.STATS_FIELDS}
+            else:
+                for field in self.STATS_FIELDS:
+                    row[field] = row[field] + getattr(item, field) if field in add_fields else getattr(item, field)
+        if not merged:
+            return 0
+
+        today = timezone.localdate()
+        totals = {
+            str(row['article_id']): row
+            for row in DjangoArticleDailyStats.objects.filter(article_id__in=merged).values('article_id').annotate(
+                views=Sum('view_count'),
+                shares=Sum('share_count'),
+                read_time=Sum('read_time_total'),
+                reads=Sum('read_count'),
+                today_views=Sum('view_count', filter=Q(date=today)),
+                today_shares=Sum('share_count', filter=Q(date=today))
+            ).order_by()
+        }
+
+        deltas = []
+        for article_id, row in merged.items():
+            current = totals.get(article_id, {})
+            delta = {'article': article_id, 'date': today, 'read_time_total': 0, 'read_count': 0}
+            for field, total in self.COUNT_FIELDS.items():
+                value = row[field] if field in add_fields else row[field] - (current.get(total) or 0)
+                # روزهای گذشته تغییر نمی‌کنند؛ مجموع فقط تا سهم امروز قابل کاهش است
+                if (current.get(f'today_{total}') or 0) + value < 0:
+                    raise ValueError(f"{field} of article {article_id} is below its recorded daily stats")
+                delta[field] = value
+            read_time, reads = current.get('read_time') or 0, current.get('reads') or 0
+            if reads:
+                delta['read_time_total'] = row['average_read_time'] * reads - read_time
+            elif row['average_read_time']:
+                delta['read_time_total'], delta['read_count'] = row['average_read_time'], 1
+            deltas.append(delta)
+
+        with transaction.atomic():
+            bulk_upsert(
+                DjangoArticleDailyStats,
+                deltas,
+                unique_fields=('article', 'date'),
+                add_fields=self.DELTA_FIELDS
+            )
+            refresh_article_stats(merged, today)
+        return len(merged)
+
     def get_by_article(self, article_id: str) -> ArticleStats:
         try:
-            django_stats = ArticleStats.objects.get(article_id=article_id)
+            django_stats = DjangoArticleStats.objects.get(article_id=article_id)
             return ArticleStats(
                 article_id=django_stats.article_id,
                 view_count=django_stats.view_count,
                 share_count=django_stats.share_count,
                 average_read_time=django_stats.average_read_time
             )
-        except ArticleStats.DoesNotExist:
-            return ArticleStats(article_id=article_id)
\ No newline at end of file
+        except DjangoArticleStats.DoesNotExist:
+            return ArticleStats(article_id=article_id)
@@ -16,8 +16,11 @@ class DjangoArticle(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     published_at = models.DateTimeField(null=True, blank=True)
     view_count = models.PositiveIntegerField(default=0)
+    content_simhash = models.BigIntegerField(null=True, blank=True)  # اثر انگشت برای تشخیص محتوای تکراری
+    search_fingerprint = models.CharField(max_length=40, null=True, blank=True)  # اثر انگشت فیلدهای ایندکس‌شده
 
     class Meta:
+        app_label = 'articles'
         db_table = 'articles'
         ordering = ['-published_at', '-created_at']
         indexes = [
@@ -32,14 +35,99 @@ class DjangoArticleTag(models.Model):
     tag_name = models.CharField(max_length=50)
 
     class Meta:
+        app_label = 'articles'
         db_table = 'article_tags'
         unique_together = ('article', 'tag_name')
 
+class DjangoCategory(models.Model):
+    """مدل دیتابیس برای دسته‌بندی‌ها (درختی)"""
+    id = models.UUIDField(primary_key=True)
+    name = models.CharField(max_length=100)
+    slug = models.SlugField(max_length=100, unique=True)
+    description = models.TextField(blank=True)
+    parent = models.ForeignKey('self', on_delete=models.CASCADE, null=True, blank=True, related_name='children')
+    is_active = models.BooleanField(default=True)
+
+    class Meta:
+        app_label = 'articles'
+        db_table = 'categories'
+        indexes = [
+            models.Index(fields=['parent']),
+        ]
+
 class DjangoArticleCategory(models.Model):
     """مدل دیتابیس برای دسته‌بندی مقالات"""
     article = models.ForeignKey(DjangoArticle, on_delete=models.CASCADE)
     category_id = models.UUIDField()
 
     class Meta:
+        app_label = 'articles'
         db_table = 'article_categories'
-        unique_together = ('article', 'category_id')
\ No newline at end of file
+        unique_together = ('article', 'category_id')
+        indexes = [
+            models.Index(fields=['category_id']),
+        ]
+
+class DjangoArticleDailyStats(models.Model):
+    """آمار روزانه هر مقاله"""
+    article = models.ForeignKey(DjangoArticle, on_delete=models.CASCADE, related_name='daily_stats')
+    date = models.DateField()
+    view_count = models.PositiveIntegerField(default=0)
+    unique_view_count = models.PositiveIntegerField(default=0)  # تخمین HyperLogLog بازدیدکنندگان یکتای روز
+    share_count = models.PositiveIntegerField(default=0)
+    read_time_total = models.FloatField(default=0)  # مجموع زمان مطالعه (ثانیه)
+    read_count = models.PositiveIntegerField(default=0)
+    scroll_depth_total = models.FloatField(default=0)  # مجموع عمق اسکرول (۰ تا ۱)
+    scroll_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        app_label = 'articles'
+        db_table = 'article_daily_stats'
+        unique_together = ('article', 'date')
+        indexes = [
+            models.Index(fields=['date']),
+        ]
+
+class DjangoArticleStats(models.Model):
+    """
+    خلاصه آمار هر مقاله (یک ردیف برای هر مقاله)
+    از روی آمار روزانه در هر flush بازسازی می‌شود تا داشبورد فقط همین ردیف را بخواند
+    """
+    article = models.OneToOneField(DjangoArticle, on_delete=models.CASCADE, related_name='stats_summary')
+    view_count = models.PositiveIntegerField(default=0)
+    unique_view_count = models.PositiveIntegerField(default=0)
+    share_count = models.PositiveIntegerField(default=0)
+    average_read_time = models.FloatField(default=0)
+    average_scroll_depth = models.FloatField(default=0)
+    views_7d = models.PositiveIntegerField(default=0)
+    views_30d = models.PositiveIntegerField(default=0)
+    views_365d = models.PositiveIntegerField(default=0)
+    daily_series = models.JSONField(default=list)  # ۳۰ روز اخیر، جدیدترین اول
+    computed_on = models.DateField(default=timezone.localdate)  # بازه‌های غلتان نسبت به این روز محاسبه شده‌اند
+    updated_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        app_label = 'articles'
+        db_table = 'article_stats'
+
+class DjangoSiteStatsSnapshot(models.Model):
+    """
+    شمارنده‌های از پیش محاسبه‌شده داشبورد مدیریت (یک ردیف)
+    با تغییرات ثبت‌شده از رویدادها به‌روز و به صورت دوره‌ای کامل بازشماری می‌شود
+    """
+    key = models.CharField(max_length=20, unique=True, default='site')
+    total_articles = models.IntegerField(default=0)
+    published_articles = models.IntegerField(default=0)
+    total_comments = models.IntegerField(default=0)
+    approved_comments = models.IntegerField(default=0)
+    pending_comments = models.IntegerField(default=0)
+    rejected_comments = models.IntegerField(default=0)
+    spam_comments = models.IntegerField(default=0)
+    total_users = models.IntegerField(default=0)
+    total_views = models.BigIntegerField(default=0)
+    computed_at = models.DateTimeField(default=timezone.now)  # آخرین بازشماری کامل
+    updated_at = models.DateTimeField(default=timezone.now)   # آخرین اعمال تغییرات
+
+    class Meta:
+        app_label = 'articles'
+        db_table = 'site_stats_snapshot'
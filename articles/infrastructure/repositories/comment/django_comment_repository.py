@@ -3,7 +3,7 @@ from typing import List, Optional
 from domain.models.comment import Comment
 from domain.value_objects.comment_status import CommentStatus
 from application.interfaces.repositories.comment_repository import CommentRepository
-from ...repositories.comment.django_comment_repository import DjangoComment
+from .models import DjangoComment
 
 class DjangoCommentRepository(CommentRepository):
     """پیاده‌سازی ریپازیتوری کامنت با استفاده از Django ORM"""
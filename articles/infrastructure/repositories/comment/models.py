@@ -0,0 +1,26 @@
+from django.db import models
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from infrastructure.repositories.article.models import DjangoArticle
+
+User = get_user_model()
+
+class DjangoComment(models.Model):
+    """مدل دیتابیس برای نظرات مقالات"""
+    id = models.UUIDField(primary_key=True)
+    article = models.ForeignKey(DjangoArticle, on_delete=models.CASCADE, related_name='comments')
+    author = models.ForeignKey(User, on_delete=models.CASCADE)
+    parent = models.ForeignKey('self', on_delete=models.CASCADE, null=True, blank=True)
+    content = models.TextField()
+    status = models.CharField(max_length=20, default='pending')
+    created_at = models.DateTimeField(default=timezone.now)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        app_label = 'articles'
+        db_table = 'article_comments'
+        ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['article', 'status']),
+            models.Index(fields=['author']),
+        ]
@@ -0,0 +1,23 @@
+# infrastructure/repositories/search/django_index_checkpoint_repository.py
+from datetime import datetime
+from typing import Optional, Tuple
+from domain.repositories.index_checkpoint_repository import IndexCheckpointRepository
+from domain.models.search import DjangoIndexCheckpoint
+
+class DjangoIndexCheckpointRepository(IndexCheckpointRepository):
+    """Django ORM implementation of IndexCheckpointRepository"""
+
+    def get(self, name: str) -> Tuple[Optional[datetime], Optional[str]]:
+        checkpoint = DjangoIndexCheckpoint.objects.filter(name=name).first()
+        if checkpoint is None:
+            return None, None
+        return checkpoint.high_water_mark, checkpoint.last_article_id
+
+    def save(self, name: str, high_water_mark: datetime, last_article_id: Optional[str]) -> None:
+        DjangoIndexCheckpoint.objects.update_or_create(
+            name=name,
+            defaults={
+                'high_water_mark': high_water_mark,
+                'last_article_id': last_article_id
+            }
+        )
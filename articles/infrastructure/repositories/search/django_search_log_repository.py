@@ -1,24 +1,29 @@
 # infrastructure/repositories/django_search_log_repository.py
 from datetime import timedelta
+from typing import List, Optional
+from django.db import models
 from django.utils import timezone
 from domain.repositories.search_log_repository import SearchLogRepository
 from domain.entities.search_log import SearchLog
-from domain.models.search import DjangoSearchLog  # Your Django model
-from typing import List
-from django.db import models
+from domain.models.search import DjangoSearchLog, DjangoSearchQueryRollup
+from infrastructure.repositories.search.search_log_buffer import SearchLogBuffer, get_search_log_buffer
+from infrastructure.services.statistics.heavy_hitters import get_search_trend_tracker
 
 class DjangoSearchLogRepository(SearchLogRepository):
     """Django ORM implementation of SearchLogRepository"""
+
+    def __init__(self, buffer: Optional[SearchLogBuffer] = None):
+        self._buffer = buffer or get_search_log_buffer()
     
     def log_search(self, search_log: SearchLog) -> None:
-        """Save search log using Django ORM"""
-        DjangoSearchLog.objects.create(
+        """Queue search log for a batched bulk insert"""
+        self._buffer.add(DjangoSearchLog(
             query=search_log.query,
             user_id=search_log.user_id,
             timestamp=search_log.timestamp,
             metadata=search_log.metadata,
             results_count=search_log.results_count
-        )
+        ))
     
     def get_recent_searches(self, user_id: str, limit: int = 10) -> List[SearchLog]:
         """Get user's recent searches"""
@@ -35,12 +40,17 @@ class DjangoSearchLogRepository(SearchLogRepository):
         ]
     
     def get_popular_searches(self, limit: int = 10) -> List[str]:
-        """Get popular searches from last 7 days"""
-        since = timezone.now() - timedelta(days=7)
-        popular = DjangoSearchLog.objects.filter(
-            timestamp__gte=since
-        ).values('query').annotate(
-            count=models.Count('query')
+        """Get popular searches from last 7 days (read from daily rollups)"""
+        since = (timezone.now() - timedelta(days=7)).replace(hour=0, minute=0, second=0, microsecond=0)
+        popular = DjangoSearchQueryRollup.objects.filter(
+            granularity=DjangoSearchQueryRollup.DAY,
+            bucket_start__gte=since
+        ).values('normalized_query').annotate(
+            count=models.Sum('search_count')
         ).order_by('-count')[:limit]
         
-        return [item['query'] for item in popular]
\ No newline at end of file
+        return [item['normalized_query'] for item in popular]
+
+    def get_trending_searches(self, limit: int = 10) -> List[str]:
+        """Approximate top searches of the last hour from the in-process sketch"""
+        return [query for query, _ in get_search_trend_tracker().top(limit)]
\ No newline at end of file
@@ -0,0 +1,184 @@
+# infrastructure/repositories/search/search_log_buffer.py
+import atexit
+import logging
+import os
+import queue
+import random
+import threading
+from collections import deque
+from typing import Callable, Deque, List, Optional, Tuple
+from django.conf import settings
+from django.db import close_old_connections
+from domain.models.search import DjangoSearchLog
+
+logger = logging.getLogger(__name__)
+
+class SearchLogBuffer:
+    """
+    In-process buffer for search log rows.
+
+    Rows are queued without touching the database and written with a single
+    bulk_create when the batch size or flush interval is reached, and once
+    more when the worker exits. The queue is bounded: when it is full new rows
+    are dropped and counted instead of blocking the search request. A batch
+    whose write fails is kept for a limited number of retries on later
+    flushes; batches beyond the retry limits are dropped and counted.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 5.0,
+        sample_rate: float = 1.0,
+        max_retries: int = 3,
+        max_retry_rows: int = 5000
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.sample_rate = sample_rate
+        self.max_retries = max_retries
+        self.max_retry_rows = max_retry_rows
+        self.dropped_count = 0
+        self.sampled_out_count = 0
+        # counters are updated from request threads and the flush thread
+        self._count_lock = threading.Lock()
+        # (batch, failed attempts); only touched while holding _flush_lock
+        self._retry: Deque[Tuple[List[DjangoSearchLog], int]] = deque()
+        self._queue: "queue.Queue[DjangoSearchLog]" = queue.Queue(maxsize=max_queue_size)
+        self._flush_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._flush_listeners: List[Callable[[List[DjangoSearchLog]], None]] = []
+
+    def add(self, entry: DjangoSearchLog) -> bool:
+        """Queue a row; returns False when it was sampled out or dropped"""
+        if self.sample_rate < 1.0:
+            if random.random() >= self.sample_rate:
+                with self._count_lock:
+                    self.sampled_out_count += 1
+                return False
+            # weight lets aggregations scale sampled counts back up
+            entry.metadata = {**(entry.metadata or {}), 'sample_weight': 1 / self.sample_rate}
+
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self._count_dropped(1)
+            return False
+
+        if self._queue.qsize() >= self.batch_size:
+            self._wakeup.set()
+        return True
+
+    def add_flush_listener(self, listener: Callable[[List[DjangoSearchLog]], None]) -> None:
+        """Register a callable that receives every batch after it is written"""
+        self._flush_listeners.append(listener)
+
+    def flush(self) -> int:
+        """Write every queued row to the database; returns the number written"""
+        written = 0
+        with self._flush_lock:
+            while True:
+                # batches that failed earlier go first so rows keep roughly their order
+                if self._retry:
+                    batch, attempts = self._retry.popleft()
+                else:
+                    batch, attempts = self._drain(self.batch_size), 0
+                if not batch:
+                    break
+                try:
+                    close_old_connections()
+                    DjangoSearchLog.objects.bulk_create(batch)
+                    written += len(batch)
+                except Exception:
+                    logger.exception("Failed to flush %d search log rows", len(batch))
+                    self._keep_for_retry(batch, attempts + 1)
+                    # the database is probably unavailable; the rest waits for the next flush
+                    break
+                for listener in self._flush_listeners:
+                    try:
+                        listener(batch)
+                    except Exception:
+                        logger.exception("Search log flush listener %r failed", listener)
+        return written
+
+    def shutdown(self) -> None:
+        """Stop the background thread and flush what is left"""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread and self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.flush_interval)
+        self.flush()
+
+    def _keep_for_retry(self, batch: List[DjangoSearchLog], attempts: int) -> None:
+        retry_rows = sum(len(pending) for pending, _ in self._retry)
+        if attempts > self.max_retries or retry_rows + len(batch) > self.max_retry_rows:
+            logger.error("Dropping %d search log rows after %d failed flushes", len(batch), attempts)
+            self._count_dropped(len(batch))
+            return
+        self._retry.append((batch, attempts))
+
+    def _count_dropped(self, count: int) -> None:
+        with self._count_lock:
+            self.dropped_count += count
+
+    def _drain(self, limit: int) -> List[DjangoSearchLog]:
+        batch = []
+        while len(batch) < limit:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _ensure_worker(self) -> None:
+        # a thread started before a fork (e.g. gunicorn --preload) does not exist in the child
+        if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+                return
+            self._pid = os.getpid()
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run,
+                name="search-log-buffer",
+                daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._wakeup.wait(timeout=self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+
+_buffer: Optional[SearchLogBuffer] = None
+_buffer_lock = threading.Lock()
+
+
+def get_search_log_buffer() -> SearchLogBuffer:
+    """Process-wide search log buffer configured from SEARCH_LOG_BUFFER"""
+    global _buffer
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                config = getattr(settings, 'SEARCH_LOG_BUFFER', {})
+                _buffer = SearchLogBuffer(
+                    max_queue_size=config.get('MAX_QUEUE_SIZE', 10000),
+                    batch_size=config.get('BATCH_SIZE', 500),
+                    flush_interval=config.get('FLUSH_INTERVAL', 5.0),
+                    sample_rate=config.get('SAMPLE_RATE', 1.0),
+                    max_retries=config.get('MAX_RETRIES', 3),
+                    max_retry_rows=config.get('MAX_RETRY_ROWS', 5000)
+                )
+                from infrastructure.repositories.search.search_rollup import rollup_search_logs
+                _buffer.add_flush_listener(rollup_search_logs)
+                atexit.register(_buffer.shutdown)
+    return _buffer
@@ -0,0 +1,59 @@
+# infrastructure/repositories/search/search_rollup.py
+import random
+from collections import defaultdict
+from typing import List
+from domain.models.search import DjangoSearchLog, DjangoSearchQueryRollup
+from domain.services.persian_normalizer import normalize_text
+from infrastructure.repositories.bulk_upsert import bulk_upsert
+from infrastructure.services.statistics.heavy_hitters import get_search_trend_tracker
+
+
+def rollup_search_logs(batch: List[DjangoSearchLog]) -> None:
+    """
+    Fold a flushed batch of search logs into the hourly and daily rollup
+    tables (one additive upsert) and the in-process heavy-hitter tracker.
+    """
+    totals = defaultdict(lambda: {'search_count': 0.0, 'zero_result_count': 0.0, 'total_results': 0.0})
+    tracker = get_search_trend_tracker()
+
+    for log in batch:
+        query = normalize_text(log.query)[:255]
+        if not query:
+            continue
+        # sampled rows stand for 1 / sample_rate searches; weights stay fractional
+        # until the bucket totals are written so that rounding does not bias the counts
+        weight = float((log.metadata or {}).get('sample_weight', 1))
+        tracker.add(query, stochastic_round(weight))
+
+        hour = log.timestamp.replace(minute=0, second=0, microsecond=0)
+        day = hour.replace(hour=0)
+        for granularity, bucket_start in (
+            (DjangoSearchQueryRollup.HOUR, hour),
+            (DjangoSearchQueryRollup.DAY, day),
+        ):
+            row = totals[(granularity, bucket_start, query)]
+            row['search_count'] += weight
+            row['total_results'] += log.results_count * weight
+            if not log.results_count:
+                row['zero_result_count'] += weight
+
+    bulk_upsert(
+        DjangoSearchQueryRollup,
+        [
+            {
+                'granularity': granularity,
+                'bucket_start': bucket_start,
+                'normalized_query': query,
+                **{field: stochastic_round(value) for field, value in counts.items()}
+            }
+            for (granularity, bucket_start, query), counts in totals.items()
+        ],
+        unique_fields=('granularity', 'bucket_start', 'normalized_query'),
+        add_fields=('search_count', 'zero_result_count', 'total_results')
+    )
+
+
+def stochastic_round(value: float) -> int:
+    """Round up with probability equal to the fractional part, so the expected value is unchanged"""
+    whole = int(value)
+    return whole + (random.random() < value - whole)
@@ -0,0 +1,103 @@
+import operator
+import threading
+from functools import reduce
+from typing import Iterable, List, Optional
+from django.conf import settings
+from django.db.models import F, Q
+from domain.models.article import Article
+from domain.services.simhash import SimHashIndex, fingerprint_bands, hamming_distance, simhash
+from domain.value_objects.article_status import ArticleStatus
+from application.interfaces.services.duplicate_detection_service import (
+    DuplicateDetectionService,
+    DuplicateMatch
+)
+from infrastructure.repositories.article.models import DjangoArticle
+
+class SimHashDuplicateDetector(DuplicateDetectionService):
+    """
+    تشخیص مقالات تقریبا تکراری با اثر انگشت SimHash ذخیره‌شده در ستون content_simhash
+
+    جستجو مستقیما روی دیتابیس انجام می‌شود تا انتشارهای پروسه‌های دیگر و بایگانی یا
+    حذف مقالات بلافاصله دیده شوند: فقط ردیف‌هایی برگردانده می‌شوند که دست‌کم در یکی از
+    باندهای اثر انگشت (fingerprint_bands) با مقاله یکسان‌اند و فاصله همینگ دقیق فقط
+    برای همین نامزدها محاسبه می‌شود؛ ستون content و محتوای مقالات خوانده نمی‌شود.
+    """
+
+    def __init__(self, max_distance: Optional[int] = None):
+        self.max_distance = (
+            max_distance if max_distance is not None
+            else settings.ARTICLE_ERROR_CONFIG.get('DUPLICATE_MAX_DISTANCE', 3)
+        )
+        self._bands = fingerprint_bands(self.max_distance)
+
+    def find_similar(self, article: Article) -> List[DuplicateMatch]:
+        fingerprint = simhash(article.content)
+        # شیفت حسابی مقدار علامت‌دار همان بیت‌های باند را می‌دهد چون ماسک از بیت ۶۴ جلوتر نمی‌رود
+        annotations, band_filters = {}, []
+        for index, (offset, width) in enumerate(self._bands):
+            name = f'simhash_band_{index}'
+            mask = (1 << width) - 1
+            annotations[name] = F('content_simhash').bitrightshift(offset).bitand(mask)
+            band_filters.append(Q(**{name: fingerprint >> offset & mask}))
+
+        candidates = DjangoArticle.objects.filter(
+            status=ArticleStatus.PUBLISHED.value,
+            content_simhash__isnull=False
+        ).exclude(id=article.id).annotate(**annotations).filter(
+            reduce(operator.or_, band_filters)
+        ).values_list('id', 'content_simhash')
+
+        matches = [
+            DuplicateMatch(
+                article_id=article.id,
+                similar_article_id=str(similar_id),
+                distance=hamming_distance(fingerprint, to_unsigned(stored))
+            )
+            for similar_id, stored in candidates
+        ]
+        return sorted(
+            [match for match in matches if match.distance <= self.max_distance],
+            key=lambda match: match.distance
+        )
+
+    def add_article(self, article: Article) -> None:
+        # ریپازیتوری هنگام ذخیره هم همین مقدار را می‌نویسد
+        DjangoArticle.objects.filter(id=article.id).update(
+            content_simhash=to_signed(simhash(article.content))
+        )
+
+    def remove_article(self, article_id: str) -> None:
+        # مقالات غیرمنتشرشده در جستجو دیده نمی‌شوند؛ این فقط حذف صریح از مقایسه است
+        DjangoArticle.objects.filter(id=article_id).update(content_simhash=None)
+
+    def audit(self, articles: Iterable[Article]) -> List[DuplicateMatch]:
+        index = SimHashIndex(self.max_distance)
+        for article in articles:
+            index.add(str(article.id), simhash(article.content))
+        return [
+            DuplicateMatch(article_id=first, similar_article_id=second, distance=distance)
+            for first, second, distance in index.pairs()
+        ]
+
+
+def to_signed(fingerprint: int) -> int:
+    """اثر انگشت ۶۴ بیتی بدون علامت به مقدار قابل ذخیره در BigIntegerField"""
+    return fingerprint - (1 << 64) if fingerprint >= 1 << 63 else fingerprint
+
+
+def to_unsigned(value: int) -> int:
+    return value + (1 << 64) if value < 0 else value
+
+
+_detector: Optional[SimHashDuplicateDetector] = None
+_detector_lock = threading.Lock()
+
+
+def get_duplicate_detector() -> SimHashDuplicateDetector:
+    """تشخیص‌دهنده مشترک در سطح پروسه (وضعیتی جز تنظیمات ندارد)"""
+    global _detector
+    if _detector is None:
+        with _detector_lock:
+            if _detector is None:
+                _detector = SimHashDuplicateDetector()
+    return _detector
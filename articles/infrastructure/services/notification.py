@@ -2,27 +2,53 @@
 import logging
 from domain.entities.notification import Notification
 from core.domain.entities.user import User
-from infrastructure.external_services.email_provider import EmailProvider
+from core.domain.value_objects.email import UserId
+from infrastructure.external_services.email_provider import BaseEmailProvider, EmailMessage
 
 logger = logging.getLogger(__name__)
 
 class EmailNotificationService:
     """Email notification service implementation"""
     
-    def __init__(self, email_provider: EmailProvider):
+    def __init__(self, email_provider: BaseEmailProvider, user_repository=None):
         self.email_provider = email_provider
+        self._user_repository = user_repository
         logger.info("Initialized EmailNotificationService")
 
+    @property
+    def user_repository(self):
+        if self._user_repository is None:
+            from core.infrastructure.repositories.user.django_user_repository import DjangoUserRepository
+            self._user_repository = DjangoUserRepository()
+        return self._user_repository
+
     def send(self, user: User, notification: Notification) -> bool:
         """Send email notification to user"""
         try:
             logger.debug(f"Sending notification to {user.email}")
-            return self.email_provider.send(
-                to=user.email,
+            return self.email_provider.send_email(EmailMessage(
+                to=str(user.email),
                 subject=notification.title,
                 body=notification.content,
                 metadata=notification.metadata
-            )
+            ))
         except Exception as e:
             logger.error(f"Notification failed: {str(e)}")
-            return False
\ No newline at end of file
+            return False
+
+    def send_saved_search_notification(self, user_id: str, article, saved_searches: list) -> bool:
+        """Send one email per user for all saved searches matching a newly indexed article"""
+        if not saved_searches:
+            return False
+        try:
+            user = self.user_repository.get(UserId(str(user_id)))
+        except Exception as e:
+            logger.error(f"Saved search notification skipped, user {user_id} not found: {str(e)}")
+            return False
+        if not user.is_active:
+            return False
+        return self.send(user, Notification.for_saved_search(article, saved_searches))
+
+    @property
+    def service_name(self) -> str:
+        return "EmailNotificationService"
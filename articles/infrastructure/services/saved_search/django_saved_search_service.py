@@ -0,0 +1,66 @@
+import threading
+from abc import abstractmethod
+from typing import List, Optional
+from django.conf import settings
+from application.interfaces.services.saved_search_service import SavedSearchService, SavedSearch
+from domain.models.search import DjangoSavedSearch
+
+class DjangoSavedSearchService(SavedSearchService):
+    """
+    پایه سرویس‌های جستجوی ذخیره‌شده
+    دیتابیس منبع اصلی است و زیرکلاس‌ها ساختار تطبیق (percolator یا تطبیق درون حافظه) را نگه می‌دارند
+    """
+
+    def subscribe(self, user_id: str, query: str, tags: List[str] = None) -> SavedSearch:
+        if not query.strip() and not tags:
+            raise ValueError("جستجوی ذخیره‌شده باید حداقل یک کلمه یا تگ داشته باشد")
+        row = DjangoSavedSearch.objects.create(
+            user_id=str(user_id),
+            query=query.strip(),
+            tags=list(tags or [])
+        )
+        saved_search = self._to_saved_search(row)
+        self._register(saved_search)
+        return saved_search
+
+    def unsubscribe(self, saved_search_id: str) -> bool:
+        deleted, _ = DjangoSavedSearch.objects.filter(id=saved_search_id).delete()
+        self._unregister(str(saved_search_id))
+        return deleted > 0
+
+    def _get_many(self, saved_search_ids: List[str]) -> List[SavedSearch]:
+        rows = DjangoSavedSearch.objects.filter(id__in=saved_search_ids)
+        return [self._to_saved_search(row) for row in rows]
+
+    def _to_saved_search(self, row: DjangoSavedSearch) -> SavedSearch:
+        return SavedSearch(id=str(row.id), user_id=row.user_id, query=row.query, tags=list(row.tags))
+
+    @abstractmethod
+    def _register(self, saved_search: SavedSearch) -> None:
+        pass
+
+    @abstractmethod
+    def _unregister(self, saved_search_id: str) -> None:
+        pass
+
+
+_service: Optional[DjangoSavedSearchService] = None
+_service_lock = threading.Lock()
+
+
+def get_saved_search_service() -> DjangoSavedSearchService:
+    """
+    سرویس مشترک در سطح پروسه بر اساس SEARCH_CONFIG['BACKEND']:
+    percolator در Elasticsearch یا تطبیق معکوس درون حافظه برای جستجوی دیتابیس
+    """
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                if settings.SEARCH_CONFIG.get('BACKEND') == 'database':
+                    from infrastructure.services.saved_search.in_memory_saved_search_service import InMemorySavedSearchService
+                    _service = InMemorySavedSearchService()
+                else:
+                    from infrastructure.services.saved_search.percolator_saved_search_service import PercolatorSavedSearchService
+                    _service = PercolatorSavedSearchService()
+    return _service
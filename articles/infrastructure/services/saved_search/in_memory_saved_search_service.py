@@ -0,0 +1,53 @@
+import threading
+from typing import List, Optional
+from django.db.models import Count, Max
+from application.interfaces.services.saved_search_service import SavedSearch
+from domain.models.article import Article
+from domain.models.search import DjangoSavedSearch
+from domain.services.saved_search_matcher import SavedSearchMatcher
+from infrastructure.services.saved_search.django_saved_search_service import DjangoSavedSearchService
+
+class InMemorySavedSearchService(DjangoSavedSearchService):
+    """
+    تطبیق جستجوهای ذخیره‌شده با ایندکس معکوس درون حافظه (برای اجرا بدون Elasticsearch)
+    ایندکس از دیتابیس ساخته می‌شود و اگر پروسه دیگری جستجویی افزوده یا حذف کرده باشد،
+    پیش از تطبیق دوباره ساخته می‌شود
+    """
+
+    def __init__(self):
+        self._matcher = SavedSearchMatcher()
+        self._version = None
+        self._lock = threading.Lock()
+
+    def match_article(self, article: Article) -> List[SavedSearch]:
+        self._ensure_current()
+        matched_ids = self._matcher.match(article.title, article.content, article.tags)
+        return self._get_many(matched_ids) if matched_ids else []
+
+    def _register(self, saved_search: SavedSearch) -> None:
+        with self._lock:
+            self._add(saved_search.id, saved_search.query, saved_search.tags)
+
+    def _unregister(self, saved_search_id: str) -> None:
+        with self._lock:
+            self._matcher.remove(saved_search_id)
+
+    def _ensure_current(self) -> None:
+        # یک کوئری تجمیعی ارزان؛ انتشار مقاله رویداد پرتکراری نیست
+        version = DjangoSavedSearch.objects.aggregate(count=Count('id'), latest=Max('created_at'))
+        version = (version['count'], version['latest'])
+        if version == self._version:
+            return
+        with self._lock:
+            matcher = SavedSearchMatcher()
+            for saved_search_id, query, tags in DjangoSavedSearch.objects.values_list('id', 'query', 'tags').iterator():
+                self._add(str(saved_search_id), query, tags, matcher)
+            self._matcher = matcher
+            self._version = version
+
+    def _add(self, saved_search_id: str, query: str, tags: List[str], matcher: Optional[SavedSearchMatcher] = None) -> None:
+        try:
+            (matcher or self._matcher).add(saved_search_id, query, tags)
+        except ValueError:
+            # جستجوی بدون کلمه و تگ با هیچ مقاله‌ای تطبیق ندارد
+            pass
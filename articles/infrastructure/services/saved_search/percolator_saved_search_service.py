@@ -0,0 +1,96 @@
+from typing import List, Optional
+from elasticsearch import Elasticsearch
+from application.interfaces.services.saved_search_service import SavedSearch
+from domain.models.article import Article
+from infrastructure.services.search.client import get_elasticsearch_client
+from infrastructure.services.saved_search.django_saved_search_service import DjangoSavedSearchService
+
+class PercolatorSavedSearchService(DjangoSavedSearchService):
+    """
+    جستجوهای ذخیره‌شده به صورت کوئری percolator در Elasticsearch
+    هر مقاله جدید با یک درخواست percolate در برابر همه جستجوها تطبیق داده می‌شود
+    """
+
+    INDEX_NAME = 'saved_searches'
+    PAGE_SIZE = 1000
+
+    # فیلدهای سند مقاله باید در ایندکس percolator هم تعریف شوند
+    MAPPINGS = {
+        "properties": {
+            "query": {"type": "percolator"},
+            "saved_search_id": {"type": "keyword"},
+            "user_id": {"type": "keyword"},
+            "title": {"type": "text"},
+            "content": {"type": "text"},
+            "tags": {"type": "keyword"},
+        }
+    }
+
+    def __init__(self, client: Optional[Elasticsearch] = None):
+        self.client = client or get_elasticsearch_client()
+        self._index_ready = False
+
+    def ensure_index(self) -> None:
+        if self._index_ready:
+            return
+        if not self.client.indices.exists(index=self.INDEX_NAME):
+            self.client.indices.create(index=self.INDEX_NAME, body={"mappings": self.MAPPINGS}, ignore=[400])
+        self._index_ready = True
+
+    def match_article(self, article: Article) -> List[SavedSearch]:
+        self.ensure_index()
+        body = {
+            "query": {
+                "percolate": {
+                    "field": "query",
+                    "document": {
+                        "title": article.title,
+                        "content": article.content,
+                        "tags": [str(tag) for tag in article.tags]
+                    }
+                }
+            },
+            "_source": ["saved_search_id"],
+            "size": self.PAGE_SIZE,
+            "sort": [{"saved_search_id": "asc"}]
+        }
+
+        matched_ids = []
+        while True:
+            hits = self.client.search(index=self.INDEX_NAME, body=body)['hits']['hits']
+            matched_ids.extend(hit['_source']['saved_search_id'] for hit in hits)
+            if len(hits) < self.PAGE_SIZE:
+                break
+            body["search_after"] = hits[-1]['sort']
+        return self._get_many(matched_ids) if matched_ids else []
+
+    def _register(self, saved_search: SavedSearch) -> None:
+        self.ensure_index()
+        self.client.index(
+            index=self.INDEX_NAME,
+            id=saved_search.id,
+            body={
+                "query": self._build_query(saved_search),
+                "saved_search_id": saved_search.id,
+                "user_id": saved_search.user_id
+            }
+        )
+
+    def _unregister(self, saved_search_id: str) -> None:
+        self.client.delete(index=self.INDEX_NAME, id=saved_search_id, ignore=[404])
+
+    def _build_query(self, saved_search: SavedSearch) -> dict:
+        """همه کلمات عبارت در عنوان یا محتوا، و حداقل یکی از تگ‌ها (در صورت تعیین)"""
+        query = {"bool": {}}
+        if saved_search.query:
+            query["bool"]["must"] = [{
+                "multi_match": {
+                    "query": saved_search.query,
+                    "fields": ["title", "content"],
+                    "type": "cross_fields",
+                    "operator": "and"
+                }
+            }]
+        if saved_search.tags:
+            query["bool"]["filter"] = [{"terms": {"tags": saved_search.tags}}]
+        return query
@@ -0,0 +1,56 @@
+# infrastructure/services/search/article_index_mapping.py
+
+# نگاشت صریح ایندکس مقالات؛ بدون آن Elasticsearch رشته‌ها را text تحلیل‌شده می‌سازد
+# که مرتب‌سازی، term و aggregation روی آن‌ها ممکن نیست
+ARTICLE_INDEX_MAPPINGS = {
+    "properties": {
+        "id": {"type": "keyword"},
+        "title": {"type": "text"},
+        "slug": {"type": "keyword"},
+        "content": {"type": "text"},
+        "author_id": {"type": "keyword"},
+        "status": {"type": "keyword"},
+        "tags": {"type": "keyword"},
+        "categories": {"type": "keyword"},
+        "published_at": {"type": "date"},
+        "updated_at": {"type": "date"},
+        "view_count": {"type": "integer"},
+        "comment_count": {"type": "integer"},
+        "fingerprint": {"type": "keyword", "index": False},
+    }
+}
+
+# فیلد یکتا (keyword) برای شکستن تساوی در مرتب‌سازی search_after
+CURSOR_TIEBREAKER = {"id": "asc"}
+
+# فیلد ایندکس متناظر با هر facet
+FACET_FIELDS = {
+    'tags': 'tags',
+    'categories': 'categories',
+    'author': 'author_id',
+    'status': 'status',
+    'published': 'published_at',
+}
+
+
+def build_facet_aggregations(facets, size: int = 10, date_interval: str = 'month') -> dict:
+    """
+    aggregation هر facet بر اساس نوع فیلد در نگاشت: terms روی keyword و
+    date_histogram روی date؛ facet ناشناخته یا روی فیلد دیگر نادیده گرفته می‌شود
+    """
+    properties = ARTICLE_INDEX_MAPPINGS['properties']
+    aggs = {}
+    for facet in facets:
+        field_name = FACET_FIELDS.get(facet)
+        field_type = properties.get(field_name, {}).get('type')
+        if field_type == 'keyword':
+            aggs[facet] = {"terms": {"field": field_name, "size": size}}
+        elif field_type == 'date':
+            aggs[facet] = {
+                "date_histogram": {
+                    "field": field_name,
+                    "calendar_interval": date_interval,
+                    "min_doc_count": 1
+                }
+            }
+    return aggs
@@ -0,0 +1,247 @@
+from typing import Dict, List, Optional, Union
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from elasticsearch.exceptions import TransportError
+from application.interfaces.services.search_service import SearchQuery, SuggestionQuery
+from domain.models.article import Article
+from infrastructure.services.search.client import get_async_elasticsearch_client
+from infrastructure.services.search.elasticsearch_adapter import ElasticsearchAdapter, ESSearchResult
+
+class AsyncElasticsearchAdapter(ElasticsearchAdapter):
+    """
+    نسخه ناهمگام سرویس جستجو برای اجرای ASGI
+    ساخت کوئری و تبدیل نتایج از ElasticsearchAdapter به ارث می‌رسد؛ هر متدی که
+    به کلاینت درخواست می‌فرستد اینجا به صورت coroutine بازنویسی شده است، چون
+    متدهای همگام والد روی AsyncElasticsearch فقط coroutine اجرا‌نشده برمی‌گردانند
+    """
+
+    def __init__(self, client=None, request_timeout: Optional[float] = None, article_repository=None):
+        super().__init__(
+            client=client or get_async_elasticsearch_client(),
+            request_timeout=request_timeout,
+            article_repository=article_repository
+        )
+
+    async def ensure_index(self) -> bool:
+        if self._index_ready:
+            return False
+        created = False
+        if not await self.client.indices.exists(index=self.index_name):
+            response = await self.client.indices.create(
+                index=self.index_name,
+                body={"mappings": self.MAPPINGS},
+                ignore=[400]
+            )
+            created = bool(response.get('acknowledged'))
+        self._index_ready = True
+        return created
+
+    async def search_articles(
+        self,
+        query: str,
+        page: int = 1,
+        page_size: int = 10,
+        filters: Optional[dict] = None,
+        sort_by: Optional[str] = None,
+        cursor: Optional[str] = None,
+        facets: Optional[List[str]] = None
+    ) -> ESSearchResult:
+        search_query, state = self._build_search_query(
+            query, page, page_size, filters, sort_by, cursor, facets
+        )
+
+        cache_key = self._cache_key(search_query)
+        cached = await cache.aget(cache_key)
+        if cached is not None:
+            return cached
+
+        pit_id = state['pit'] if state else None
+        if pit_id:
+            search_query["pit"] = {"id": pit_id, "keep_alive": self._pit_keep_alive()}
+            response = await self.client.search(body=search_query, request_timeout=self.request_timeout)
+        else:
+            response = await self.client.search(
+                index=self.index_name,
+                body=search_query,
+                request_timeout=self.request_timeout
+            )
+
+        result, pending_cursor = self._parse_search_response(response, state, page_size, sort_by)
+        if pending_cursor:
+            result.next_cursor = self._encode_cursor({
+                **pending_cursor, 'pit': await self._open_point_in_time()
+            })
+        await cache.aset(cache_key, result, self._cache_ttl())
+        return result
+
+    async def multi_search(
+        self,
+        queries: List[Union[SearchQuery, SuggestionQuery]]
+    ) -> List[Union[ESSearchResult, List[str]]]:
+        results: List = [None] * len(queries)
+        pending = []
+        for entry in self._build_multi_search_entries(queries):
+            position, body, state, cache_key = entry
+            cached = await cache.aget(cache_key) if cache_key else None
+            if cached is not None:
+                results[position] = cached
+            else:
+                pending.append(entry)
+
+        if not pending:
+            return results
+
+        response = await self.client.msearch(
+            body=self._multi_search_lines(pending),
+            request_timeout=self.request_timeout
+        )
+        for position, result, pending_cursor, cache_key in self._parse_multi_search(
+            queries, pending, response['responses']
+        ):
+            if pending_cursor:
+                result.next_cursor = self._encode_cursor({
+                    **pending_cursor, 'pit': await self._open_point_in_time()
+                })
+            if cache_key:
+                await cache.aset(cache_key, result, self._cache_ttl())
+            results[position] = result
+
+        return results
+
+    async def get_suggestions(self, query: str, limit: int = 5) -> List[str]:
+        response = await self.client.search(
+            index=self.index_name,
+            body=self._build_suggestion_query(query, limit),
+            request_timeout=self.request_timeout
+        )
+        return self._parse_suggestions(response)
+
+    async def _open_point_in_time(self) -> Optional[str]:
+        """باز کردن point-in-time در صورت فعال بودن در تنظیمات"""
+        if not self._use_point_in_time():
+            return None
+        response = await self.client.open_point_in_time(
+            index=self.index_name,
+            keep_alive=self._pit_keep_alive()
+        )
+        return response['id']
+
+    async def index_article(self, article: Article) -> bool:
+        await self.ensure_index()
+        await self.client.index(
+            index=self.index_name,
+            id=article.id,
+            body=self._article_to_document(article),
+            request_timeout=self.request_timeout
+        )
+        return True
+
+    async def update_indexed_article(self, article: Article) -> bool:
+        return await self.index_article(article)
+
+    async def remove_article_from_index(self, article_id: str) -> bool:
+        await self.client.delete(
+            index=self.index_name,
+            id=article_id,
+            ignore=[404],
+            request_timeout=self.request_timeout
+        )
+        return True
+
+    async def bulk_index_articles(self, articles: List[Article]) -> int:
+        if not articles:
+            return 0
+        await self.ensure_index()
+        from elasticsearch.helpers import async_bulk
+
+        success, _ = await async_bulk(
+            self.client,
+            self._index_actions(articles),
+            raise_on_error=False,
+            request_timeout=self.request_timeout
+        )
+        return success
+
+    async def bulk_remove_articles(self, article_ids: List[str]) -> int:
+        if not article_ids:
+            return 0
+        from elasticsearch.helpers import async_bulk
+
+        success, errors = await async_bulk(
+            self.client,
+            self._delete_actions(article_ids),
+            raise_on_error=False,
+            request_timeout=self.request_timeout
+        )
+        return self._count_removed(success, errors)
+
+    async def get_indexed_versions(self, article_ids: List[str]) -> Dict[str, str]:
+        if not article_ids:
+            return {}
+        response = await self.client.mget(
+            index=self.index_name,
+            body={"ids": list(article_ids)},
+            _source_includes=["fingerprint"],
+            request_timeout=self.request_timeout
+        )
+        return self._parse_indexed_versions(response)
+
+    async def get_indexed_ids(self, after_id: Optional[str] = None, limit: int = 500) -> List[str]:
+        response = await self.client.search(
+            index=self.index_name,
+            body=self._build_indexed_ids_query(after_id, limit),
+            request_timeout=self.request_timeout
+        )
+        return [hit['_id'] for hit in response['hits']['hits']]
+
+    async def get_related_articles(self, article_id: str, limit: int = 5) -> List[Article]:
+        response = await self.client.search(
+            index=self.index_name,
+            body=self._build_related_query(article_id, limit),
+            request_timeout=self.request_timeout
+        )
+        # ساخت موجودیت‌ها از ORM همگام است
+        return await sync_to_async(self._load_articles)([hit['_id'] for hit in response['hits']['hits']])
+
+    async def rebuild_index(self) -> bool:
+        """همان بازسازی ElasticsearchAdapter: ایندکس تازه، async_bulk و جابه‌جایی alias"""
+        from elasticsearch.helpers import async_bulk
+
+        new_index = self._rebuild_index_name()
+        await self.client.indices.create(index=new_index, body={"mappings": self.MAPPINGS})
+        try:
+            since, after_id = None, None
+            while True:
+                # خواندن مقالات از ORM همگام است
+                articles = await sync_to_async(self.article_repository.get_updated_since)(
+                    since, after_id, limit=self.REBUILD_BATCH_SIZE
+                )
+                if not articles:
+                    break
+                _, errors = await async_bulk(
+                    self.client,
+                    self._index_actions(articles, index=new_index),
+                    raise_on_error=False,
+                    request_timeout=self.request_timeout
+                )
+                if errors:
+                    raise TransportError(500, 'bulk_index_error', errors[:5])
+                since, after_id = articles[-1].updated_at, articles[-1].id
+            await self.client.indices.refresh(index=new_index)
+            await self.client.indices.update_aliases(body={"actions": [
+                *await self._detach_current_index(),
+                {"add": {"index": new_index, "alias": self.index_name}}
+            ]})
+        except Exception:
+            await self.client.indices.delete(index=new_index, ignore=[404])
+            raise
+        self._index_ready = True
+        return True
+
+    async def _detach_current_index(self) -> List[dict]:
+        if not await self.client.indices.exists(index=self.index_name):
+            return []
+        if await self.client.indices.exists_alias(name=self.index_name):
+            current = list(await self.client.indices.get_alias(name=self.index_name))
+            return [{"remove_index": {"index": index}} for index in current]
+        return [{"remove_index": {"index": self.index_name}}]
@@ -0,0 +1,85 @@
+# infrastructure/services/search/circuit_breaker.py
+import threading
+import time
+from typing import Dict, Optional
+
+
+class CircuitBreaker:
+    """
+    قطع‌کننده مدار برای سرویس‌های خارجی
+
+    closed: درخواست‌ها عبور می‌کنند و خطاهای پشت سر هم شمرده می‌شوند
+    open: پس از failure_threshold خطا، تا reset_timeout ثانیه درخواستی عبور نمی‌کند
+    half_open: پس از آن فقط یک درخواست آزمایشی عبور می‌کند؛ موفقیت مدار را می‌بندد
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and self._reset_elapsed():
+                return self.HALF_OPEN
+            return self._state
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN:
+                if not self._reset_elapsed():
+                    return False
+                self._state = self.HALF_OPEN
+                self._trial_in_flight = False
+            # در حالت half_open فقط یک درخواست آزمایشی مجاز است
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._trial_in_flight = False
+
+    def _reset_elapsed(self) -> bool:
+        return time.monotonic() - self._opened_at >= self.reset_timeout
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(
+    name: str,
+    failure_threshold: int = 5,
+    reset_timeout: float = 30.0
+) -> CircuitBreaker:
+    """قطع‌کننده مشترک در سطح پروسه برای هر سرویس (بین درخواست‌ها مشترک است)"""
+    breaker: Optional[CircuitBreaker] = _breakers.get(name)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.setdefault(
+                name, CircuitBreaker(failure_threshold, reset_timeout)
+            )
+    return breaker
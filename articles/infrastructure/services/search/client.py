@@ -0,0 +1,56 @@
+# infrastructure/services/search/client.py
+import threading
+from typing import Optional
+from elasticsearch import Elasticsearch
+from config import settings
+
+_lock = threading.Lock()
+_client: Optional[Elasticsearch] = None
+_async_client = None
+
+
+def _client_options() -> dict:
+    """تنظیمات مشترک اتصال، زمان انتظار و تلاش مجدد برای کلاینت‌های Elasticsearch"""
+    config = settings.ELASTICSEARCH_CLIENT
+    return {
+        'hosts': [settings.ELASTICSEARCH_URL],
+        'http_auth': (settings.ELASTICSEARCH_USER, settings.ELASTICSEARCH_PASSWORD),
+        'maxsize': config.get('MAX_CONNECTIONS', 25),
+        'timeout': config.get('TIMEOUT', 5),
+        'max_retries': config.get('MAX_RETRIES', 2),
+        'retry_on_timeout': config.get('RETRY_ON_TIMEOUT', True),
+        'http_compress': config.get('HTTP_COMPRESS', True),
+    }
+
+
+def get_elasticsearch_client() -> Elasticsearch:
+    """
+    کلاینت همگام مشترک در سطح پروسه
+    یک connection pool برای تمام درخواست‌ها تا اتصال‌های keep-alive بازاستفاده شوند
+    """
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                _client = Elasticsearch(**_client_options())
+    return _client
+
+
+def get_async_elasticsearch_client():
+    """کلاینت ناهمگام مشترک برای اجرای ASGI (نیازمند aiohttp)"""
+    global _async_client
+    if _async_client is None:
+        from elasticsearch import AsyncElasticsearch
+
+        with _lock:
+            if _async_client is None:
+                _async_client = AsyncElasticsearch(**_client_options())
+    return _async_client
+
+
+async def close_async_elasticsearch_client() -> None:
+    """بستن اتصال‌های کلاینت ناهمگام هنگام خاموش شدن سرور ASGI"""
+    global _async_client
+    if _async_client is not None:
+        client, _async_client = _async_client, None
+        await client.close()
@@ -0,0 +1,171 @@
+import hashlib
+import json
+import logging
+import pickle
+import time
+import uuid
+from typing import Callable, Dict, List, Optional, Union
+from django.conf import settings
+from application.interfaces.services.search_service import (
+    SearchService, SearchResult, SearchQuery, SuggestionQuery
+)
+from domain.models.article import Article
+from infrastructure.services.search.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# آزادسازی قفل فقط توسط همان پروسه‌ای که آن را گرفته است
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+class CoalescingSearchService(SearchService):
+    """
+    ادغام جستجوهای هم‌زمان یکسان
+
+    جستجوهای هم‌زمان با عبارت و پارامترهای یکسان در هر پروسه یک درخواست
+    مشترک می‌فرستند. با CROSS_PROCESS، رهبر هر پروسه قبل از ارسال یک قفل کوتاه در
+    Redis می‌گیرد؛ پروسه‌های دیگر به جای ارسال درخواست، منتظر انتشار نتیجه رهبر می‌مانند.
+    """
+
+    KEY_PREFIX = 'search:flight:'
+
+    # مشترک بین نمونه‌ها؛ ویوها برای هر درخواست سرویس جدیدی می‌سازند
+    # (نتایج قابل تغییرند، پس هر منتظر کپی خودش را می‌گیرد)
+    _flight = SingleFlight(copy_result=True)
+
+    def __init__(self, inner: SearchService, cross_process: Optional[bool] = None):
+        config = settings.SEARCH_COALESCING
+        self.inner = inner
+        self.cross_process = config.get('CROSS_PROCESS', False) if cross_process is None else cross_process
+        self.lock_timeout = config.get('LOCK_TIMEOUT', 2.0)
+        self.result_ttl = config.get('RESULT_TTL', 2.0)
+
+    @property
+    def supports_reconciliation(self) -> bool:
+        return self.inner.supports_reconciliation
+
+    def search_articles(
+        self,
+        query: str,
+        page: int = 1,
+        page_size: int = 10,
+        filters: Optional[dict] = None,
+        sort_by: Optional[str] = None,
+        cursor: Optional[str] = None,
+        facets: Optional[List[str]] = None
+    ) -> SearchResult:
+        key = self._key(SearchQuery(query, page, page_size, filters, sort_by, cursor, facets))
+        return self._coalesce(key, lambda: self.inner.search_articles(
+            query=query, page=page, page_size=page_size, filters=filters,
+            sort_by=sort_by, cursor=cursor, facets=facets
+        ))
+
+    def multi_search(
+        self,
+        queries: List[Union[SearchQuery, SuggestionQuery]]
+    ) -> List[Union[SearchResult, List[str]]]:
+        key = self._key(*queries)
+        return self._coalesce(key, lambda: self.inner.multi_search(queries))
+
+    def get_suggestions(self, query: str, limit: int = 5) -> List[str]:
+        key = self._key(SuggestionQuery(query, limit))
+        return self._coalesce(key, lambda: self.inner.get_suggestions(query, limit))
+
+    def get_related_articles(self, article_id: str, limit: int = 5) -> List[Article]:
+        return self.inner.get_related_articles(article_id, limit)
+
+    def index_article(self, article: Article) -> bool:
+        return self.inner.index_article(article)
+
+    def update_indexed_article(self, article: Article) -> bool:
+        return self.inner.update_indexed_article(article)
+
+    def remove_article_from_index(self, article_id: str) -> bool:
+        return self.inner.remove_article_from_index(article_id)
+
+    def bulk_index_articles(self, articles: List[Article]) -> int:
+        return self.inner.bulk_index_articles(articles)
+
+    def bulk_remove_articles(self, article_ids: List[str]) -> int:
+        return self.inner.bulk_remove_articles(article_ids)
+
+    def get_indexed_versions(self, article_ids: List[str]) -> Dict[str, str]:
+        return self.inner.get_indexed_versions(article_ids)
+
+    def get_indexed_ids(self, after_id: Optional[str] = None, limit: int = 500) -> List[str]:
+        return self.inner.get_indexed_ids(after_id, limit)
+
+    def rebuild_index(self) -> bool:
+        return self.inner.rebuild_index()
+
+    def _coalesce(self, key: str, call: Callable):
+        if not self.cross_process:
+            return self._flight.do(key, call)
+        return self._flight.do(key, lambda: self._coalesce_across_processes(key, call))
+
+    def _coalesce_across_processes(self, key: str, call: Callable):
+        try:
+            from django_redis import get_redis_connection
+            redis = get_redis_connection('default')
+            token = uuid.uuid4().hex
+            acquired = redis.set(f'{key}:lock', token, nx=True, px=int(self.lock_timeout * 1000))
+        except Exception as e:
+            logger.warning(f"Search coalescing lock unavailable, searching directly: {str(e)}")
+            return call()
+
+        if acquired:
+            return self._lead(redis, key, token, call)
+        return self._follow(redis, key, call)
+
+    def _lead(self, redis, key: str, token: str, call: Callable):
+        payload = b''
+        try:
+            result = call()
+            payload = pickle.dumps(result)
+            return result
+        finally:
+            # payload خالی یعنی رهبر شکست خورده و پیروها خودشان جستجو می‌کنند
+            try:
+                pipe = redis.pipeline()
+                if payload:
+                    pipe.set(f'{key}:result', payload, px=int(self.result_ttl * 1000))
+                pipe.publish(f'{key}:done', payload)
+                pipe.eval(_RELEASE_LOCK_SCRIPT, 1, f'{key}:lock', token)
+                pipe.execute()
+            except Exception as e:
+                logger.warning(f"Failed to publish coalesced search result: {str(e)}")
+
+    def _follow(self, redis, key: str, call: Callable):
+        pubsub = redis.pubsub(ignore_subscribe_messages=True)
+        try:
+            pubsub.subscribe(f'{key}:done')
+            # نتیجه ممکن است پیش از عضویت در کانال منتشر شده باشد
+            payload = redis.get(f'{key}:result')
+            deadline = time.monotonic() + self.lock_timeout
+            while payload is None and time.monotonic() < deadline:
+                message = pubsub.get_message(timeout=max(deadline - time.monotonic(), 0.0))
+                if message is not None:
+                    payload = message['data']
+            if payload:
+                return pickle.loads(payload)
+        except Exception as e:
+            logger.warning(f"Waiting for coalesced search failed: {str(e)}")
+        finally:
+            pubsub.close()
+        # رهبر شکست خورد یا از زمان قفل کندتر بود
+        return call()
+
+    def _key(self, *items: Union[SearchQuery, SuggestionQuery]) -> str:
+        """
+        کلید بر اساس دقیقا همان پارامترهایی که به سرویس داخلی داده می‌شوند؛ نرمال‌سازی
+        عبارت فقط در کلید باعث می‌شد عبارت‌های متفاوت (مثل C++ و C#) نتیجه یکدیگر را بگیرند
+        """
+        payload = json.dumps(
+            [{**vars(item), 'kind': type(item).__name__} for item in items],
+            sort_keys=True, default=str
+        )
+        return self.KEY_PREFIX + hashlib.sha1(payload.encode('utf-8')).hexdigest()
@@ -0,0 +1,325 @@
+import uuid
+from typing import Dict, List, Optional, Tuple
+from django.conf import settings
+from django.db import connection
+from application.interfaces.services.search_service import SearchService, SearchResult, SearchHit
+from domain.models.article import Article
+from domain.value_objects.article_status import ArticleStatus
+from domain.value_objects.comment_status import CommentStatus
+from domain.services.persian_normalizer import tokenize
+from infrastructure.repositories.article.models import DjangoArticle, DjangoArticleTag, DjangoArticleCategory
+from infrastructure.repositories.comment.models import DjangoComment
+
+class DatabaseFullTextSearchService(SearchService):
+    """
+    جستجوی تمام‌متن با امکانات خود دیتابیس، بدون نیاز به Elasticsearch
+
+    SQLite: جدول مجازی FTS5 با رتبه‌بندی bm25 و قطعه‌متن snippet
+    PostgreSQL: ستون tsvector روی جدول مقالات با ایندکس GIN، ts_rank_cd و ts_headline
+
+    متن عنوان و محتوا پیش از ایندکس نرمال‌سازی می‌شود تا گونه‌های عربی/فارسی
+    حروف یکدیگر را پیدا کنند. فقط مقالات منتشرشده ایندکس می‌شوند.
+    جدول FTS5 و ستون tsvector با مایگریشن 0002_article_search_index ساخته می‌شوند.
+    """
+
+    FTS_TABLE = 'articles_fts'
+    PG_VECTOR_COLUMN = 'search_vector'
+    PG_INDEX_NAME = 'articles_search_vector_gin'
+
+    # فیلترها و مرتب‌سازی‌های هم‌نام با ElasticsearchAdapter؛ مقدار ناشناخته خطای درخواست است
+    FILTER_KEYS = frozenset({'status', 'author_id', 'tags', 'categories', 'published_from', 'published_to'})
+    SORT_OPTIONS = ('newest', 'oldest', 'popular', 'most_commented')
+
+    def search_articles(
+        self,
+        query: str,
+        page: int = 1,
+        page_size: int = 10,
+        filters: Optional[dict] = None,
+        sort_by: Optional[str] = None,
+        cursor: Optional[str] = None,
+        facets: Optional[List[str]] = None
+    ) -> SearchResult:
+        unknown_filters = set(filters or {}) - self.FILTER_KEYS
+        if unknown_filters:
+            raise ValueError(f"فیلترهای پشتیبانی‌نشده: {', '.join(sorted(unknown_filters))}")
+        if sort_by and sort_by not in self.SORT_OPTIONS:
+            raise ValueError(f"مرتب‌سازی پشتیبانی‌نشده: {sort_by}")
+
+        tokens = tokenize(query)
+        if not tokens:
+            return SearchResult(hits=[], total_results=0, page=page, page_size=page_size)
+
+        filter_sql, filter_params = self._build_filters(filters or {})
+        offset = (page - 1) * page_size
+        if connection.vendor == 'postgresql':
+            rows, total = self._search_postgresql(tokens, filter_sql, filter_params, sort_by, page_size, offset)
+        else:
+            rows, total = self._search_sqlite(tokens, filter_sql, filter_params, sort_by, page_size, offset)
+
+        return SearchResult(
+            hits=[self._to_search_hit(row) for row in rows],
+            total_results=total,
+            page=page,
+            page_size=page_size
+        )
+
+    def _search_sqlite(self, tokens, filter_sql, filter_params, sort_by, limit, offset):
+        open_tag, close_tag = self._highlight_tags()
+        # هر کلمه داخل گیومه قرار می‌گیرد تا عملگرهای FTS5 در متن کاربر اجرا نشوند
+        match = ' '.join('"%s"' % token.replace('"', '""') for token in tokens)
+        source = f"""
+            FROM {self.FTS_TABLE}
+            JOIN {DjangoArticle._meta.db_table} a ON a.id = {self.FTS_TABLE}.article_id
+            WHERE {self.FTS_TABLE} MATCH %s {filter_sql}
+        """
+        params = [match, *filter_params]
+        # bm25 مقدار کمتر را بهتر می‌داند؛ وزن عنوان ده برابر محتوا است
+        order = self._order_by(sort_by, 'bm25(%s, 0.0, 10.0, 1.0)' % self.FTS_TABLE)
+
+        with connection.cursor() as db_cursor:
+            db_cursor.execute(
+                f"""
+                SELECT a.id, a.title, a.slug, a.author_id, a.status, a.published_at,
+                       a.updated_at, a.view_count, -bm25({self.FTS_TABLE}, 0.0, 10.0, 1.0),
+                       snippet({self.FTS_TABLE}, 2, %s, %s, '…', 24)
+                {source}
+                ORDER BY {order}
+                LIMIT %s OFFSET %s
+                """,
+                [open_tag, close_tag, *params, limit, offset]
+            )
+            rows = db_cursor.fetchall()
+            db_cursor.execute(f"SELECT COUNT(*) {source}", params)
+            total = db_cursor.fetchone()[0]
+        return rows, total
+
+    def _search_postgresql(self, tokens, filter_sql, filter_params, sort_by, limit, offset):
+        source = f"""
+            FROM {DjangoArticle._meta.db_table} a, plainto_tsquery('simple', %s) q
+            WHERE a.{self.PG_VECTOR_COLUMN} @@ q {filter_sql}
+        """
+        params = [' '.join(tokens), *filter_params]
+
+        with connection.cursor() as db_cursor:
+            db_cursor.execute(
+                f"""
+                SELECT a.id, a.title, a.slug, a.author_id, a.status, a.published_at,
+                       a.updated_at, a.view_count, ts_rank_cd(a.{self.PG_VECTOR_COLUMN}, q) AS rank,
+                       a.content
+                {source}
+                ORDER BY {self._order_by(sort_by, 'rank DESC')}
+                LIMIT %s OFFSET %s
+                """,
+                [*params, limit, offset]
+            )
+            rows = db_cursor.fetchall()
+            headlines = self._headlines_postgresql(db_cursor, tokens, [row[-1] for row in rows])
+            db_cursor.execute(f"SELECT COUNT(*) {source}", params)
+            total = db_cursor.fetchone()[0]
+        return [(*row[:-1], headline) for row, headline in zip(rows, headlines)], total
+
+    def _headlines_postgresql(self, db_cursor, tokens, contents) -> List[str]:
+        """
+        ts_headline روی متن نرمال‌شده همان صفحه اجرا می‌شود؛ tsvector از متن نرمال‌شده ساخته
+        شده است و روی متن خام گونه‌های عربی/فارسی حروف هایلایت نمی‌شوند
+        """
+        if not contents:
+            return []
+        open_tag, close_tag = self._highlight_tags()
+        headline_options = (
+            f'StartSel="{open_tag}", StopSel="{close_tag}", '
+            'MaxFragments=2, MaxWords=25, MinWords=10'
+        )
+        db_cursor.execute(
+            "SELECT ts_headline('simple', doc, plainto_tsquery('simple', %s), %s) "
+            "FROM unnest(%s::text[]) WITH ORDINALITY AS docs(doc, position) ORDER BY position",
+            [' '.join(tokens), headline_options, [' '.join(tokenize(content)) for content in contents]]
+        )
+        return [row[0] for row in db_cursor.fetchall()]
+
+    def _order_by(self, sort_by: Optional[str], relevance: str) -> str:
+        if sort_by == 'newest':
+            return 'a.published_at DESC, a.id'
+        if sort_by == 'oldest':
+            return 'a.published_at ASC, a.id'
+        if sort_by == 'popular':
+            return 'a.view_count DESC, a.id'
+        if sort_by == 'most_commented':
+            return (
+                f"(SELECT COUNT(*) FROM {DjangoComment._meta.db_table} c WHERE c.article_id = a.id "
+                f"AND c.status = '{CommentStatus.APPROVED.value}') DESC, a.id"
+            )
+        return f'{relevance}, a.id'
+
+    def _build_filters(self, filters: dict) -> Tuple[str, list]:
+        # فقط مقالات منتشرشده ایندکس می‌شوند؛ وضعیت دیگر نتیجه خالی دارد (مانند Elasticsearch)
+        clauses = ['a.status = %s']
+        params = [filters.get('status') or ArticleStatus.PUBLISHED.value]
+        if filters.get('author_id'):
+            clauses.append('a.author_id = %s')
+            params.append(filters['author_id'])
+        if filters.get('published_from'):
+            clauses.append('a.published_at >= %s')
+            params.append(filters['published_from'])
+        if filters.get('published_to'):
+            clauses.append('a.published_at <= %s')
+            params.append(filters['published_to'])
+        if filters.get('tags'):
+            clauses.append(
+                f"EXISTS (SELECT 1 FROM {DjangoArticleTag._meta.db_table} t "
+                f"WHERE t.article_id = a.id AND t.tag_name IN ({', '.join(['%s'] * len(filters['tags']))}))"
+            )
+            params.extend(filters['tags'])
+        if filters.get('categories'):
+            category_field = DjangoArticleCategory._meta.get_field('category_id')
+            clauses.append(
+                f"EXISTS (SELECT 1 FROM {DjangoArticleCategory._meta.db_table} c "
+                f"WHERE c.article_id = a.id AND c.category_id IN ({', '.join(['%s'] * len(filters['categories']))}))"
+            )
+            params.extend(category_field.get_db_prep_value(value, connection) for value in filters['categories'])
+        return ''.join(f' AND {clause}' for clause in clauses), params
+
+    def _to_search_hit(self, row) -> SearchHit:
+        article_id, title, slug, author_id, status, published_at, updated_at, view_count, score, snippet = row
+        return SearchHit(
+            id=str(uuid.UUID(str(article_id))),
+            title=title,
+            slug=slug,
+            author_id=str(author_id),
+            status=status,
+            published_at=self._isoformat(published_at),
+            updated_at=self._isoformat(updated_at),
+            view_count=view_count,
+            score=float(score) if score is not None else None,
+            highlights=[snippet] if snippet else []
+        )
+
+    def _isoformat(self, value) -> Optional[str]:
+        # SQLite تاریخ را به صورت رشته برمی‌گرداند
+        if value is None or isinstance(value, str):
+            return value
+        return value.isoformat()
+
+    def _highlight_tags(self) -> Tuple[str, str]:
+        open_tag = settings.SEARCH_CONFIG.get('HIGHLIGHT_TAG', '<mark>')
+        return open_tag, '</' + open_tag[1:]
+
+    def sync_document(self, article_id, title: str, content: str, status: str) -> None:
+        """
+        همگام‌سازی سند جستجوی یک مقاله با آخرین نسخه آن
+        مقالات منتشرنشده از ایندکس حذف می‌شوند
+        """
+        published = status == ArticleStatus.PUBLISHED.value
+        document = (' '.join(tokenize(title)), ' '.join(tokenize(content))) if published else None
+        db_id = self._db_id(article_id)
+
+        with connection.cursor() as db_cursor:
+            if connection.vendor == 'postgresql':
+                if document:
+                    db_cursor.execute(
+                        f"UPDATE {DjangoArticle._meta.db_table} SET {self.PG_VECTOR_COLUMN} = "
+                        "setweight(to_tsvector('simple', %s), 'A') || "
+                        "setweight(to_tsvector('simple', %s), 'B') WHERE id = %s",
+                        [*document, db_id]
+                    )
+                else:
+                    db_cursor.execute(
+                        f"UPDATE {DjangoArticle._meta.db_table} SET {self.PG_VECTOR_COLUMN} = NULL WHERE id = %s",
+                        [db_id]
+                    )
+                return
+
+            # rowid از شناسه مقاله گرفته می‌شود تا حذف و جایگزینی با کلید اصلی FTS5 انجام شود
+            rowid = self._fts_rowid(article_id)
+            db_cursor.execute(f"DELETE FROM {self.FTS_TABLE} WHERE rowid = %s", [rowid])
+            if document:
+                db_cursor.execute(
+                    f"INSERT INTO {self.FTS_TABLE} (rowid, article_id, title, content) VALUES (%s, %s, %s, %s)",
+                    [rowid, db_id, *document]
+                )
+
+    def _fts_rowid(self, article_id) -> int:
+        return uuid.UUID(str(article_id)).int & ((1 << 63) - 1)
+
+    def _db_id(self, article_id):
+        return DjangoArticle._meta.pk.get_db_prep_value(article_id, connection)
+
+    def index_article(self, article: Article) -> bool:
+        self.sync_document(article.id, article.title, article.content, article.status.value)
+        return True
+
+    def update_indexed_article(self, article: Article) -> bool:
+        return self.index_article(article)
+
+    def remove_article_from_index(self, article_id: str) -> bool:
+        self.sync_document(article_id, '', '', ArticleStatus.DELETED.value)
+        return True
+
+    def rebuild_index(self) -> bool:
+        """بازسازی کامل ایندکس از روی جدول مقالات"""
+        with connection.cursor() as db_cursor:
+            if connection.vendor == 'postgresql':
+                db_cursor.execute(
+                    f"UPDATE {DjangoArticle._meta.db_table} SET {self.PG_VECTOR_COLUMN} = NULL"
+                )
+            else:
+                db_cursor.execute(f"DELETE FROM {self.FTS_TABLE}")
+
+        published = DjangoArticle.objects.filter(
+            status=ArticleStatus.PUBLISHED.value
+        ).only('id', 'title', 'content', 'status')
+        for row in published.iterator(chunk_size=500):
+            self.sync_document(row.id, row.title, row.content, row.status)
+        return True
+
+    def get_indexed_ids(self, after_id: Optional[str] = None, limit: int = 500) -> List[str]:
+        """مقالاتی که سند جستجو دارند؛ در SQLite به ترتیب rowid و در PostgreSQL به ترتیب شناسه"""
+        table = DjangoArticle._meta.db_table
+        with connection.cursor() as db_cursor:
+            if connection.vendor == 'postgresql':
+                after_sql = 'AND id > %s' if after_id is not None else ''
+                db_cursor.execute(
+                    f"SELECT id FROM {table} WHERE {self.PG_VECTOR_COLUMN} IS NOT NULL {after_sql} "
+                    "ORDER BY id LIMIT %s",
+                    [*([self._db_id(after_id)] if after_id is not None else []), limit]
+                )
+            else:
+                after_rowid = self._fts_rowid(after_id) if after_id is not None else -1
+                db_cursor.execute(
+                    f"SELECT article_id FROM {self.FTS_TABLE} WHERE rowid > %s ORDER BY rowid LIMIT %s",
+                    [after_rowid, limit]
+                )
+            return [str(uuid.UUID(str(row[0]))) for row in db_cursor.fetchall()]
+
+    def get_indexed_versions(self, article_ids: List[str]) -> Dict[str, str]:
+        """
+        سند در همان تراکنش ذخیره مقاله نوشته می‌شود؛ نسخه ایندکس‌شده همان اثر انگشت
+        ثبت‌شده روی ردیف مقاله است (فقط برای مقالاتی که سند جستجو دارند)
+        """
+        if not article_ids:
+            return {}
+        table = DjangoArticle._meta.db_table
+        with connection.cursor() as db_cursor:
+            if connection.vendor == 'postgresql':
+                keys = [self._db_id(article_id) for article_id in article_ids]
+                db_cursor.execute(
+                    f"SELECT id, search_fingerprint FROM {table} "
+                    f"WHERE {self.PG_VECTOR_COLUMN} IS NOT NULL AND id IN ({', '.join(['%s'] * len(keys))})",
+                    keys
+                )
+            else:
+                keys = [self._fts_rowid(article_id) for article_id in article_ids]
+                db_cursor.execute(
+                    f"SELECT a.id, a.search_fingerprint FROM {self.FTS_TABLE} "
+                    f"JOIN {table} a ON a.id = {self.FTS_TABLE}.article_id "
+                    f"WHERE {self.FTS_TABLE}.rowid IN ({', '.join(['%s'] * len(keys))})",
+                    keys
+                )
+            return {str(uuid.UUID(str(row[0]))): row[1] or '' for row in db_cursor.fetchall()}
+
+    def get_suggestions(self, query: str, limit: int = 5) -> List[str]:
+        return []
+
+    def get_related_articles(self, article_id: str, limit: int = 5) -> List[Article]:
+        return []
@@ -0,0 +1,106 @@
+from typing import Dict, List, Optional
+from django.db.models import Q
+from application.interfaces.services.search_service import SearchService, SearchResult, SearchHit
+from domain.models.article import Article
+from domain.value_objects.article_status import ArticleStatus
+from infrastructure.repositories.article.models import DjangoArticle
+
+class DjangoFallbackSearchService(SearchService):
+    """
+    جستجوی ساده روی دیتابیس برای زمانی که Elasticsearch در دسترس نیست
+    روی عنوان و محتوا با همان فیلترهای موتور اصلی جستجو می‌کند (بدون فیلتر وضعیت
+    فقط مقالات منتشرشده)؛ امتیازدهی، هایلایت و facet ندارد
+    """
+
+    HIT_FIELDS = (
+        'id', 'title', 'slug', 'author_id', 'status',
+        'published_at', 'updated_at', 'view_count',
+    )
+
+    SORT_FIELDS = {
+        'newest': ('-published_at', 'id'),
+        'oldest': ('published_at', 'id'),
+        'popular': ('-view_count', 'id'),
+    }
+
+    def search_articles(
+        self,
+        query: str,
+        page: int = 1,
+        page_size: int = 10,
+        filters: Optional[dict] = None,
+        sort_by: Optional[str] = None,
+        cursor: Optional[str] = None,
+        facets: Optional[List[str]] = None
+    ) -> SearchResult:
+        # نشانگرهای Elasticsearch اینجا معنا ندارند؛ صفحه‌بندی با offset انجام می‌شود
+        query = query.strip()
+        queryset = self._apply_filters(
+            DjangoArticle.objects.filter(Q(title__icontains=query) | Q(content__icontains=query)),
+            filters or {}
+        ).order_by(*self.SORT_FIELDS.get(sort_by, ('-published_at', 'id')))
+
+        offset = (page - 1) * page_size
+        rows = list(queryset.only(*self.HIT_FIELDS)[offset:offset + page_size])
+        return SearchResult(
+            hits=[self._to_search_hit(row) for row in rows],
+            total_results=queryset.count(),
+            page=page,
+            page_size=page_size,
+            is_degraded=True
+        )
+
+    def _apply_filters(self, queryset, filters: dict):
+        queryset = queryset.filter(status=filters.get('status') or ArticleStatus.PUBLISHED.value)
+        if filters.get('author_id'):
+            queryset = queryset.filter(author_id=filters['author_id'])
+        if filters.get('tags'):
+            queryset = queryset.filter(djangoarticletag__tag_name__in=filters['tags'])
+        if filters.get('categories'):
+            queryset = queryset.filter(djangoarticlecategory__category_id__in=filters['categories'])
+        if filters.get('published_from'):
+            queryset = queryset.filter(published_at__gte=filters['published_from'])
+        if filters.get('published_to'):
+            queryset = queryset.filter(published_at__lte=filters['published_to'])
+        if filters.get('tags') or filters.get('categories'):
+            queryset = queryset.distinct()
+        return queryset
+
+    def _to_search_hit(self, row: DjangoArticle) -> SearchHit:
+        return SearchHit(
+            id=str(row.id),
+            title=row.title,
+            slug=row.slug,
+            author_id=str(row.author_id),
+            status=row.status,
+            published_at=row.published_at.isoformat() if row.published_at else None,
+            updated_at=row.updated_at.isoformat() if row.updated_at else None,
+            view_count=row.view_count,
+            comment_count=0,
+            score=0.0
+        )
+
+    def get_suggestions(self, query: str, limit: int = 5) -> List[str]:
+        return []
+
+    def get_related_articles(self, article_id: str, limit: int = 5) -> List[Article]:
+        return []
+
+    # عملیات ایندکس در این سرویس معنا ندارد؛ داده مستقیما از دیتابیس خوانده می‌شود
+    def index_article(self, article: Article) -> bool:
+        return False
+
+    def update_indexed_article(self, article: Article) -> bool:
+        return False
+
+    def remove_article_from_index(self, article_id: str) -> bool:
+        return False
+
+    def rebuild_index(self) -> bool:
+        return False
+
+    def get_indexed_versions(self, article_ids: List[str]) -> Dict[str, str]:
+        return {}
+
+    def get_indexed_ids(self, after_id: Optional[str] = None, limit: int = 500) -> List[str]:
+        return []
@@ -1,24 +1,99 @@
+import base64
+import hashlib
+import json
+import time
+from django.core.cache import cache
 from elasticsearch import Elasticsearch
-from typing import List, Optional
-from dataclasses import dataclass
+from elasticsearch.exceptions import TransportError
+from elasticsearch.helpers import bulk
+from typing import Dict, List, Optional, Tuple, Union
+from dataclasses import dataclass, field
+from application.interfaces.services.search_service import (
+    SearchService,
+    SearchHit,
+    FacetBucket,
+    SearchQuery,
+    SuggestionQuery
+)
 from domain.models.article import Article
-from application.interfaces.services.search_service import SearchService
+from domain.value_objects.article_status import ArticleStatus
+from domain.services.search_fingerprint import search_fingerprint
+from infrastructure.services.search.article_index_mapping import (
+    ARTICLE_INDEX_MAPPINGS,
+    CURSOR_TIEBREAKER,
+    build_facet_aggregations
+)
+from infrastructure.services.search.client import get_elasticsearch_client
 from config import settings
 
 @dataclass
 class ESSearchResult:
-    articles: List[Article]
+    hits: List[SearchHit]
     total_results: int
+    next_cursor: Optional[str] = None
+    facets: Dict[str, List[FacetBucket]] = field(default_factory=dict)
+    is_degraded: bool = False
 
 class ElasticsearchAdapter(SearchService):
     """پیاده‌سازی سرویس جستجو با Elasticsearch"""
+
+    # فیلدهایی که از _source خوانده می‌شوند (محتوای کامل مقاله منتقل نمی‌شود)
+    HIT_SOURCE_FIELDS = [
+        "title", "slug", "author_id", "status",
+        "published_at", "updated_at", "view_count", "comment_count"
+    ]
+
+    MAPPINGS = ARTICLE_INDEX_MAPPINGS
+
+    # فیلد یکتا برای شکستن تساوی در مرتب‌سازی search_after
+    CURSOR_TIEBREAKER = CURSOR_TIEBREAKER
+
+    supports_reconciliation = True
     
-    def __init__(self):
-        self.client = Elasticsearch(
-            hosts=[settings.ELASTICSEARCH_URL],
-            http_auth=(settings.ELASTICSEARCH_USER, settings.ELASTICSEARCH_PASSWORD)
-        )
+    # تعداد مقالات خوانده‌شده از دیتابیس در هر دور بازسازی ایندکس
+    REBUILD_BATCH_SIZE = 500
+
+    def __init__(
+        self,
+        client: Optional[Elasticsearch] = None,
+        request_timeout: Optional[float] = None,
+        article_repository=None
+    ):
+        # کلاینت مشترک در سطح پروسه تا اتصال‌ها بین درخواست‌ها بازاستفاده شوند
+        self.client = client or get_elasticsearch_client()
         self.index_name = "articles"
+        # سقف زمان هر درخواست جستجو (ثانیه)؛ بدون مقدار، تنظیم کلاینت استفاده می‌شود
+        self.request_timeout = request_timeout
+        self._article_repository = article_repository
+        self._index_ready = False
+
+    @property
+    def article_repository(self):
+        """ریپازیتوری مقالات برای ساخت موجودیت‌های مقالات مرتبط و بازسازی ایندکس"""
+        if self._article_repository is None:
+            from infrastructure.repositories.article.django_article_repository import DjangoArticleRepository
+            self._article_repository = DjangoArticleRepository()
+        return self._article_repository
+
+    def ensure_index(self) -> bool:
+        """
+        ساخت ایندکس با نگاشت صریح در صورت نبودن
+        Returns:
+            bool: True اگر ایندکس همین حالا ساخته شد
+        """
+        if self._index_ready:
+            return False
+        created = False
+        if not self.client.indices.exists(index=self.index_name):
+            response = self.client.indices.create(
+                index=self.index_name,
+                body={"mappings": self.MAPPINGS},
+                ignore=[400]
+            )
+            # 400 یعنی پروسه دیگری هم‌زمان ایندکس را ساخته است
+            created = bool(response.get('acknowledged'))
+        self._index_ready = True
+        return created
 
     def search_articles(
         self,
@@ -26,9 +101,178 @@ class ElasticsearchAdapter(SearchService):
         page: int = 1,
         page_size: int = 10,
         filters: Optional[dict] = None,
-        sort_by: Optional[str] = None
+        sort_by: Optional[str] = None,
+        cursor: Optional[str] = None,
+        facets: Optional[List[str]] = None
     ) -> ESSearchResult:
-        # ساخت کوئری جستجو
+        search_query, state = self._build_search_query(
+            query, page, page_size, filters, sort_by, cursor, facets
+        )
+
+        # نتایج همراه با facetها کش می‌شوند
+        cache_key = self._cache_key(search_query)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # اجرای جستجو
+        pit_id = state['pit'] if state else None
+        if pit_id:
+            search_query["pit"] = {"id": pit_id, "keep_alive": self._pit_keep_alive()}
+            response = self.client.search(body=search_query, request_timeout=self.request_timeout)
+        else:
+            response = self.client.search(
+                index=self.index_name,
+                body=search_query,
+                request_timeout=self.request_timeout
+            )
+
+        result, pending_cursor = self._parse_search_response(response, state, page_size, sort_by)
+        if pending_cursor:
+            result.next_cursor = self._encode_cursor({
+                **pending_cursor, 'pit': self._open_point_in_time()
+            })
+        cache.set(cache_key, result, self._cache_ttl())
+        return result
+
+    def multi_search(
+        self,
+        queries: List[Union[SearchQuery, SuggestionQuery]]
+    ) -> List[Union[ESSearchResult, List[str]]]:
+        """
+        اجرای چند جستجو و پیشنهاد در یک درخواست _msearch
+        نتایج موجود در کش از درخواست حذف می‌شوند
+        """
+        results: List = [None] * len(queries)
+        pending = []
+        for entry in self._build_multi_search_entries(queries):
+            position, body, state, cache_key = entry
+            cached = cache.get(cache_key) if cache_key else None
+            if cached is not None:
+                results[position] = cached
+            else:
+                pending.append(entry)
+
+        if not pending:
+            return results
+
+        responses = self.client.msearch(
+            body=self._multi_search_lines(pending),
+            request_timeout=self.request_timeout
+        )['responses']
+        for position, result, pending_cursor, cache_key in self._parse_multi_search(queries, pending, responses):
+            if pending_cursor:
+                result.next_cursor = self._encode_cursor({
+                    **pending_cursor, 'pit': self._open_point_in_time()
+                })
+            if cache_key:
+                cache.set(cache_key, result, self._cache_ttl())
+            results[position] = result
+
+        return results
+
+    def _build_multi_search_entries(
+        self,
+        queries: List[Union[SearchQuery, SuggestionQuery]]
+    ) -> List[Tuple[int, dict, Optional[dict], Optional[str]]]:
+        """(شماره درخواست، بدنه، وضعیت نشانگر، کلید کش) برای هر جستجو؛ پیشنهادها کش ندارند"""
+        entries = []
+        for position, item in enumerate(queries):
+            if isinstance(item, SuggestionQuery):
+                entries.append((position, self._build_suggestion_query(item.query, item.limit), None, None))
+                continue
+            body, state = self._build_search_query(
+                item.query, item.page, item.page_size, item.filters,
+                item.sort_by, item.cursor, item.facets
+            )
+            entries.append((position, body, state, self._cache_key(body)))
+        return entries
+
+    def _multi_search_lines(self, entries: List[Tuple[int, dict, Optional[dict], Optional[str]]]) -> List[dict]:
+        """سطرهای header/body درخواست _msearch"""
+        lines = []
+        for _, body, state, _ in entries:
+            header = {"index": self.index_name}
+            if state and state['pit']:
+                # درخواست‌های point-in-time نباید ایندکس داشته باشند
+                body["pit"] = {"id": state['pit'], "keep_alive": self._pit_keep_alive()}
+                header = {}
+            lines.extend([header, body])
+        return lines
+
+    def _parse_multi_search(
+        self,
+        queries: List[Union[SearchQuery, SuggestionQuery]],
+        entries: List[Tuple[int, dict, Optional[dict], Optional[str]]],
+        responses: List[dict]
+    ):
+        """
+        (شماره درخواست، نتیجه، وضعیت نشانگر در انتظار point-in-time، کلید کش) برای هر پاسخ
+        باز کردن point-in-time و نوشتن در کش با فراخواننده است
+        """
+        for (position, _, state, cache_key), response in zip(entries, responses):
+            item = queries[position]
+            if 'error' in response:
+                if isinstance(item, SuggestionQuery):
+                    yield position, [], None, None
+                    continue
+                error = response['error']
+                raise TransportError(response.get('status', 500), error.get('type', 'search_error'), error)
+
+            if isinstance(item, SuggestionQuery):
+                yield position, self._parse_suggestions(response), None, None
+                continue
+
+            result, pending_cursor = self._parse_search_response(
+                response, state, item.page_size, item.sort_by
+            )
+            yield position, result, pending_cursor, cache_key
+
+    def get_suggestions(self, query: str, limit: int = 5) -> List[str]:
+        """پیشنهاد عبارت‌های اصلاح‌شده جستجو بر اساس عناوین ایندکس‌شده"""
+        response = self.client.search(
+            index=self.index_name,
+            body=self._build_suggestion_query(query, limit),
+            request_timeout=self.request_timeout
+        )
+        return self._parse_suggestions(response)
+
+    def _build_suggestion_query(self, query: str, limit: int) -> dict:
+        """کوئری phrase suggester روی عنوان مقالات (بدون بازگرداندن سند)"""
+        return {
+            "size": 0,
+            "suggest": {
+                "text": query,
+                "title_phrase": {
+                    "phrase": {
+                        "field": "title",
+                        "size": limit,
+                        "gram_size": 2,
+                        "direct_generator": [{"field": "title", "suggest_mode": "popular"}]
+                    }
+                }
+            }
+        }
+
+    def _parse_suggestions(self, response: dict) -> List[str]:
+        suggestions = response.get('suggest', {}).get('title_phrase', [])
+        return [
+            option['text']
+            for suggestion in suggestions
+            for option in suggestion.get('options', [])
+        ]
+
+    def _build_search_query(
+        self,
+        query: str,
+        page: int,
+        page_size: int,
+        filters: Optional[dict],
+        sort_by: Optional[str],
+        cursor: Optional[str],
+        facets: Optional[List[str]] = None
+    ) -> Tuple[dict, Optional[dict]]:
+        """ساخت بدنه کوئری جستجو و وضعیت نشانگر صفحه‌بندی"""
         search_query = {
             "query": {
                 "bool": {
@@ -41,35 +285,103 @@ class ElasticsearchAdapter(SearchService):
                     "filter": self._build_filters(filters)
                 }
             },
-            "from": (page - 1) * page_size,
             "size": page_size,
-            "highlight": {
-                "fields": {
-                    "content": {}
-                }
-            }
+            "_source": self.HIT_SOURCE_FIELDS,
+            "highlight": self._build_highlight()
         }
 
-        # اضافه کردن مرتب‌سازی
-        if sort_by:
-            search_query["sort"] = self._get_sort(sort_by)
+        # صفحه‌بندی: با نشانگر از search_after و بدون آن از from استفاده می‌شود
+        state = self._decode_cursor(cursor, sort_by) if cursor else None
+        search_query["sort"] = self._get_sort(sort_by)
+        if state:
+            search_query["search_after"] = state['after']
+            # تعداد کل از صفحه اول در نشانگر نگهداری می‌شود
+            search_query["track_total_hits"] = False
+        else:
+            search_query["from"] = (page - 1) * page_size
+            # شمارش facetها در همان درخواست؛ در صفحات بعدی تغییری نمی‌کنند
+            if facets:
+                search_query["aggs"] = self._build_aggregations(facets)
 
-        # اجرای جستجو
-        response = self.client.search(
-            index=self.index_name,
-            body=search_query
+        return search_query, state
+
+    def _parse_search_response(
+        self,
+        response: dict,
+        state: Optional[dict],
+        page_size: int,
+        sort_by: Optional[str]
+    ) -> Tuple[ESSearchResult, Optional[dict]]:
+        """
+        تبدیل پاسخ Elasticsearch به نتیجه جستجو
+        اگر صفحه بعدی وجود داشته باشد ولی point-in-time هنوز باز نشده باشد،
+        وضعیت نشانگر برگردانده می‌شود تا فراخواننده آن را باز کند
+        """
+        raw_hits = response['hits']['hits']
+        hits = [self._to_search_hit(hit) for hit in raw_hits]
+        total_results = state['total'] if state else response['hits']['total']['value']
+        result = ESSearchResult(
+            hits=hits,
+            total_results=total_results,
+            facets=self._parse_facets(response.get('aggregations', {}))
         )
 
-        # تبدیل نتایج
-        articles = [
-            self._hit_to_article(hit)
-            for hit in response['hits']['hits']
-        ]
+        if len(raw_hits) < page_size:
+            return result, None
 
-        return ESSearchResult(
-            articles=articles,
-            total_results=response['hits']['total']['value']
+        cursor_state = {
+            'after': raw_hits[-1]['sort'],
+            'sort_by': sort_by,
+            'total': total_results
+        }
+        pit_id = response.get('pit_id') or (state['pit'] if state else None)
+        if pit_id:
+            result.next_cursor = self._encode_cursor({**cursor_state, 'pit': pit_id})
+            return result, None
+        # point-in-time فقط وقتی باز می‌شود که صفحه بعدی وجود داشته باشد
+        return result, cursor_state
+
+    def _open_point_in_time(self) -> Optional[str]:
+        """باز کردن point-in-time در صورت فعال بودن در تنظیمات"""
+        if not self._use_point_in_time():
+            return None
+        response = self.client.open_point_in_time(
+            index=self.index_name,
+            keep_alive=self._pit_keep_alive()
         )
+        return response['id']
+
+    def _cache_key(self, search_query: dict) -> str:
+        """کلید کش بر اساس بدنه کامل کوئری (شامل فیلترها، صفحه و facetها)"""
+        raw = json.dumps(search_query, sort_keys=True, ensure_ascii=False)
+        return f"search:articles:{hashlib.sha1(raw.encode('utf-8')).hexdigest()}"
+
+    def _cache_ttl(self) -> int:
+        return settings.CACHE_TTL.get('SEARCH_RESULTS', 60)
+
+    def _use_point_in_time(self) -> bool:
+        return settings.SEARCH_CONFIG.get('USE_POINT_IN_TIME', False)
+
+    def _pit_keep_alive(self) -> str:
+        return settings.SEARCH_CONFIG.get('PIT_KEEP_ALIVE', '1m')
+
+    def _encode_cursor(self, state: dict) -> str:
+        """تبدیل وضعیت صفحه‌بندی به نشانگر مبهم برای کلاینت"""
+        raw = json.dumps(state, separators=(',', ':')).encode('utf-8')
+        return base64.urlsafe_b64encode(raw).decode('ascii')
+
+    def _decode_cursor(self, cursor: str, sort_by: Optional[str]) -> dict:
+        """بازخوانی نشانگر صفحه‌بندی و اطمینان از سازگاری آن با مرتب‌سازی"""
+        try:
+            state = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+            after = state['after']
+        except (ValueError, TypeError, KeyError):
+            raise ValueError("نشانگر صفحه‌بندی نامعتبر است")
+        if not isinstance(after, list) or state.get('sort_by') != sort_by:
+            raise ValueError("نشانگر صفحه‌بندی با مرتب‌سازی درخواست سازگار نیست")
+        state.setdefault('pit', None)
+        state.setdefault('total', 0)
+        return state
 
     def _build_filters(self, filters: Optional[dict]) -> List[dict]:
         """ساخت فیلترهای جستجو"""
@@ -83,35 +395,301 @@ class ElasticsearchAdapter(SearchService):
             filter_list.append({"term": {"author_id": filters['author_id']}})
         if 'tags' in filters:
             filter_list.append({"terms": {"tags": filters['tags']}})
+        if 'categories' in filters:
+            filter_list.append({"terms": {"categories": filters['categories']}})
+        if 'published_from' in filters or 'published_to' in filters:
+            date_range = {}
+            if 'published_from' in filters:
+                date_range['gte'] = filters['published_from']
+            if 'published_to' in filters:
+                date_range['lte'] = filters['published_to']
+            filter_list.append({"range": {"published_at": date_range}})
         
         return filter_list
 
-    def _get_sort(self, sort_by: str) -> List[dict]:
-        """تبدیل پارامتر مرتب‌سازی به فرمت Elasticsearch"""
+    def _build_aggregations(self, facets: List[str]) -> dict:
+        """ساخت aggregationهای facet برای محاسبه در همان درخواست جستجو (فقط روی فیلدهای keyword/date نگاشت)"""
+        return build_facet_aggregations(
+            facets,
+            size=settings.SEARCH_CONFIG.get('FACET_SIZE', 10),
+            date_interval=settings.SEARCH_CONFIG.get('FACET_DATE_INTERVAL', 'month')
+        )
+
+    def _parse_facets(self, aggregations: dict) -> Dict[str, List[FacetBucket]]:
+        """تبدیل نتیجه aggregationها به شمارش facetها"""
+        return {
+            name: [
+                FacetBucket(
+                    value=str(bucket.get('key_as_string', bucket['key'])),
+                    count=bucket['doc_count']
+                )
+                for bucket in agg.get('buckets', [])
+            ]
+            for name, agg in aggregations.items()
+        }
+
+    def _get_sort(self, sort_by: Optional[str]) -> List[dict]:
+        """
+        تبدیل پارامتر مرتب‌سازی به فرمت Elasticsearch
+        بدون sort_by بر اساس امتیاز مرتبط بودن مرتب می‌شود و فیلد یکتا
+        همیشه برای پایدار ماندن search_after اضافه می‌شود
+        """
         sort_mapping = {
             'newest': {'published_at': 'desc'},
             'oldest': {'published_at': 'asc'},
             'popular': {'view_count': 'desc'},
             'most_commented': {'comment_count': 'desc'}
         }
-        return [sort_mapping.get(sort_by, {'published_at': 'desc'})]
+        if sort_by:
+            sort = [sort_mapping.get(sort_by, {'published_at': 'desc'})]
+        else:
+            sort = [{'_score': 'desc'}]
+        sort.append(self.CURSOR_TIEBREAKER)
+        return sort
+
+    def _build_highlight(self) -> dict:
+        """تنظیمات هایلایت با اندازه محدود برای هر قطعه"""
+        config = settings.SEARCH_CONFIG
+        pre_tag = config.get('HIGHLIGHT_TAG', '<mark>')
+        return {
+            "pre_tags": [pre_tag],
+            "post_tags": [pre_tag.replace('<', '</', 1)],
+            "fields": {
+                "content": {
+                    "fragment_size": config.get('HIGHLIGHT_FRAGMENT_SIZE', 150),
+                    "number_of_fragments": config.get('HIGHLIGHT_FRAGMENTS', 2),
+                    "no_match_size": config.get('HIGHLIGHT_FRAGMENT_SIZE', 150)
+                }
+            }
+        }
 
-    def _hit_to_article(self, hit: dict) -> Article:
-        """تبدیل نتیجه جستجو به مدل مقاله"""
+    def _to_search_hit(self, hit: dict) -> SearchHit:
+        """تبدیل نتیجه جستجو به SearchHit بدون ساخت موجودیت مقاله"""
         source = hit['_source']
-        highlight = hit.get('highlight', {})
-        
-        from domain.models.article import Article
-        from core.domain.models.user import User
-        
-        return Article(
+        return SearchHit(
             id=hit['_id'],
             title=source['title'],
-            content=highlight.get('content', [source['content']])[0],
-            author=User(id=source['author_id']),
+            slug=source.get('slug', ''),
+            author_id=source['author_id'],
             status=source['status'],
+            published_at=source.get('published_at'),
+            updated_at=source.get('updated_at'),
             view_count=source.get('view_count', 0),
-            published_at=source.get('published_at')
+            comment_count=source.get('comment_count', 0),
+            score=hit.get('_score'),
+            highlights=hit.get('highlight', {}).get('content', [])
+        )
+
+    def index_article(self, article: Article) -> bool:
+        """ایندکس کردن مقاله (سند قبلی با همین شناسه جایگزین می‌شود)"""
+        self.ensure_index()
+        self.client.index(
+            index=self.index_name,
+            id=article.id,
+            body=self._article_to_document(article),
+            request_timeout=self.request_timeout
+        )
+        return True
+
+    def update_indexed_article(self, article: Article) -> bool:
+        return self.index_article(article)
+
+    def remove_article_from_index(self, article_id: str) -> bool:
+        self.client.delete(
+            index=self.index_name,
+            id=article_id,
+            ignore=[404],
+            request_timeout=self.request_timeout
+        )
+        return True
+
+    def bulk_index_articles(self, articles: List[Article]) -> int:
+        """ایندکس گروهی مقالات با یک درخواست _bulk"""
+        if not articles:
+            return 0
+        self.ensure_index()
+        success, _ = bulk(
+            self.client,
+            self._index_actions(articles),
+            raise_on_error=False,
+            request_timeout=self.request_timeout
+        )
+        return success
+
+    def bulk_remove_articles(self, article_ids: List[str]) -> int:
+        """حذف گروهی اسناد؛ سندهای ناموجود حذف‌شده حساب می‌شوند"""
+        if not article_ids:
+            return 0
+        success, errors = bulk(
+            self.client,
+            self._delete_actions(article_ids),
+            raise_on_error=False,
+            request_timeout=self.request_timeout
+        )
+        return self._count_removed(success, errors)
+
+    def _index_actions(self, articles: List[Article], index: Optional[str] = None):
+        return (
+            {
+                "_op_type": "index",
+                "_index": index or self.index_name,
+                "_id": article.id,
+                "_source": self._article_to_document(article)
+            }
+            for article in articles
+        )
+
+    def _delete_actions(self, article_ids: List[str]):
+        return (
+            {"_op_type": "delete", "_index": self.index_name, "_id": article_id}
+            for article_id in article_ids
+        )
+
+    def _count_removed(self, success: int, errors: list) -> int:
+        # سندهای ناموجود هم حذف‌شده حساب می‌شوند
+        not_found = sum(1 for error in errors if error.get('delete', {}).get('status') == 404)
+        return success + not_found
+
+    def get_indexed_versions(self, article_ids: List[str]) -> Dict[str, str]:
+        """اثر انگشت اسناد ایندکس‌شده با یک درخواست _mget و فقط فیلد fingerprint"""
+        if not article_ids:
+            return {}
+        response = self.client.mget(
+            index=self.index_name,
+            body={"ids": list(article_ids)},
+            _source_includes=["fingerprint"],
+            request_timeout=self.request_timeout
+        )
+        return self._parse_indexed_versions(response)
+
+    def _parse_indexed_versions(self, response: dict) -> Dict[str, str]:
+        return {
+            doc['_id']: doc.get('_source', {}).get('fingerprint', '')
+            for doc in response['docs']
+            if doc.get('found')
+        }
+
+    def get_indexed_ids(self, after_id: Optional[str] = None, limit: int = 500) -> List[str]:
+        """شناسه اسناد به ترتیب فیلد id با search_after و بدون _source"""
+        response = self.client.search(
+            index=self.index_name,
+            body=self._build_indexed_ids_query(after_id, limit),
+            request_timeout=self.request_timeout
         )
+        return [hit['_id'] for hit in response['hits']['hits']]
+
+    def _build_indexed_ids_query(self, after_id: Optional[str], limit: int) -> dict:
+        body = {
+            "query": {"match_all": {}},
+            "sort": [self.CURSOR_TIEBREAKER],
+            "size": limit,
+            "_source": False,
+            "track_total_hits": False
+        }
+        if after_id is not None:
+            body["search_after"] = [after_id]
+        return body
+
+    def get_related_articles(self, article_id: str, limit: int = 5) -> List[Article]:
+        """مقالات منتشرشده مشابه با more_like_this روی عنوان، محتوا و برچسب‌ها"""
+        response = self.client.search(
+            index=self.index_name,
+            body=self._build_related_query(article_id, limit),
+            request_timeout=self.request_timeout
+        )
+        return self._load_articles([hit['_id'] for hit in response['hits']['hits']])
+
+    def _build_related_query(self, article_id: str, limit: int) -> dict:
+        return {
+            "query": {
+                "bool": {
+                    "must": {
+                        "more_like_this": {
+                            "fields": ["title", "content", "tags"],
+                            "like": [{"_index": self.index_name, "_id": article_id}],
+                            "min_term_freq": 1,
+                            "min_doc_freq": 2,
+                            "max_query_terms": 25
+                        }
+                    },
+                    "filter": [{"term": {"status": ArticleStatus.PUBLISHED.value}}]
+                }
+            },
+            "size": limit,
+            "_source": False
+        }
+
+    def _load_articles(self, article_ids: List[str]) -> List[Article]:
+        """موجودیت مقالات به ترتیب امتیاز؛ مقالات حذف‌شده از دیتابیس کنار گذاشته می‌شوند"""
+        articles = (self.article_repository.get_by_id(article_id) for article_id in article_ids)
+        return [article for article in articles if article is not None]
+
+    def rebuild_index(self) -> bool:
+        """
+        بازسازی کامل ایندکس بدون قطع جستجو
+        همه مقالات در یک ایندکس تازه با نگاشت فعلی نوشته می‌شوند و سپس نام articles
+        با یک درخواست _aliases به آن منتقل می‌شود؛ ایندکس قبلی (یا ایندکس قدیمی هم‌نام
+        که با نگاشت پویا ساخته شده بود) در همان درخواست حذف می‌شود. تغییرات هم‌زمان با
+        بازسازی در دور بعدی reconcile_search_index به ایندکس جدید می‌رسند.
+        """
+        new_index = self._rebuild_index_name()
+        self.client.indices.create(index=new_index, body={"mappings": self.MAPPINGS})
+        try:
+            since, after_id = None, None
+            while True:
+                articles = self.article_repository.get_updated_since(
+                    since, after_id, limit=self.REBUILD_BATCH_SIZE
+                )
+                if not articles:
+                    break
+                _, errors = bulk(
+                    self.client,
+                    self._index_actions(articles, index=new_index),
+                    raise_on_error=False,
+                    request_timeout=self.request_timeout
+                )
+                if errors:
+                    raise TransportError(500, 'bulk_index_error', errors[:5])
+                since, after_id = articles[-1].updated_at, articles[-1].id
+            self.client.indices.refresh(index=new_index)
+            self.client.indices.update_aliases(body={"actions": [
+                *self._detach_current_index(),
+                {"add": {"index": new_index, "alias": self.index_name}}
+            ]})
+        except Exception:
+            self.client.indices.delete(index=new_index, ignore=[404])
+            raise
+        self._index_ready = True
+        return True
+
+    def _rebuild_index_name(self) -> str:
+        return f"{self.index_name}_{time.strftime('%Y%m%d%H%M%S')}"
+
+    def _detach_current_index(self) -> List[dict]:
+        """actionهای _aliases برای کنار گذاشتن ایندکس فعلی پشت نام articles"""
+        if not self.client.indices.exists(index=self.index_name):
+            return []
+        if self.client.indices.exists_alias(name=self.index_name):
+            current = list(self.client.indices.get_alias(name=self.index_name))
+            return [{"remove_index": {"index": index}} for index in current]
+        # ایندکس واقعی هم‌نام باید حذف شود تا نام برای alias آزاد شود
+        return [{"remove_index": {"index": self.index_name}}]
+
+    def _article_to_document(self, article: Article) -> dict:
+        """تبدیل موجودیت مقاله به سند ایندکس"""
+        return {
+            "id": article.id,
+            "title": article.title,
+            "slug": article.slug.value,
+            "content": article.content,
+            "author_id": str(article.author.id),
+            "status": article.status.value,
+            "tags": [str(tag) for tag in article.tags],
+            "categories": [str(category) for category in article.categories],
+            "published_at": article.published_at.isoformat() if article.published_at else None,
+            "updated_at": article.updated_at.isoformat() if article.updated_at else None,
+            "view_count": article.view_count,
+            "fingerprint": search_fingerprint(article)
+        }
 
     # سایر متدهای SearchService...
\ No newline at end of file
@@ -0,0 +1,224 @@
+import hashlib
+import json
+import logging
+import time
+from dataclasses import replace
+from typing import Dict, List, Optional, Union
+from django.conf import settings
+from django.core.cache import cache
+from application.interfaces.services.search_service import (
+    SearchService, SearchResult, SearchQuery, SuggestionQuery
+)
+from domain.models.article import Article
+from infrastructure.services.search.circuit_breaker import CircuitBreaker, get_circuit_breaker
+
+logger = logging.getLogger(__name__)
+
+class ResilientSearchService(SearchService):
+    """
+    لایه تاب‌آوری روی سرویس جستجوی اصلی
+
+    درخواست‌ها از قطع‌کننده مدار عبور می‌کنند؛ خطا یا پاسخ کندتر از latency_budget
+    خطا شمرده می‌شود. در زمان خطا یا باز بودن مدار، آخرین نتیجه سالم همان جستجو
+    (در صورت وجود) و در غیر این صورت نتیجه سرویس جایگزین با is_degraded برگردانده می‌شود
+    """
+
+    STALE_KEY_PREFIX = 'search:stale:'
+    METRIC_KEY_PREFIX = 'search:fallback:'
+
+    def __init__(
+        self,
+        primary: SearchService,
+        fallback: SearchService,
+        breaker: Optional[CircuitBreaker] = None,
+        latency_budget: Optional[float] = None
+    ):
+        config = settings.SEARCH_RESILIENCE
+        self.primary = primary
+        self.fallback = fallback
+        self.breaker = breaker or get_circuit_breaker(
+            'search',
+            failure_threshold=config.get('FAILURE_THRESHOLD', 5),
+            reset_timeout=config.get('RESET_TIMEOUT', 30.0)
+        )
+        self.latency_budget = latency_budget if latency_budget is not None else config.get('LATENCY_BUDGET', 0.5)
+        self.stale_ttl = config.get('STALE_TTL', 60 * 60)
+
+    @property
+    def supports_reconciliation(self) -> bool:
+        return self.primary.supports_reconciliation
+
+    def search_articles(
+        self,
+        query: str,
+        page: int = 1,
+        page_size: int = 10,
+        filters: Optional[dict] = None,
+        sort_by: Optional[str] = None,
+        cursor: Optional[str] = None,
+        facets: Optional[List[str]] = None
+    ) -> SearchResult:
+        item = SearchQuery(query, page, page_size, filters, sort_by, cursor, facets)
+        ok, result = self._call_primary(lambda: self.primary.search_articles(
+            query=query, page=page, page_size=page_size, filters=filters,
+            sort_by=sort_by, cursor=cursor, facets=facets
+        ))
+        if ok:
+            cache.set(self._stale_key(item), result, self.stale_ttl)
+            return result
+        return self._degraded_search(item, result)
+
+    def multi_search(
+        self,
+        queries: List[Union[SearchQuery, SuggestionQuery]]
+    ) -> List[Union[SearchResult, List[str]]]:
+        ok, results = self._call_primary(lambda: self.primary.multi_search(queries))
+        if ok:
+            for item, result in zip(queries, results):
+                if isinstance(item, SearchQuery):
+                    cache.set(self._stale_key(item), result, self.stale_ttl)
+            return results
+        return [
+            [] if isinstance(item, SuggestionQuery) else self._degraded_search(item, results)
+            for item in queries
+        ]
+
+    def get_suggestions(self, query: str, limit: int = 5) -> List[str]:
+        ok, result = self._call_primary(lambda: self.primary.get_suggestions(query, limit))
+        # پیشنهادها ضروری نیستند؛ در زمان قطعی فهرست خالی کافی است
+        return result if ok else []
+
+    def get_related_articles(self, article_id: str, limit: int = 5) -> List[Article]:
+        ok, result = self._call_primary(lambda: self.primary.get_related_articles(article_id, limit))
+        return result if ok else []
+
+    # عملیات ایندکس جایگزینی ندارند؛ فقط در زمان باز بودن مدار به موتور جستجو فشار نمی‌آورند
+    def index_article(self, article: Article) -> bool:
+        return self._guarded_write(lambda: self.primary.index_article(article))
+
+    def update_indexed_article(self, article: Article) -> bool:
+        return self._guarded_write(lambda: self.primary.update_indexed_article(article))
+
+    def remove_article_from_index(self, article_id: str) -> bool:
+        return self._guarded_write(lambda: self.primary.remove_article_from_index(article_id))
+
+    def bulk_index_articles(self, articles: List[Article]) -> int:
+        ok, result = self._call_primary(lambda: self.primary.bulk_index_articles(articles))
+        return result if ok else 0
+
+    def bulk_remove_articles(self, article_ids: List[str]) -> int:
+        ok, result = self._call_primary(lambda: self.primary.bulk_remove_articles(article_ids))
+        return result if ok else 0
+
+    def get_indexed_versions(self, article_ids: List[str]) -> Dict[str, str]:
+        # بدون پاسخ موتور جستجو مقایسه ممکن نیست؛ خطا به فراخواننده می‌رسد
+        return self.primary.get_indexed_versions(article_ids)
+
+    def get_indexed_ids(self, after_id: Optional[str] = None, limit: int = 500) -> List[str]:
+        return self.primary.get_indexed_ids(after_id, limit)
+
+    def rebuild_index(self) -> bool:
+        return self.primary.rebuild_index()
+
+    def _call_primary(self, call):
+        """
+        اجرای درخواست روی سرویس اصلی از مسیر قطع‌کننده مدار
+
+        Returns:
+            (True, نتیجه سرویس اصلی) یا در صورت شکست (False, علت: 'circuit_open' / 'error')
+        """
+        if not self.breaker.allow_request():
+            return False, 'circuit_open'
+
+        started = time.monotonic()
+        try:
+            result = call()
+        except (ValueError, TypeError):
+            # ورودی نامعتبر درخواست (مثلا نشانگر صفحه‌بندی خراب) خطای موتور جستجو نیست
+            # و نباید مدار را برای همه کاربران باز کند؛ فراخواننده پاسخ 400 می‌دهد
+            raise
+        except Exception as e:
+            self.breaker.record_failure()
+            logger.warning(f"Primary search failed, circuit {self.breaker.state}: {str(e)}")
+            return False, 'error'
+
+        elapsed = time.monotonic() - started
+        if elapsed > self.latency_budget:
+            # پاسخ کند را برمی‌گردانیم اما برای باز شدن مدار شمرده می‌شود
+            self.breaker.record_failure()
+            self._record_fallback('slow')
+            logger.warning(f"Primary search exceeded latency budget: {elapsed:.3f}s")
+        else:
+            self.breaker.record_success()
+        return True, result
+
+    def _guarded_write(self, call) -> bool:
+        ok, result = self._call_primary(call)
+        return result if ok else False
+
+    def _degraded_search(self, item: SearchQuery, reason: str) -> SearchResult:
+        stale = cache.get(self._stale_key(item))
+        if stale is not None:
+            self._record_fallback(f'{reason}:stale')
+            return replace(stale, is_degraded=True)
+
+        if item.cursor:
+            # نشانگر search_after برای سرویس جایگزین معنایی ندارد؛ به جای شروع دوباره از صفحه اول
+            # صفحه خالی با همان نشانگر برگردانده می‌شود تا کاربر پس از رفع قطعی ادامه دهد
+            self._record_fallback(f'{reason}:cursor')
+            return SearchResult(
+                hits=[],
+                total_results=0,
+                page=item.page,
+                page_size=item.page_size,
+                next_cursor=item.cursor,
+                is_degraded=True
+            )
+
+        self._record_fallback(f'{reason}:database')
+        return self.fallback.search_articles(
+            query=item.query,
+            page=item.page,
+            page_size=item.page_size,
+            filters=item.filters,
+            sort_by=item.sort_by,
+            facets=item.facets
+        )
+
+    def _record_fallback(self, kind: str) -> None:
+        """شمارش استفاده از مسیر جایگزین در کش مشترک (برای داشبورد و هشدار)"""
+        key = f'{self.METRIC_KEY_PREFIX}{kind}'
+        try:
+            cache.add(key, 0, None)
+            cache.incr(key)
+        except Exception as e:
+            logger.debug(f"Failed to record search fallback metric {key}: {str(e)}")
+
+    def _stale_key(self, item: SearchQuery) -> str:
+        payload = json.dumps(
+            [item.query, item.page, item.page_size, item.filters, item.sort_by, item.cursor, item.facets],
+            sort_keys=True, default=str
+        )
+        return self.STALE_KEY_PREFIX + hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def build_search_service() -> SearchService:
+    """
+    سرویس جستجوی پیش‌فرض بر اساس SEARCH_CONFIG['BACKEND']
+    database: جستجوی تمام‌متن خود دیتابیس؛ در غیر این صورت Elasticsearch با سقف زمانی و جایگزین دیتابیس
+    در هر دو حالت جستجوهای هم‌زمان یکسان ادغام می‌شوند
+    """
+    from infrastructure.services.search.coalescing_search_service import CoalescingSearchService
+    from infrastructure.services.search.django_fallback_search import DjangoFallbackSearchService
+    from infrastructure.services.search.elasticsearch_adapter import ElasticsearchAdapter
+
+    if settings.SEARCH_CONFIG.get('BACKEND') == 'database':
+        from infrastructure.services.search.database_fulltext_search import DatabaseFullTextSearchService
+        return CoalescingSearchService(DatabaseFullTextSearchService())
+
+    return CoalescingSearchService(ResilientSearchService(
+        primary=ElasticsearchAdapter(
+            request_timeout=settings.SEARCH_RESILIENCE.get('REQUEST_TIMEOUT')
+        ),
+        fallback=DjangoFallbackSearchService()
+    ))
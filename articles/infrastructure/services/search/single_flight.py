@@ -0,0 +1,57 @@
+# infrastructure/services/search/single_flight.py
+import copy
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class _Call:
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    ادغام فراخوانی‌های هم‌زمان یکسان در یک پروسه
+
+    اولین فراخوانی با هر کلید تابع را اجرا می‌کند و فراخوانی‌های هم‌زمان دیگر با همان کلید
+    منتظر همان نتیجه (یا همان خطا) می‌مانند. پس از پایان، کلید آزاد می‌شود و نتیجه نگه داشته نمی‌شود.
+    با copy_result هر منتظر یک کپی عمیق از نتیجه می‌گیرد تا تغییر آن توسط یک فراخواننده
+    به بقیه نرسد.
+    """
+
+    def __init__(self, copy_result: bool = False):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.copy_result = copy_result
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result) if self.copy_result else call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,116 @@
+import logging
+import os
+import pickle
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Optional, Tuple
+from django.conf import settings
+from domain.services.persian_normalizer import tokenize
+from domain.services.symspell import SymSpell
+from application.interfaces.services.spelling_correction_service import SpellingCorrectionService
+from infrastructure.repositories.article.models import DjangoArticle
+
+logger = logging.getLogger(__name__)
+
+
+class SymSpellCorrector(SpellingCorrectionService):
+    """
+    اصلاح املایی درون حافظه بر اساس واژگان مقالات منتشرشده (همان محتوای ایندکس جستجو)
+    واژگان خارج از درخواست با دستور build_spelling_vocabulary ساخته و در یک فایل ذخیره
+    می‌شود؛ هر پروسه فقط همان فایل را بارگذاری می‌کند و پس از تغییر آن در پس‌زمینه
+    دوباره می‌خواند. هر اصلاح فقط یک جستجوی دیکشنری است و درخواستی به موتور جستجو نمی‌فرستد
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        config = settings.SPELLING_CORRECTION
+        self.path = Path(path or config['VOCABULARY_PATH'])
+        self.reload_check_interval = config.get('RELOAD_CHECK_INTERVAL', 60)
+        self._speller: Optional[SymSpell] = None
+        self._version: Optional[Tuple[int, int]] = None
+        self._checked_at = 0.0
+        self._load_lock = threading.Lock()
+
+    def suggest_correction(self, query: str) -> Optional[str]:
+        speller = self._get_speller()
+        return speller.correct(query) if speller is not None else None
+
+    def _get_speller(self) -> Optional[SymSpell]:
+        now = time.monotonic()
+        if now - self._checked_at < self.reload_check_interval:
+            return self._speller
+        self._checked_at = now
+        if self._speller is None:
+            # بارگذاری اولیه فقط خواندن فایل است؛ بدون فایل اصلاحی پیشنهاد نمی‌شود
+            self._reload()
+        elif not self._load_lock.locked() and self._file_version() != self._version:
+            # تا پایان بارگذاری، واژگان قبلی استفاده می‌شود
+            threading.Thread(target=self._reload, daemon=True).start()
+        return self._speller
+
+    def _reload(self) -> None:
+        if not self._load_lock.acquire(blocking=False):
+            return
+        try:
+            version = self._file_version()
+            if version is None or version == self._version:
+                return
+            with open(self.path, 'rb') as f:
+                self._speller = pickle.load(f)
+            self._version = version
+        except Exception as e:
+            logger.warning(f"Failed to load spelling vocabulary {self.path}: {str(e)}")
+        finally:
+            self._load_lock.release()
+
+    def _file_version(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+
+def build_vocabulary() -> SymSpell:
+    """ساخت واژگان از پرتکرارترین کلمات مقالات منتشرشده (کار آفلاین)"""
+    config = settings.SPELLING_CORRECTION
+    counts = Counter()
+    published = DjangoArticle.objects.filter(status='published').values_list('title', 'content')
+    for title, content in published.iterator(chunk_size=500):
+        counts.update(tokenize(title))
+        counts.update(tokenize(content))
+
+    speller = SymSpell(max_edit_distance=config.get('MAX_EDIT_DISTANCE', 2))
+    for word, count in counts.most_common(config.get('VOCABULARY_SIZE', 20000)):
+        if count < config.get('MIN_WORD_COUNT', 2):
+            break
+        # اعداد و کلمات تک‌حرفی ارزش اصلاح ندارند
+        if len(word) > 1 and not word.isdigit():
+            speller.add_word(word, count)
+    return speller
+
+
+def save_vocabulary(speller: SymSpell, path: Optional[str] = None) -> Path:
+    """ذخیره اتمی واژگان تا پروسه‌های در حال خواندن فایل نیمه‌کاره نبینند"""
+    path = Path(path or settings.SPELLING_CORRECTION['VOCABULARY_PATH'])
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(speller, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+    return path
+
+
+_corrector: Optional[SymSpellCorrector] = None
+_corrector_lock = threading.Lock()
+
+
+def get_spelling_corrector() -> SymSpellCorrector:
+    """واژگان مشترک در سطح پروسه"""
+    global _corrector
+    if _corrector is None:
+        with _corrector_lock:
+            if _corrector is None:
+                _corrector = SymSpellCorrector()
+    return _corrector
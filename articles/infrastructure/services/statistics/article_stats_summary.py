@@ -0,0 +1,85 @@
+# infrastructure/services/statistics/article_stats_summary.py
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional
+from django.db.models import Q, Sum
+from django.utils import timezone
+from infrastructure.repositories.article.models import DjangoArticleDailyStats, DjangoArticleStats
+from infrastructure.repositories.bulk_upsert import bulk_upsert
+
+SERIES_DAYS = 30
+WINDOWS = {'views_7d': 7, 'views_30d': 30, 'views_365d': 365}
+SUMMARY_FIELDS = (
+    'view_count', 'unique_view_count', 'share_count', 'average_read_time', 'average_scroll_depth',
+    'views_7d', 'views_30d', 'views_365d', 'daily_series', 'computed_on', 'updated_at'
+)
+
+
+def refresh_article_stats(
+    article_ids: Optional[Iterable[str]] = None,
+    today: Optional[date] = None,
+    batch_size: int = 500
+) -> List[Dict]:
+    """
+    بازسازی ردیف خلاصه آمار مقالات از روی آمار روزانه
+
+    برای هر بسته از مقالات یک کوئری تجمیعی (مجموع‌ها و بازه‌های ۷/۳۰/۳۶۵ روزه با
+    SUM ... FILTER)، یک کوئری برای سری ۳۰ روزه و یک upsert اجرا می‌شود.
+    Args:
+        article_ids: مقالات تغییرکرده؛ None یعنی همه مقالاتی که آمار دارند (اجرای روزانه)
+    Returns:
+        List[Dict]: ردیف‌های خلاصه نوشته‌شده
+    """
+    today = today or timezone.localdate()
+    if article_ids is None:
+        article_ids = DjangoArticleDailyStats.objects.values_list(
+            'article_id', flat=True
+        ).distinct().order_by('article_id')
+    article_ids = [str(article_id) for article_id in article_ids]
+
+    written = []
+    for start in range(0, len(article_ids), batch_size):
+        rows = _summarize(article_ids[start:start + batch_size], today)
+        bulk_upsert(DjangoArticleStats, rows, unique_fields=('article',), replace_fields=SUMMARY_FIELDS)
+        written.extend(rows)
+    return written
+
+
+def _summarize(article_ids: List[str], today: date) -> List[Dict]:
+    daily = DjangoArticleDailyStats.objects.filter(article_id__in=article_ids)
+    totals = daily.values('article_id').annotate(
+        views=Sum('view_count'),
+        unique_views=Sum('unique_view_count'),
+        shares=Sum('share_count'),
+        read_time=Sum('read_time_total'),
+        reads=Sum('read_count'),
+        scroll_depth=Sum('scroll_depth_total'),
+        scrolls=Sum('scroll_count'),
+        **{
+            name: Sum('view_count', filter=Q(date__gt=today - timedelta(days=days)))
+            for name, days in WINDOWS.items()
+        }
+    ).order_by()
+
+    series = defaultdict(list)
+    for article_id, day, views, unique_views in daily.filter(
+        date__gt=today - timedelta(days=SERIES_DAYS)
+    ).order_by('article_id', '-date').values_list('article_id', 'date', 'view_count', 'unique_view_count'):
+        series[article_id].append({'date': day.isoformat(), 'views': views, 'unique_views': unique_views})
+
+    now = timezone.now()
+    return [
+        {
+            'article': row['article_id'],
+            'view_count': row['views'] or 0,
+            'unique_view_count': row['unique_views'] or 0,
+            'share_count': row['shares'] or 0,
+            'average_read_time': (row['read_time'] or 0) / row['reads'] if row['reads'] else 0,
+            'average_scroll_depth': (row['scroll_depth'] or 0) / row['scrolls'] if row['scrolls'] else 0,
+            **{name: row[name] or 0 for name in WINDOWS},
+            'daily_series': series.get(row['article_id'], []),
+            'computed_on': today,
+            'updated_at': now
+        }
+        for row in totals
+    ]
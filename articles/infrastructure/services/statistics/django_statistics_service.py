@@ -1,49 +1,387 @@
-from django.db import models
-from datetime import datetime, timedelta
+import logging
+import uuid
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, models
+from django.db.models import Count, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from datetime import timedelta
 from typing import Dict, List, Optional
 from application.interfaces.services.statistics_service import StatisticsService
-from articles.domain.models.search import DjangoSearchLog
-from domain.entities.article_stats import ArticleStats
+from domain.models.search import DjangoSearchLog, DjangoSearchQueryRollup
+from domain.services.engagement_scoring import EngagementWeights, engagement_scores, top_k
+from domain.value_objects.article_status import ArticleStatus
+from domain.value_objects.comment_status import CommentStatus
+from infrastructure.repositories.article.models import (
+    DjangoArticle,
+    DjangoArticleCategory,
+    DjangoArticleDailyStats,
+    DjangoArticleStats,
+    DjangoCategory
+)
+from infrastructure.repositories.bulk_upsert import bulk_upsert
+from infrastructure.repositories.comment.models import DjangoComment
+from infrastructure.repositories.search.search_log_buffer import get_search_log_buffer
+from infrastructure.services.statistics.article_stats_summary import refresh_article_stats
+from infrastructure.services.statistics.popularity_leaderboard import (
+    RedisPopularityLeaderboard,
+    get_popularity_leaderboard
+)
+from infrastructure.services.statistics.site_stats import COUNTER_FIELDS, get_site_snapshot
+from infrastructure.services.statistics.stats_cache import stats_cache_key
+from infrastructure.services.statistics.timeseries_sync import get_timeseries_store
+from infrastructure.services.statistics.view_counter import get_view_counter
+
+logger = logging.getLogger(__name__)
 
 class DjangoStatisticsService(StatisticsService):
     """پیاده‌سازی سرویس آمار با استفاده از Django ORM"""
     
-    def record_article_view(self, article_id: str) -> bool:
+    def record_article_view(self, article_id: str, viewer_id: Optional[str] = None) -> bool:
+        # شمارش در Redis؛ ثبت در دیتابیس به صورت گروهی با flush_article_views انجام می‌شود
         try:
-            stats, created = ArticleStats.objects.get_or_create(
-                article_id=article_id,
-                date=datetime.now().date()
-            )
-            stats.view_count = models.F('view_count') + 1
-            stats.save()
+            get_view_counter().record(article_id, viewer_id)
             return True
-        except Exception:
-            return False
-
-    def record_search(self, query: str, result_count: int) -> bool:
+        except Exception as e:
+            logger.warning(f"View counter unavailable, writing view directly: {str(e)}")
         try:
-            DjangoSearchLog.objects.create(
-                query=query,
-                result_count=result_count,
-                timestamp=datetime.now()
+            bulk_upsert(
+                DjangoArticleDailyStats,
+                [{'article': article_id, 'date': timezone.localdate(), 'view_count': 1}],
+                unique_fields=('article', 'date'),
+                add_fields=('view_count',)
             )
             return True
         except Exception:
             return False
 
+    def record_search(self, query: str, result_count: int) -> bool:
+        # ثبت در بافر؛ درج در دیتابیس به صورت گروهی و خارج از درخواست انجام می‌شود
+        return get_search_log_buffer().add(DjangoSearchLog(
+            query=query,
+            results_count=result_count,
+            timestamp=timezone.now()
+        ))
+
     def get_article_stats(self, article_id: str) -> Dict:
-        stats = ArticleStats.objects.filter(article_id=article_id)
-        
-        total_views = stats.aggregate(models.Sum('view_count'))['view_count__sum'] or 0
-        avg_read_time = stats.aggregate(models.Avg('read_time'))['read_time__avg'] or 0
-        
+        """
+        آمار یک مقاله از ردیف خلاصه از پیش محاسبه‌شده
+        ردیف در هر flush بازدیدها به‌روز می‌شود؛ اگر وجود نداشته باشد یا بازه‌های غلتان
+        آن مربوط به روزهای قبل باشد، همین‌جا برای این مقاله بازسازی می‌شود
+        """
+        today = timezone.localdate()
+        summary = DjangoArticleStats.objects.filter(article_id=article_id).values(
+            'view_count', 'unique_view_count', 'average_read_time', 'average_scroll_depth',
+            'views_7d', 'views_30d', 'views_365d', 'daily_series', 'computed_on'
+        ).first()
+        if summary is None or summary['computed_on'] < today:
+            rows = refresh_article_stats([article_id], today)
+            summary = rows[0] if rows else {}
+
         return {
-            'total_views': total_views,
-            'average_read_time': avg_read_time,
-            'daily_stats': [
-                {'date': s.date, 'views': s.view_count}
-                for s in stats.order_by('-date')[:30]
+            'total_views': summary.get('view_count', 0),
+            # جمع بازدیدکنندگان یکتای روزانه (یک نفر در دو روز دو بار شمرده می‌شود)
+            'unique_views': summary.get('unique_view_count', 0),
+            'average_read_time': summary.get('average_read_time', 0),
+            'average_scroll_depth': summary.get('average_scroll_depth', 0),
+            'views_7d': summary.get('views_7d', 0),
+            'views_30d': summary.get('views_30d', 0),
+            'views_365d': summary.get('views_365d', 0),
+            'daily_stats': summary.get('daily_series', [])
+        }
+
+    def get_popular_articles(self, time_range: str = 'week', limit: int = 5) -> List[Dict]:
+        """
+        پربازدیدترین مقالات منتشرشده بازه از جدول‌های Redis
+        اگر Redis در دسترس نباشد، از آمار دیتابیس با ORDER BY ... LIMIT محاسبه می‌شود
+        """
+        if time_range not in RedisPopularityLeaderboard.TIME_RANGES:
+            raise ValueError(f"Unknown time range: {time_range}")
+        # مقالات منتشرنشده یا حذف‌شده ممکن است هنوز در جدول باشند؛ کمی بیشتر خوانده می‌شود
+        try:
+            ranked = get_popularity_leaderboard().top(time_range, limit * 2)
+        except Exception as e:
+            logger.warning(f"Popularity leaderboard unavailable, using database: {str(e)}")
+            ranked = self._popular_from_database(time_range, limit * 2)
+
+        titles = {
+            str(article_id): title
+            for article_id, title in DjangoArticle.objects.filter(
+                id__in=[article_id for article_id, _ in ranked],
+                status=ArticleStatus.PUBLISHED.value
+            ).values_list('id', 'title')
+        }
+        return [
+            {'article_id': article_id, 'title': titles[article_id], 'views': round(score, 2)}
+            for article_id, score in ranked if article_id in titles
+        ][:limit]
+
+    def _popular_from_database(self, time_range: str, limit: int) -> List[tuple]:
+        if time_range == 'all':
+            rows = DjangoArticleStats.objects.order_by('-view_count').values_list(
+                'article_id', 'view_count'
+            )[:limit]
+        else:
+            days = RedisPopularityLeaderboard.WINDOW_DAYS.get(time_range, 7)
+            rows = DjangoArticleDailyStats.objects.filter(
+                date__gt=timezone.localdate() - timedelta(days=days)
+            ).values('article_id').annotate(views=Sum('view_count')).order_by(
+                '-views'
+            ).values_list('article_id', 'views')[:limit]
+        return [(str(article_id), views) for article_id, views in rows]
+
+    def get_author_stats(self, author_id: str) -> Dict:
+        """
+        گزارش عملکرد نویسنده با یک کوئری تجمیعی
+        بازدیدها و نظرات با زیرکوئری‌های همبسته جمع می‌شوند تا join دو رابطه یک‌به‌چند
+        ردیف‌ها را چند برابر نکند؛ نتیجه تا ثبت گروهی بعدی آمار کش می‌شود
+        """
+        cache_key = stats_cache_key('author', author_id)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        views = DjangoArticleDailyStats.objects.filter(
+            article=OuterRef('pk')
+        ).values('article').annotate(total=Sum('view_count')).values('total')
+        comments = DjangoComment.objects.filter(
+            article=OuterRef('pk'),
+            status=CommentStatus.APPROVED.value
+        ).values('article').annotate(total=Count('id')).values('total')
+
+        rows = DjangoArticle.objects.filter(author_id=author_id).annotate(
+            views=Coalesce(Subquery(views), 0),
+            comments=Coalesce(Subquery(comments), 0)
+        ).order_by('-published_at', '-created_at').values(
+            'id', 'title', 'status', 'published_at', 'views', 'comments'
+        )
+
+        stats = {
+            'total_articles': 0,
+            'published_articles': 0,
+            'total_views': 0,
+            'total_comments': 0,
+            'articles': []
+        }
+        for row in rows:
+            stats['total_articles'] += 1
+            if row['status'] == ArticleStatus.PUBLISHED.value:
+                stats['published_articles'] += 1
+            stats['total_views'] += row['views']
+            stats['total_comments'] += row['comments']
+            stats['articles'].append({
+                'article_id': str(row['id']),
+                'title': row['title'],
+                'views': row['views'],
+                'comments': row['comments'],
+                'published_at': row['published_at'].isoformat() if row['published_at'] else None
+            })
+
+        cache.set(cache_key, stats, settings.CACHE_TTL.get('AUTHOR_STATS', 600))
+        return stats
+
+    def get_category_stats(self, category_id: str, trending_limit: int = 5) -> Dict:
+        """
+        آمار یک دسته‌بندی و زیردسته‌های آن با دو کوئری تجمیعی
+        زیردسته‌ها با CTE بازگشتی در همان کوئری پیدا می‌شوند و مقالات پربازدید
+        با ORDER BY ... LIMIT در دیتابیس انتخاب می‌شوند
+        """
+        cache_key = stats_cache_key('category', category_id, trending_limit)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        articles = DjangoArticle._meta.db_table
+        daily_stats = DjangoArticleDailyStats._meta.db_table
+        comments = DjangoComment._meta.db_table
+        category_pk = DjangoCategory._meta.pk
+        # مقالات منتشرشده دسته و همه زیردسته‌ها (هر مقاله یک بار)؛ ریشه خود شناسه
+        # است نه ردیف جدول categories تا دسته‌ای که ردیف ندارد هم آمار داشته باشد
+        category_articles = f"""
+            WITH RECURSIVE tree(id) AS (
+                SELECT CAST(%s AS {category_pk.db_type(connection)})
+                UNION
+                SELECT child.id FROM {DjangoCategory._meta.db_table} child
+                JOIN tree ON child.parent_id = tree.id
+            ),
+            category_articles AS (
+                SELECT DISTINCT ac.article_id
+                FROM {DjangoArticleCategory._meta.db_table} ac
+                JOIN tree ON ac.category_id = tree.id
+                JOIN {articles} a ON a.id = ac.article_id AND a.status = %s
+            )
+        """
+        params = [
+            category_pk.get_db_prep_value(category_id, connection),
+            ArticleStatus.PUBLISHED.value
+        ]
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                {category_articles}
+                SELECT
+                    (SELECT COUNT(*) FROM category_articles),
+                    (SELECT COALESCE(SUM(s.view_count), 0) FROM {daily_stats} s
+                     JOIN category_articles ca ON s.article_id = ca.article_id),
+                    (SELECT COUNT(*) FROM {comments} c
+                     JOIN category_articles ca ON c.article_id = ca.article_id
+                     WHERE c.status = %s)
+                """,
+                params + [CommentStatus.APPROVED.value]
+            )
+            total_articles, total_views, total_comments = cursor.fetchone()
+
+            # نظرات فقط برای همان چند مقاله برتر شمرده می‌شوند
+            cursor.execute(
+                f"""
+                {category_articles},
+                top_articles AS (
+                    SELECT ca.article_id, COALESCE(SUM(s.view_count), 0) AS views
+                    FROM category_articles ca
+                    LEFT JOIN {daily_stats} s ON s.article_id = ca.article_id
+                    GROUP BY ca.article_id
+                    ORDER BY views DESC, ca.article_id
+                    LIMIT %s
+                )
+                SELECT a.id, a.title, top_articles.views,
+                    (SELECT COUNT(*) FROM {comments} c
+                     WHERE c.article_id = a.id AND c.status = %s)
+                FROM top_articles
+                JOIN {articles} a ON a.id = top_articles.article_id
+                ORDER BY top_articles.views DESC, a.id
+                """,
+                params + [trending_limit, CommentStatus.APPROVED.value]
+            )
+            trending = [
+                {
+                    'article_id': str(uuid.UUID(str(article_id))),
+                    'title': title,
+                    'views': views,
+                    'comments': comment_count
+                }
+                for article_id, title, views, comment_count in cursor.fetchall()
             ]
+
+        stats = {
+            'total_articles': total_articles,
+            'total_views': total_views,
+            'total_comments': total_comments,
+            'trending_articles': trending
         }
+        cache.set(cache_key, stats, settings.CACHE_TTL.get('CATEGORY_STATS', 600))
+        return stats
+
+    def get_engagement_weights(self) -> EngagementWeights:
+        return EngagementWeights.from_dict(settings.ENGAGEMENT_SCORING)
+
+    def get_engagement_leaderboard(self, days: int = 30, limit: int = 10) -> List[Dict]:
+        """
+        پرتعامل‌ترین مقالات منتشرشده در بازه اخیر
+        معیارهای همه مقالات یک‌جا از سری زمانی آرایه‌ای خوانده و به صورت برداری نمره‌دهی
+        می‌شوند؛ فقط برای همان چند مقاله برتر به دیتابیس مراجعه می‌شود
+        """
+        cache_key = stats_cache_key('engagement', days, limit)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        store = get_timeseries_store()
+        article_ids = store.article_ids
+        end = timezone.localdate()
+        start = end - timedelta(days=days - 1)
+        views = store.totals('views', start, end)
+        comments = store.totals('comments', start, end)
+        read_time = store.totals('read_time', start, end)
+        reads = store.totals('reads', start, end)
+        avg_read_time = np.divide(read_time, reads, out=np.zeros_like(read_time), where=reads > 0)
+        scores = engagement_scores(views, comments, avg_read_time, self.get_engagement_weights())
+
+        # مقالات منتشرنشده هم در سری زمانی هستند؛ نامزدها تا پر شدن لیست دو برابر می‌شوند
+        leaderboard = []
+        k = limit * 2
+        while True:
+            candidates = top_k(scores, k)
+            titles = dict(DjangoArticle.objects.filter(
+                id__in=[article_ids[row] for row in candidates],
+                status=ArticleStatus.PUBLISHED.value
+            ).values_list('id', 'title'))
+            titles = {str(article_id): title for article_id, title in titles.items()}
+            leaderboard = [
+                {
+                    'article_id': article_ids[row],
+                    'title': titles[article_ids[row]],
+                    'score': round(float(scores[row]), 2),
+                    'views': int(views[row]),
+                    'comments': int(comments[row]),
+                    'average_read_time': float(avg_read_time[row])
+                }
+                for row in candidates if article_ids[row] in titles
+            ][:limit]
+            if len(leaderboard) >= limit or k >= len(scores):
+                break
+            k *= 2
+
+        cache.set(cache_key, leaderboard, settings.CACHE_TTL.get('ENGAGEMENT_LEADERBOARD', 600))
+        return leaderboard
+
+    def get_site_stats(self) -> Dict:
+        """
+        آمار کلی سایت از snapshot از پیش محاسبه‌شده (بدون COUNT روی جدول‌ها)
+        computed_at زمان آخرین بازشماری کامل و updated_at زمان آخرین اعمال تغییرات است
+        """
+        snapshot = get_site_snapshot()
+        return {
+            **{field: snapshot[field] for field in COUNTER_FIELDS},
+            'computed_at': snapshot['computed_at'].isoformat(),
+            'updated_at': snapshot['updated_at'].isoformat()
+        }
+
+    def get_comment_stats(self, article_id: Optional[str] = None) -> Dict:
+        """
+        آمار نظرات؛ آمار کل سایت از snapshot و آمار یک مقاله با یک کوئری تجمیعی
+        روی ایندکس (article, status)
+        """
+        if article_id is None:
+            snapshot = get_site_snapshot()
+            stats = {'total': snapshot['total_comments']}
+            stats.update({status.value: snapshot[f'{status.value}_comments'] for status in CommentStatus})
+            stats['computed_at'] = snapshot['computed_at'].isoformat()
+            return stats
+
+        return DjangoComment.objects.filter(article_id=article_id).aggregate(
+            total=Count('id'),
+            **{status.value: Count('id', filter=Q(status=status.value)) for status in CommentStatus}
+        )
+
+    def get_search_trends(self, days: int = 7, limit: int = 10) -> List[Dict]:
+        """روندهای جستجو از جداول تجمیعی (بدون GROUP BY روی لاگ خام)"""
+        if days <= 1:
+            granularity = DjangoSearchQueryRollup.HOUR
+            since = timezone.now() - timedelta(days=days)
+        else:
+            granularity = DjangoSearchQueryRollup.DAY
+            since = (timezone.now() - timedelta(days=days)).replace(
+                hour=0, minute=0, second=0, microsecond=0
+            )
+        
+        trends = DjangoSearchQueryRollup.objects.filter(
+            granularity=granularity,
+            bucket_start__gte=since
+        ).values('normalized_query').annotate(
+            count=models.Sum('search_count'),
+            zero_results=models.Sum('zero_result_count')
+        ).order_by('-count')[:limit]
+        
+        return [
+            {
+                'query': item['normalized_query'],
+                'count': item['count'],
+                'zero_result_count': item['zero_results']
+            }
+            for item in trends
+        ]
 
     # سایر متدهای StatisticsService...
\ No newline at end of file
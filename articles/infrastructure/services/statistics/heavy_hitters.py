@@ -0,0 +1,115 @@
+# infrastructure/services/statistics/heavy_hitters.py
+import heapq
+import threading
+import time
+from collections import deque
+from typing import Dict, Hashable, List, Optional, Tuple
+
+
+class SpaceSaving:
+    """
+    الگوریتم Space-Saving برای یافتن تقریبی پرتکرارترین آیتم‌های یک جریان
+    با حافظه ثابت (capacity آیتم). شمارش هر آیتم حداکثر به اندازه error
+    بیشتر از مقدار واقعی است.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        self.capacity = capacity
+        self._counts: Dict[Hashable, int] = {}
+        self._errors: Dict[Hashable, int] = {}
+        self._heap: List[Tuple[int, Hashable]] = []
+
+    def add(self, item: Hashable, count: int = 1) -> None:
+        if item in self._counts:
+            self._counts[item] += count
+        elif len(self._counts) < self.capacity:
+            self._counts[item] = count
+            self._errors[item] = 0
+        else:
+            # جایگزینی کم‌تکرارترین آیتم؛ شمارش آن به عنوان خطای آیتم جدید می‌ماند
+            min_item, min_count = self._pop_min()
+            del self._counts[min_item]
+            del self._errors[min_item]
+            self._counts[item] = min_count + count
+            self._errors[item] = min_count
+        heapq.heappush(self._heap, (self._counts[item], item))
+        if len(self._heap) > self.capacity * 4:
+            self._rebuild_heap()
+
+    def top(self, k: int) -> List[Tuple[Hashable, int, int]]:
+        """k آیتم پرتکرار به صورت (آیتم، شمارش تخمینی، حداکثر خطا)"""
+        items = heapq.nlargest(k, self._counts.items(), key=lambda entry: entry[1])
+        return [(item, count, self._errors[item]) for item, count in items]
+
+    def merge(self, other: 'SpaceSaving') -> None:
+        for item, count in other._counts.items():
+            self.add(item, count)
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def _pop_min(self) -> Tuple[Hashable, int]:
+        # ورودی‌های کهنه heap (شمارش قدیمی) به صورت تنبل کنار گذاشته می‌شوند
+        while True:
+            count, item = heapq.heappop(self._heap)
+            if self._counts.get(item) == count:
+                return item, count
+
+    def _rebuild_heap(self) -> None:
+        self._heap = [(count, item) for item, count in self._counts.items()]
+        heapq.heapify(self._heap)
+
+
+class RollingHeavyHitters:
+    """
+    پرتکرارترین آیتم‌ها در یک پنجره زمانی لغزان
+    هر بازه کوتاه (bucket) یک SpaceSaving جدا دارد و در زمان خواندن ادغام می‌شوند
+    """
+
+    def __init__(
+        self,
+        window_seconds: int = 3600,
+        bucket_seconds: int = 300,
+        capacity: int = 1000
+    ):
+        self.window_seconds = window_seconds
+        self.bucket_seconds = bucket_seconds
+        self.capacity = capacity
+        self._buckets: deque = deque()  # (شروع بازه، SpaceSaving)
+        self._lock = threading.Lock()
+
+    def add(self, item: Hashable, count: int = 1, now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        bucket_start = int(now // self.bucket_seconds) * self.bucket_seconds
+        with self._lock:
+            self._expire(now)
+            if not self._buckets or self._buckets[-1][0] != bucket_start:
+                self._buckets.append((bucket_start, SpaceSaving(self.capacity)))
+            self._buckets[-1][1].add(item, count)
+
+    def top(self, k: int, now: Optional[float] = None) -> List[Tuple[Hashable, int]]:
+        now = time.time() if now is None else now
+        with self._lock:
+            self._expire(now)
+            merged = SpaceSaving(self.capacity)
+            for _, summary in self._buckets:
+                merged.merge(summary)
+        return [(item, count) for item, count, _ in merged.top(k)]
+
+    def _expire(self, now: float) -> None:
+        while self._buckets and self._buckets[0][0] + self.bucket_seconds <= now - self.window_seconds:
+            self._buckets.popleft()
+
+
+_search_trends: Optional[RollingHeavyHitters] = None
+_search_trends_lock = threading.Lock()
+
+
+def get_search_trend_tracker() -> RollingHeavyHitters:
+    """ردیاب پرتکرارترین جستجوهای اخیر در سطح پروسه"""
+    global _search_trends
+    if _search_trends is None:
+        with _search_trends_lock:
+            if _search_trends is None:
+                _search_trends = RollingHeavyHitters()
+    return _search_trends
@@ -0,0 +1,137 @@
+# infrastructure/services/statistics/popularity_leaderboard.py
+import threading
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+from django.conf import settings
+from django.utils import timezone
+
+
+class RedisPopularityLeaderboard:
+    """
+    جدول پربازدیدترین مقالات با sorted set های Redis
+
+    هر بازدید امتیاز مقاله را در sorted set همان روز و در جدول «همه زمان‌ها» زیاد
+    می‌کند. جدول هر بازه (هفته، ماه، سال) با ZUNIONSTORE روزهای آن ساخته و برای مدت
+    کوتاهی نگه داشته می‌شود؛ خواندن از آن با ZREVRANGE از مرتبه O(log n + k) است.
+    حالت trending همان اجتماع روزهای اخیر است با وزنی که با هر نیمه‌عمر نصف می‌شود.
+    """
+
+    KEY_PREFIX = 'stats:popular:'
+    WINDOW_DAYS = {'day': 1, 'week': 7, 'month': 30, 'year': 365}
+    TIME_RANGES = (*WINDOW_DAYS, 'all', 'trending')
+
+    def __init__(
+        self,
+        redis=None,
+        retention_days: int = 366,
+        trending_days: int = 7,
+        trending_half_life_days: float = 1.0,
+        window_ttl: Optional[Dict[str, int]] = None
+    ):
+        self._redis = redis
+        self.retention_days = retention_days
+        self.trending_days = trending_days
+        self.trending_half_life_days = trending_half_life_days
+        # اجتماع‌های بزرگ‌تر پرهزینه‌ترند و کمتر تغییر می‌کنند؛ بیشتر نگه داشته می‌شوند
+        self.window_ttl = {'week': 60, 'month': 5 * 60, 'year': 60 * 60, 'trending': 60, **(window_ttl or {})}
+
+    @property
+    def redis(self):
+        if self._redis is None:
+            from django_redis import get_redis_connection
+            self._redis = get_redis_connection('default')
+        return self._redis
+
+    def record(self, article_id: str, count: int = 1, day: Optional[date] = None, pipe=None) -> None:
+        """
+        افزایش امتیاز مقاله؛ با pipe دستورها به pipeline فراخواننده اضافه می‌شوند
+        تا بازدید همچنان یک رفت‌وبرگشت باشد
+        """
+        day = day or timezone.localdate()
+        target = pipe if pipe is not None else self.redis.pipeline()
+        target.zincrby(self._day_key(day), count, article_id)
+        target.expire(self._day_key(day), self.retention_days * 24 * 60 * 60)
+        target.zincrby(self._all_key(), count, article_id)
+        if pipe is None:
+            target.execute()
+
+    def top(self, time_range: str = 'week', limit: int = 5, offset: int = 0) -> List[Tuple[str, float]]:
+        """
+        (شناسه مقاله، امتیاز) برترین مقالات بازه به ترتیب نزولی
+        Args:
+            time_range: day/week/month/year/all/trending
+        """
+        if time_range not in self.TIME_RANGES:
+            raise ValueError(f"Unknown time range: {time_range}")
+        key = self._window_key(time_range, timezone.localdate())
+        rows = self.redis.zrevrange(key, offset, offset + limit - 1, withscores=True)
+        return [
+            (member.decode() if isinstance(member, bytes) else member, score)
+            for member, score in rows
+        ]
+
+    def replace_scores(self, scores: Dict[str, float], day: Optional[date] = None, chunk_size: int = 1000) -> None:
+        """
+        جایگزینی کامل جدول یک روز (یا با day=None جدول همه زمان‌ها)
+        برای ساختن دوباره جدول‌ها از روی آمار دیتابیس
+        """
+        key = self._all_key() if day is None else self._day_key(day)
+        items = list(scores.items())
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.delete(key)
+        for start in range(0, len(items), chunk_size):
+            pipe.zadd(key, dict(items[start:start + chunk_size]))
+        if day is not None:
+            pipe.expire(key, self.retention_days * 24 * 60 * 60)
+        pipe.execute()
+
+    def _window_key(self, time_range: str, today: date) -> str:
+        if time_range == 'all':
+            return self._all_key()
+        if time_range == 'day':
+            return self._day_key(today)
+
+        if time_range == 'trending':
+            days = self.trending_days
+            weights = {
+                self._day_key(today - timedelta(days=age)): 0.5 ** (age / self.trending_half_life_days)
+                for age in range(days)
+            }
+        else:
+            days = self.WINDOW_DAYS[time_range]
+            weights = {self._day_key(today - timedelta(days=age)): 1 for age in range(days)}
+
+        key = f'{self.KEY_PREFIX}{time_range}:{today.isoformat()}'
+        if not self.redis.exists(key):
+            # چند پروسه ممکن است هم‌زمان بسازند؛ نتیجه یکسان است
+            pipe = self.redis.pipeline()
+            pipe.zunionstore(key, weights)
+            pipe.expire(key, self.window_ttl[time_range])
+            pipe.execute()
+        return key
+
+    def _day_key(self, day: date) -> str:
+        return f'{self.KEY_PREFIX}day:{day.isoformat()}'
+
+    def _all_key(self) -> str:
+        return f'{self.KEY_PREFIX}all'
+
+
+_leaderboard: Optional[RedisPopularityLeaderboard] = None
+_leaderboard_lock = threading.Lock()
+
+
+def get_popularity_leaderboard() -> RedisPopularityLeaderboard:
+    """جدول پربازدیدترین‌ها با تنظیمات POPULARITY_LEADERBOARD"""
+    global _leaderboard
+    if _leaderboard is None:
+        with _leaderboard_lock:
+            if _leaderboard is None:
+                config = getattr(settings, 'POPULARITY_LEADERBOARD', {})
+                _leaderboard = RedisPopularityLeaderboard(
+                    retention_days=config.get('RETENTION_DAYS', 366),
+                    trending_days=config.get('TRENDING_DAYS', 7),
+                    trending_half_life_days=config.get('TRENDING_HALF_LIFE_DAYS', 1.0),
+                    window_ttl=config.get('WINDOW_TTL')
+                )
+    return _leaderboard
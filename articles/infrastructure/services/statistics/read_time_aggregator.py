@@ -0,0 +1,149 @@
+# infrastructure/services/statistics/read_time_aggregator.py
+import atexit
+import logging
+import os
+import threading
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+from infrastructure.repositories.article.models import DjangoArticle, DjangoArticleDailyStats
+from infrastructure.repositories.bulk_upsert import bulk_upsert
+from infrastructure.services.statistics.article_stats_summary import refresh_article_stats
+from infrastructure.services.statistics.stats_cache import bump_stats_version
+
+logger = logging.getLogger(__name__)
+
+# ترتیب مجموع‌های هر کلید در _pending
+_FIELDS = ('read_time_total', 'read_count', 'scroll_depth_total', 'scroll_count')
+
+
+class ReadTimeAggregator:
+    """
+    جمع زمان مطالعه و عمق اسکرول مقالات در حافظه و ثبت گروهی در آمار روزانه
+
+    هر رویداد فقط چهار جمع در دیکشنری (مقاله، روز) را زیاد می‌کند؛ یک ریسمان پس‌زمینه
+    در هر بازه flush همه مجموع‌ها را با یک upsert جمع‌شونده در دیتابیس می‌نویسد.
+    تعداد کلیدها با تعداد مقالات خوانده‌شده رشد می‌کند نه با تعداد رویدادها.
+    """
+
+    def __init__(self, flush_interval: float = 10.0, max_pending_keys: int = 100000):
+        self.flush_interval = flush_interval
+        self.max_pending_keys = max_pending_keys
+        self.dropped_count = 0
+        self._pending: Dict[Tuple[str, date], List[float]] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+
+    def add(self, article_id: str, read_time: float, scroll_depth: Optional[float] = None) -> bool:
+        """ثبت یک رویداد؛ اگر تعداد کلیدهای در انتظار از سقف گذشته باشد رویداد دور ریخته می‌شود"""
+        self._ensure_worker()
+        key = (str(article_id), timezone.localdate())
+        with self._lock:
+            sums = self._pending.get(key)
+            if sums is None:
+                if len(self._pending) >= self.max_pending_keys:
+                    self.dropped_count += 1
+                    return False
+                sums = self._pending[key] = [0.0, 0, 0.0, 0]
+            sums[0] += read_time
+            sums[1] += 1
+            if scroll_depth is not None:
+                sums[2] += scroll_depth
+                sums[3] += 1
+        return True
+
+    def flush(self) -> int:
+        """ثبت همه مجموع‌های در انتظار؛ تعداد ردیف‌های مقاله/روز نوشته‌شده را برمی‌گرداند"""
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            if not pending:
+                return 0
+            try:
+                close_old_connections()
+                # شناسه‌های نامعتبر کل upsert را با خطای کلید خارجی شکست می‌دهند
+                existing = {
+                    str(article_id) for article_id in DjangoArticle.objects.filter(
+                        id__in={article_id for article_id, _ in pending}
+                    ).values_list('id', flat=True)
+                }
+                rows = [
+                    {'article': article_id, 'date': day, **dict(zip(_FIELDS, sums))}
+                    for (article_id, day), sums in pending.items()
+                    if article_id in existing
+                ]
+                bulk_upsert(
+                    DjangoArticleDailyStats,
+                    rows,
+                    unique_fields=('article', 'date'),
+                    add_fields=_FIELDS
+                )
+                if rows:
+                    refresh_article_stats({row['article'] for row in rows})
+                    bump_stats_version()
+                return len(rows)
+            except Exception:
+                logger.exception("Failed to flush read time for %d articles", len(pending))
+                self._merge_back(pending)
+                return 0
+
+    def shutdown(self) -> None:
+        """توقف ریسمان پس‌زمینه و ثبت باقی‌مانده‌ها"""
+        self._stopped.set()
+        if self._thread and self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.flush_interval)
+        self.flush()
+
+    def _merge_back(self, pending: Dict[Tuple[str, date], List[float]]) -> None:
+        with self._lock:
+            for key, sums in pending.items():
+                current = self._pending.get(key)
+                if current is None:
+                    if len(self._pending) >= self.max_pending_keys:
+                        self.dropped_count += 1
+                        continue
+                    self._pending[key] = sums
+                else:
+                    for index, value in enumerate(sums):
+                        current[index] += value
+
+    def _ensure_worker(self) -> None:
+        # ریسمانی که پیش از fork ساخته شده در پروسه فرزند وجود ندارد
+        if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+                return
+            self._pid = os.getpid()
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name='read-time-aggregator', daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(timeout=self.flush_interval):
+            self.flush()
+
+
+_aggregator: Optional[ReadTimeAggregator] = None
+_aggregator_lock = threading.Lock()
+
+
+def get_read_time_aggregator() -> ReadTimeAggregator:
+    """جمع‌کننده زمان مطالعه مشترک پروسه با تنظیمات READ_BEACON"""
+    global _aggregator
+    if _aggregator is None:
+        with _aggregator_lock:
+            if _aggregator is None:
+                config = getattr(settings, 'READ_BEACON', {})
+                _aggregator = ReadTimeAggregator(
+                    flush_interval=config.get('FLUSH_INTERVAL', 10.0),
+                    max_pending_keys=config.get('MAX_PENDING_KEYS', 100000)
+                )
+                atexit.register(_aggregator.shutdown)
+    return _aggregator
@@ -0,0 +1,138 @@
+# infrastructure/services/statistics/site_stats.py
+import logging
+from typing import Dict, Optional
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum
+from django.utils import timezone
+from domain.value_objects.article_status import ArticleStatus
+from domain.value_objects.comment_status import CommentStatus
+from infrastructure.repositories.article.models import DjangoArticle, DjangoArticleStats, DjangoSiteStatsSnapshot
+from infrastructure.repositories.comment.models import DjangoComment
+
+logger = logging.getLogger(__name__)
+
+DELTAS_KEY = 'stats:site:deltas'
+SNAPSHOT_KEY = 'site'
+COUNTER_FIELDS = (
+    'total_articles', 'published_articles', 'total_comments', 'approved_comments',
+    'pending_comments', 'rejected_comments', 'spam_comments', 'total_users', 'total_views'
+)
+
+
+def _redis():
+    from django_redis import get_redis_connection
+    return get_redis_connection('default')
+
+
+def record_site_delta(**deltas: int) -> None:
+    """
+    ثبت تغییر شمارنده‌های داشبورد در Redis (HINCRBY)؛ refresh_site_stats آن‌ها را اعمال می‌کند
+    خطا فقط لاگ می‌شود چون بازشماری کامل دوره‌ای اختلاف را جبران می‌کند
+    """
+    deltas = {field: value for field, value in deltas.items() if value}
+    if not deltas:
+        return
+    try:
+        pipe = _redis().pipeline()
+        for field, value in deltas.items():
+            pipe.hincrby(DELTAS_KEY, field, value)
+        pipe.execute()
+    except Exception as e:
+        logger.warning(f"Failed to record site stats delta {deltas}: {str(e)}")
+
+
+def article_status_delta(status: Optional[str], sign: int) -> Dict[str, int]:
+    return {'published_articles': sign} if status == ArticleStatus.PUBLISHED.value else {}
+
+
+def comment_status_delta(status: Optional[str], sign: int) -> Dict[str, int]:
+    field = f'{status}_comments'
+    return {field: sign} if field in COUNTER_FIELDS else {}
+
+
+def apply_site_deltas() -> Dict[str, int]:
+    """
+    اعمال تغییرات جمع‌شده روی ردیف snapshot با یک UPDATE
+    Returns:
+        Dict[str, int]: تغییرات اعمال‌شده
+    """
+    pipe = _redis().pipeline(transaction=True)
+    pipe.hgetall(DELTAS_KEY)
+    pipe.delete(DELTAS_KEY)
+    raw, _ = pipe.execute()
+    deltas = {
+        (field.decode() if isinstance(field, bytes) else field): int(value)
+        for field, value in raw.items()
+    }
+    deltas = {field: value for field, value in deltas.items() if field in COUNTER_FIELDS and value}
+
+    try:
+        updated = DjangoSiteStatsSnapshot.objects.filter(key=SNAPSHOT_KEY).update(
+            **{field: F(field) + value for field, value in deltas.items()},
+            updated_at=timezone.now()
+        )
+    except Exception:
+        # تغییرات از Redis برداشته شده‌اند؛ برای اجرای بعدی برگردانده می‌شوند
+        _restore_site_deltas(deltas)
+        raise
+    if not updated:
+        recompute_site_stats()
+    return deltas
+
+
+def _restore_site_deltas(deltas: Dict[str, int]) -> None:
+    """برگرداندن تغییرات به Redis وقتی نوشتن در دیتابیس شکست خورده است"""
+    if not deltas:
+        return
+    try:
+        pipe = _redis().pipeline()
+        for field, value in deltas.items():
+            pipe.hincrby(DELTAS_KEY, field, value)
+        pipe.execute()
+    except Exception:
+        logger.exception("Lost site stats deltas %s", deltas)
+
+
+def recompute_site_stats() -> Dict:
+    """
+    بازشماری کامل همه شمارنده‌ها و جایگزینی snapshot
+    تغییرات جمع‌شده قبل از شمارش دور ریخته می‌شوند چون در نتیجه شمارش حساب شده‌اند
+    """
+    try:
+        _redis().delete(DELTAS_KEY)
+    except Exception as e:
+        logger.warning(f"Failed to reset site stats deltas: {str(e)}")
+
+    articles = DjangoArticle.objects.aggregate(
+        total_articles=Count('id'),
+        published_articles=Count('id', filter=Q(status=ArticleStatus.PUBLISHED.value))
+    )
+    comments = DjangoComment.objects.aggregate(
+        total_comments=Count('id'),
+        **{
+            f'{status.value}_comments': Count('id', filter=Q(status=status.value))
+            for status in CommentStatus
+        }
+    )
+    values = {
+        **articles,
+        **comments,
+        'total_users': get_user_model().objects.count(),
+        'total_views': DjangoArticleStats.objects.aggregate(total=Sum('view_count'))['total'] or 0,
+    }
+    now = timezone.now()
+    with transaction.atomic():
+        DjangoSiteStatsSnapshot.objects.update_or_create(
+            key=SNAPSHOT_KEY,
+            defaults={**values, 'computed_at': now, 'updated_at': now}
+        )
+    return {**values, 'computed_at': now, 'updated_at': now}
+
+
+def get_site_snapshot() -> Dict:
+    """آخرین snapshot؛ اگر هنوز ساخته نشده باشد یک بار بازشماری می‌شود"""
+    snapshot = DjangoSiteStatsSnapshot.objects.filter(key=SNAPSHOT_KEY).values(
+        *COUNTER_FIELDS, 'computed_at', 'updated_at'
+    ).first()
+    return snapshot if snapshot is not None else recompute_site_stats()
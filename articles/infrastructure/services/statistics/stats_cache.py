@@ -0,0 +1,25 @@
+# infrastructure/services/statistics/stats_cache.py
+from django.core.cache import cache
+
+# نسخه آمار؛ با هر ثبت گروهی آمار افزایش می‌یابد و کلیدهای کش قبلی خودبه‌خود بی‌اثر می‌شوند
+STATS_VERSION_KEY = 'stats:version'
+
+
+def get_stats_version() -> int:
+    version = cache.get(STATS_VERSION_KEY)
+    if version is None:
+        cache.add(STATS_VERSION_KEY, 1, None)
+        version = cache.get(STATS_VERSION_KEY) or 1
+    return version
+
+
+def bump_stats_version() -> None:
+    """بی‌اعتبار کردن همه گزارش‌های آماری کش‌شده پس از ثبت آمار جدید"""
+    try:
+        cache.incr(STATS_VERSION_KEY)
+    except ValueError:
+        cache.add(STATS_VERSION_KEY, 1, None)
+
+
+def stats_cache_key(name: str, *parts) -> str:
+    return ':'.join(['stats', name, *map(str, parts), f'v{get_stats_version()}'])
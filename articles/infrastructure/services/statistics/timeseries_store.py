@@ -0,0 +1,218 @@
+# infrastructure/services/statistics/timeseries_store.py
+import calendar
+import json
+import os
+import threading
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+
+
+class ArticleTimeSeriesStore:
+    """
+    ذخیره آمار روزانه مقالات به صورت آرایه‌های عددی پیوسته
+
+    برای هر ماه و هر معیار یک فایل .npy با شکل (تعداد مقالات، روزهای ماه) نگه داشته
+    می‌شود؛ هر مقاله یک ردیف ثابت دارد (articles.json). خواندن با mmap انجام می‌شود و
+    برش بازه زمانی و جمع روی هزاران مقاله به صورت برداری و بدون ساخت دیکشنری است.
+    """
+
+    METRICS = {
+        'views': np.int32,
+        'read_time': np.float32,  # مجموع زمان مطالعه (ثانیه)
+        'reads': np.int32,        # تعداد مطالعه‌های ثبت‌شده (مخرج میانگین زمان مطالعه)
+        'comments': np.int32,
+    }
+    INDEX_FILE = 'articles.json'
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._index_version: Optional[Tuple[int, int]] = None
+        self._reload_index()
+
+    @property
+    def article_ids(self) -> List[str]:
+        self._reload_index()
+        return list(self._ids)
+
+    def __len__(self) -> int:
+        self._reload_index()
+        return len(self._ids)
+
+    def update(
+        self,
+        metric: str,
+        article_ids: Sequence[str],
+        days: Sequence[date],
+        values: Sequence[float],
+        accumulate: bool = False
+    ) -> None:
+        """
+        نوشتن مقادیر روزانه؛ با accumulate مقادیر به مقدار موجود اضافه می‌شوند
+        (شناسه‌ها و روزهای تکراری هم درست جمع می‌شوند)
+        """
+        if not len(article_ids):
+            return
+        self._check_metric(metric)
+        with self._lock:
+            self._reload_index()
+            rows = self._ensure_rows(article_ids)
+            months = np.array([day.year * 12 + day.month - 1 for day in days])
+            columns = np.array([day.day - 1 for day in days])
+            values = np.asarray(values, dtype=self.METRICS[metric])
+            for month_key in np.unique(months):
+                mask = months == month_key
+                month = date(int(month_key) // 12, int(month_key) % 12 + 1, 1)
+                chunk = self._load_for_write(metric, month)
+                if accumulate:
+                    np.add.at(chunk, (rows[mask], columns[mask]), values[mask])
+                else:
+                    chunk[rows[mask], columns[mask]] = values[mask]
+                self._save(self._chunk_path(metric, month), chunk)
+
+    def clear(self, metric: str, start: date, end: date) -> None:
+        """صفر کردن همه مقالات در بازه [start, end]"""
+        self._check_metric(metric)
+        with self._lock:
+            for month, first, last in self._month_spans(start, end):
+                if self._chunk_path(metric, month).exists():
+                    chunk = self._load_for_write(metric, month)
+                    chunk[:, first:last] = 0
+                    self._save(self._chunk_path(metric, month), chunk)
+
+    def range(
+        self,
+        metric: str,
+        start: date,
+        end: date,
+        article_ids: Optional[Sequence[str]] = None
+    ) -> np.ndarray:
+        """
+        ماتریس (مقالات، روزهای بازه [start, end])؛ ردیف‌ها به ترتیب article_ids
+        یا در صورت None به ترتیب article_ids فروشگاه هستند. مقاله ناشناخته ردیف صفر دارد.
+        """
+        self._check_metric(metric)
+        self._reload_index()
+        selected = None if article_ids is None else np.array(
+            [self._rows.get(article_id, -1) for article_id in article_ids], dtype=np.int64
+        )
+        n_rows = len(self._ids) if selected is None else len(selected)
+        result = np.zeros((n_rows, (end - start).days + 1), dtype=self.METRICS[metric])
+
+        offset = 0
+        for month, first, last in self._month_spans(start, end):
+            path = self._chunk_path(metric, month)
+            if path.exists():
+                chunk = np.load(path, mmap_mode='r')
+                if selected is None:
+                    # فایل ماه ممکن است از ردیف‌های فهرست کمتر یا (پس از نوشتن پروسه دیگر) بیشتر باشد
+                    rows = min(n_rows, chunk.shape[0])
+                    result[:rows, offset:offset + last - first] = chunk[:rows, first:last]
+                else:
+                    # ردیف‌های اضافه‌شده پس از نوشتن این ماه در فایل آن نیستند
+                    present = (selected >= 0) & (selected < chunk.shape[0])
+                    result[present, offset:offset + last - first] = chunk[selected[present], first:last]
+            offset += last - first
+        return result
+
+    def totals(
+        self,
+        metric: str,
+        start: date,
+        end: date,
+        article_ids: Optional[Sequence[str]] = None
+    ) -> np.ndarray:
+        """جمع بازه برای هر مقاله"""
+        return self.range(metric, start, end, article_ids).sum(axis=1, dtype=np.float64)
+
+    def daily_totals(self, metric: str, start: date, end: date) -> np.ndarray:
+        """جمع همه مقالات برای هر روز بازه"""
+        return self.range(metric, start, end).sum(axis=0, dtype=np.float64)
+
+    def top(self, metric: str, start: date, end: date, k: int = 10) -> List[Tuple[str, float]]:
+        """k مقاله با بیشترین مقدار در بازه"""
+        totals = self.totals(metric, start, end)
+        k = min(k, len(totals))
+        if k <= 0:
+            return []
+        candidates = np.argpartition(-totals, k - 1)[:k]
+        ordered = candidates[np.argsort(-totals[candidates], kind='stable')]
+        return [(self._ids[row], float(totals[row])) for row in ordered]
+
+    def _reload_index(self) -> None:
+        """بازخوانی articles.json وقتی پروسه دیگری (مثلا همگام‌سازی) آن را تغییر داده است"""
+        index_path = self.root / self.INDEX_FILE
+        try:
+            stat = index_path.stat()
+        except FileNotFoundError:
+            return
+        # اندازه هم مقایسه می‌شود چون دقت mtime در برخی فایل‌سیستم‌ها یک ثانیه است
+        version = (stat.st_mtime_ns, stat.st_size)
+        if version == self._index_version:
+            return
+        ids = json.loads(index_path.read_text())
+        # ردیف‌ها فقط اضافه می‌شوند؛ فهرست کوتاه‌تر از نسخه در حافظه نادیده گرفته می‌شود
+        if len(ids) >= len(self._ids):
+            self._ids = ids
+            self._rows = {article_id: row for row, article_id in enumerate(ids)}
+        self._index_version = version
+
+    def _ensure_rows(self, article_ids: Iterable[str]) -> np.ndarray:
+        rows = []
+        added = False
+        for article_id in article_ids:
+            article_id = str(article_id)
+            row = self._rows.get(article_id)
+            if row is None:
+                row = self._rows[article_id] = len(self._ids)
+                self._ids.append(article_id)
+                added = True
+            rows.append(row)
+        if added:
+            self.root.mkdir(parents=True, exist_ok=True)
+            self._write_atomic(self.root / self.INDEX_FILE, json.dumps(self._ids).encode())
+            stat = (self.root / self.INDEX_FILE).stat()
+            self._index_version = (stat.st_mtime_ns, stat.st_size)
+        return np.array(rows, dtype=np.int64)
+
+    def _load_for_write(self, metric: str, month: date) -> np.ndarray:
+        shape = (len(self._ids), calendar.monthrange(month.year, month.month)[1])
+        path = self._chunk_path(metric, month)
+        if not path.exists():
+            return np.zeros(shape, dtype=self.METRICS[metric])
+        chunk = np.load(path)
+        if chunk.shape[0] < shape[0]:
+            chunk = np.vstack([chunk, np.zeros((shape[0] - chunk.shape[0], shape[1]), dtype=chunk.dtype)])
+        return chunk
+
+    def _month_spans(self, start: date, end: date):
+        """(اول ماه، ستون شروع، ستون پایان) برای هر ماه بازه"""
+        current = start
+        while current <= end:
+            month_end = date(current.year, current.month, calendar.monthrange(current.year, current.month)[1])
+            last_day = min(end, month_end)
+            yield current.replace(day=1), current.day - 1, last_day.day
+            current = last_day + timedelta(days=1)
+
+    def _chunk_path(self, metric: str, month: date) -> Path:
+        return self.root / f'{month:%Y-%m}' / f'{metric}.npy'
+
+    def _save(self, path: Path, chunk: np.ndarray) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            np.save(f, chunk)
+        os.replace(tmp_path, path)
+
+    def _write_atomic(self, path: Path, data: bytes) -> None:
+        tmp_path = path.with_suffix('.tmp')
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+    def _check_metric(self, metric: str) -> None:
+        if metric not in self.METRICS:
+            raise ValueError(f"Unknown metric: {metric}")
@@ -0,0 +1,73 @@
+# infrastructure/services/statistics/timeseries_sync.py
+import threading
+from datetime import date
+from typing import Dict, Optional
+from django.conf import settings
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+from infrastructure.repositories.article.models import DjangoArticleDailyStats
+from infrastructure.repositories.comment.models import DjangoComment
+from infrastructure.services.statistics.timeseries_store import ArticleTimeSeriesStore
+
+
+def sync_timeseries_from_database(
+    store: ArticleTimeSeriesStore,
+    start: date,
+    end: date,
+    chunk_size: int = 50000
+) -> Dict[str, int]:
+    """
+    بازنویسی بازه [start, end] فروشگاه سری زمانی از روی جدول‌های آمار روزانه و نظرات
+    Returns:
+        Dict[str, int]: تعداد مقادیر نوشته‌شده برای هر معیار
+    """
+    for metric in store.METRICS:
+        store.clear(metric, start, end)
+
+    written = {metric: 0 for metric in store.METRICS}
+    daily = DjangoArticleDailyStats.objects.filter(date__range=(start, end)).values_list(
+        'article_id', 'date', 'view_count', 'read_time_total', 'read_count'
+    )
+    batch = []
+    for row in daily.iterator(chunk_size=chunk_size):
+        batch.append(row)
+        if len(batch) >= chunk_size:
+            _write_daily(store, batch, written)
+            batch = []
+    _write_daily(store, batch, written)
+
+    comments = DjangoComment.objects.filter(created_at__date__range=(start, end)).annotate(
+        day=TruncDate('created_at')
+    ).values('article_id', 'day').annotate(total=Count('id')).order_by().values_list(
+        'article_id', 'day', 'total'
+    )
+    rows = list(comments)
+    if rows:
+        article_ids, days, totals = zip(*rows)
+        store.update('comments', [str(article_id) for article_id in article_ids], days, totals)
+        written['comments'] = len(rows)
+    return written
+
+
+def _write_daily(store: ArticleTimeSeriesStore, batch, written: Dict[str, int]) -> None:
+    if not batch:
+        return
+    article_ids, days, views, read_time, reads = zip(*batch)
+    article_ids = [str(article_id) for article_id in article_ids]
+    for metric, values in (('views', views), ('read_time', read_time), ('reads', reads)):
+        store.update(metric, article_ids, days, values)
+        written[metric] += len(batch)
+
+
+_store: Optional[ArticleTimeSeriesStore] = None
+_store_lock = threading.Lock()
+
+
+def get_timeseries_store() -> ArticleTimeSeriesStore:
+    """فروشگاه سری زمانی مقالات با مسیر تنظیم‌شده در ARTICLE_TIMESERIES"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ArticleTimeSeriesStore(settings.ARTICLE_TIMESERIES['ROOT'])
+    return _store
@@ -0,0 +1,163 @@
+# infrastructure/services/statistics/view_counter.py
+import logging
+import threading
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+from django.conf import settings
+from django.utils import timezone
+from infrastructure.repositories.article.models import DjangoArticleDailyStats
+from infrastructure.repositories.bulk_upsert import bulk_upsert
+from infrastructure.services.statistics.article_stats_summary import refresh_article_stats
+from infrastructure.services.statistics.popularity_leaderboard import get_popularity_leaderboard
+from infrastructure.services.statistics.site_stats import record_site_delta
+from infrastructure.services.statistics.stats_cache import bump_stats_version
+
+logger = logging.getLogger(__name__)
+
+
+class RedisViewCounter:
+    """
+    شمارش بازدید مقالات در Redis و ثبت گروهی در جدول آمار روزانه
+
+    هر بازدید فقط یک رفت‌وبرگشت به Redis است: INCR شمارنده روزانه مقاله، PFADD
+    شناسه بازدیدکننده در HyperLogLog همان روز (بازدیدکنندگان یکتا با خطای حدود ۱٪
+    و حداکثر 12KB برای هر مقاله/روز) و ثبت مقاله/روز در مجموعه «تغییرکرده‌ها».
+    flush دوره‌ای شمارنده‌ها را برمی‌دارد و با یک upsert جمع‌شونده در دیتابیس می‌نویسد؛
+    سپس خلاصه آمار همان مقالات بازسازی می‌شود.
+    """
+
+    KEY_PREFIX = 'stats:views:'
+    DIRTY_KEY = 'stats:views:dirty'
+
+    def __init__(self, redis=None, key_ttl: int = 2 * 24 * 60 * 60, batch_size: int = 1000):
+        self._redis = redis
+        # HyperLogLog تا پایان روز بعد نگه داشته می‌شود تا flush‌های دیرهنگام هم آن را ببینند
+        self.key_ttl = key_ttl
+        self.batch_size = batch_size
+
+    @property
+    def redis(self):
+        if self._redis is None:
+            from django_redis import get_redis_connection
+            self._redis = get_redis_connection('default')
+        return self._redis
+
+    def record(self, article_id: str, viewer_id: Optional[str] = None, day: Optional[date] = None) -> None:
+        """ثبت یک بازدید؛ بازدید مهمان بدون شناسه فقط در تعداد کل شمرده می‌شود"""
+        day = day or timezone.localdate()
+        member = self._member(day, article_id)
+        pipe = self.redis.pipeline()
+        pipe.incr(self._count_key(member))
+        pipe.expire(self._count_key(member), self.key_ttl)
+        if viewer_id:
+            pipe.pfadd(self._unique_key(member), viewer_id)
+            pipe.expire(self._unique_key(member), self.key_ttl)
+        pipe.sadd(self.DIRTY_KEY, member)
+        get_popularity_leaderboard().record(article_id, day=day, pipe=pipe)
+        pipe.execute()
+
+    def flush(self) -> int:
+        """
+        انتقال شمارنده‌های Redis به جدول آمار روزانه
+        Returns:
+            int: تعداد ردیف‌های مقاله/روز ثبت‌شده
+        """
+        written = 0
+        touched = set()
+        while True:
+            members = [
+                member.decode() if isinstance(member, bytes) else member
+                for member in self.redis.spop(self.DIRTY_KEY, self.batch_size) or []
+            ]
+            if not members:
+                break
+            counts = self._take_counts(members)
+            rows = [
+                {
+                    'article': article_id,
+                    'date': day,
+                    'view_count': count,
+                    'unique_view_count': unique_count
+                }
+                for (day, article_id), (count, unique_count) in counts.items()
+            ]
+            try:
+                # تعداد کل به مقدار قبلی اضافه می‌شود؛ PFCOUNT خودش کل روز را می‌شمارد و جایگزین می‌شود
+                bulk_upsert(
+                    DjangoArticleDailyStats,
+                    rows,
+                    unique_fields=('article', 'date'),
+                    add_fields=('view_count',),
+                    replace_fields=('unique_view_count',)
+                )
+            except Exception:
+                logger.exception("Failed to flush %d article view counters", len(rows))
+                self._restore(counts)
+                break
+            written += len(rows)
+            touched.update(article_id for _, article_id in counts)
+            record_site_delta(total_views=sum(row['view_count'] for row in rows))
+            if len(members) < self.batch_size:
+                break
+
+        if touched:
+            refresh_article_stats(touched)
+            bump_stats_version()
+        return written
+
+    def _take_counts(self, members: List[str]) -> Dict[Tuple[date, str], Tuple[int, int]]:
+        # GET و DEL در یک تراکنش؛ بازدیدهای هم‌زمان در شمارنده تازه و flush بعدی می‌آیند
+        pipe = self.redis.pipeline(transaction=True)
+        for member in members:
+            pipe.get(self._count_key(member))
+            pipe.delete(self._count_key(member))
+            pipe.pfcount(self._unique_key(member))
+        results = pipe.execute()
+
+        counts = {}
+        for index, member in enumerate(members):
+            count, _, unique_count = results[index * 3:index * 3 + 3]
+            day, article_id = member.split(':', 1)
+            counts[(date.fromisoformat(day), article_id)] = (int(count or 0), unique_count)
+        return counts
+
+    def _restore(self, counts: Dict[Tuple[date, str], Tuple[int, int]]) -> None:
+        """برگرداندن شمارنده‌ها به Redis وقتی نوشتن در دیتابیس شکست خورده است"""
+        try:
+            pipe = self.redis.pipeline()
+            for (day, article_id), (count, _) in counts.items():
+                member = self._member(day, article_id)
+                if count:
+                    pipe.incrby(self._count_key(member), count)
+                    pipe.expire(self._count_key(member), self.key_ttl)
+                pipe.sadd(self.DIRTY_KEY, member)
+            pipe.execute()
+        except Exception:
+            logger.exception("Lost %d article view counters", len(counts))
+
+    def _member(self, day: date, article_id: str) -> str:
+        return f'{day.isoformat()}:{article_id}'
+
+    def _count_key(self, member: str) -> str:
+        return f'{self.KEY_PREFIX}count:{member}'
+
+    def _unique_key(self, member: str) -> str:
+        return f'{self.KEY_PREFIX}unique:{member}'
+
+
+_counter: Optional[RedisViewCounter] = None
+_counter_lock = threading.Lock()
+
+
+def get_view_counter() -> RedisViewCounter:
+    """شمارنده بازدید مشترک پروسه با تنظیمات VIEW_COUNTER"""
+    global _counter
+    if _counter is None:
+        with _counter_lock:
+            if _counter is None:
+                config = getattr(settings, 'VIEW_COUNTER', {})
+                _counter = RedisViewCounter(
+                    key_ttl=config.get('KEY_TTL', 2 * 24 * 60 * 60),
+                    batch_size=config.get('FLUSH_BATCH_SIZE', 1000)
+                )
+    return _counter
@@ -0,0 +1,8 @@
+from rest_framework.parsers import JSONParser
+
+class PlainTextJSONParser(JSONParser):
+    """
+    بدنه JSON با Content-Type: text/plain
+    navigator.sendBeacon رشته را با text/plain می‌فرستد و نوع دیگری بدون preflight ممکن نیست
+    """
+    media_type = 'text/plain'
@@ -2,6 +2,8 @@ from django.urls import path
 from rest_framework.routers import DefaultRouter
 from interfaces.api.v1.views.article_views import ArticleAPIView
 from interfaces.api.v1.views.comment_views import CommentAPIView, CommentModerationAPIView
+from interfaces.api.v1.views.read_beacon_views import ReadBeaconAPIView
+from interfaces.api.v1.views.search_views import ArticleSearchAPIView
 
 router = DefaultRouter()
 
@@ -18,6 +20,16 @@ extra_urlpatterns = [
         CommentModerationAPIView.as_view(),
         name='comment-moderate'
     ),
+    path(
+        'search/',
+        ArticleSearchAPIView.as_view(),
+        name='article-search'
+    ),
+    path(
+        'stats/read-beacon/',
+        ReadBeaconAPIView.as_view(),
+        name='read-beacon'
+    ),
 ]
 
 def get_urls():
@@ -0,0 +1,24 @@
+from django.conf import settings
+from rest_framework import serializers
+
+class ReadBeaconEventSerializer(serializers.Serializer):
+    """یک رویداد زمان مطالعه از مرورگر"""
+    article_id = serializers.UUIDField()
+    read_time = serializers.FloatField(min_value=0)  # ثانیه
+    scroll_depth = serializers.FloatField(min_value=0, max_value=1, required=False, allow_null=True)
+
+    def validate_read_time(self, value):
+        if value > settings.READ_BEACON.get('MAX_READ_TIME', 2 * 60 * 60):
+            raise serializers.ValidationError('زمان مطالعه غیرعادی است')
+        return value
+
+class ReadBeaconBatchSerializer(serializers.Serializer):
+    """
+    دسته‌ای از رویدادها؛ اعتبارسنجی هر رویداد جداگانه در ویو انجام می‌شود
+    تا یک رویداد نامعتبر بقیه دسته را رد نکند
+    """
+    events = serializers.ListField(
+        child=serializers.DictField(),
+        allow_empty=False,
+        max_length=settings.READ_BEACON.get('MAX_EVENTS_PER_REQUEST', 50)
+    )
@@ -9,7 +9,7 @@ from application.use_cases.article_management.archive_article import ArchiveArti
 from interfaces.api.v1.serializers.article_serializer import ArticleSerializer
 from domain.exceptions.article_errors import ArticleNotFoundError
 from infrastructure.repositories.article.django_article_repository import DjangoArticleRepository
-from infrastructure.services.search.elasticsearch_adapter import ElasticsearchAdapter
+from infrastructure.services.search.resilient_search_service import build_search_service
 
 class ArticleAPIView(APIView):
     permission_classes = [IsAuthenticatedOrReadOnly]
@@ -17,7 +17,7 @@ class ArticleAPIView(APIView):
 
     def __init__(self):
         self.article_repo = DjangoArticleRepository()
-        self.search_service = ElasticsearchAdapter()
+        self.search_service = build_search_service()
         super().__init__()
 
     def get(self, request, article_id=None):
@@ -0,0 +1,68 @@
+import time
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.parsers import JSONParser
+from rest_framework.permissions import AllowAny
+from rest_framework.throttling import ScopedRateThrottle
+from interfaces.api.v1.parsers import PlainTextJSONParser
+from interfaces.api.v1.serializers.read_beacon_serializer import (
+    ReadBeaconBatchSerializer,
+    ReadBeaconEventSerializer
+)
+from infrastructure.services.statistics.read_time_aggregator import get_read_time_aggregator
+
+class ReadBeaconAPIView(APIView):
+    """
+    دریافت گروهی زمان مطالعه و عمق اسکرول (navigator.sendBeacon)
+    رویدادها فقط در حافظه جمع می‌شوند و به صورت دوره‌ای یک‌جا در دیتابیس ثبت می‌شوند
+    بدنه JSON هم با application/json و هم با text/plain (پیش‌فرض sendBeacon برای رشته) پذیرفته می‌شود
+    """
+    # بیکن‌ها توکن JWT ندارند و برای مهمان‌ها هم ارسال می‌شوند؛ محدودیت بر اساس IP است
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    parser_classes = [JSONParser, PlainTextJSONParser]
+    throttle_classes = [ScopedRateThrottle]
+    throttle_scope = 'read_beacon'
+
+    def post(self, request):
+        """ثبت دسته رویدادهای مطالعه"""
+        serializer = ReadBeaconBatchSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        events = serializer.validated_data['events']
+        allowed = self._client_allowance(request, len(events))
+        aggregator = get_read_time_aggregator()
+        accepted = 0
+        for event in events[:allowed]:
+            event_serializer = ReadBeaconEventSerializer(data=event)
+            if event_serializer.is_valid() and aggregator.add(
+                event_serializer.validated_data['article_id'],
+                event_serializer.validated_data['read_time'],
+                event_serializer.validated_data.get('scroll_depth')
+            ):
+                accepted += 1
+
+        return Response(
+            {'accepted': accepted, 'rejected': len(events) - accepted},
+            status=status.HTTP_202_ACCEPTED
+        )
+
+    def _client_allowance(self, request, requested: int) -> int:
+        """
+        تعداد رویدادهای مجاز این کلاینت در پنجره فعلی (سقف رویداد، نه فقط درخواست)
+        بدون دسترسی به کش محدودیتی اعمال نمی‌شود و فقط throttle درخواست‌ها باقی می‌ماند
+        """
+        config = settings.READ_BEACON
+        limit = config.get('MAX_EVENTS_PER_CLIENT', 300)
+        window = config.get('CLIENT_WINDOW', 60)
+        key = f"read_beacon:events:{self.get_throttles()[0].get_ident(request)}:{int(time.time() // window)}"
+        try:
+            cache.add(key, 0, window)
+            used = cache.incr(key, requested)
+        except Exception:
+            return requested
+        return max(0, min(requested, limit - (used - requested)))
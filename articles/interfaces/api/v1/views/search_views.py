@@ -0,0 +1,40 @@
+from dataclasses import asdict
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.permissions import AllowAny
+from application.interfaces.services.search_service import SEARCH_FACETS
+from application.use_cases.search_articles.search_articles import SearchArticlesUseCase, SearchArticlesDTO
+from domain.value_objects.article_status import ArticleStatus
+from infrastructure.services.search.resilient_search_service import build_search_service
+from infrastructure.services.spelling.symspell_corrector import get_spelling_corrector
+from infrastructure.services.statistics.django_statistics_service import DjangoStatisticsService
+
+class ArticleSearchAPIView(APIView):
+    """
+    جستجوی مقالات منتشرشده
+    برای جستجوهای بی‌نتیجه did_you_mean از واژگان از پیش ساخته‌شده پر می‌شود
+    """
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        params = request.query_params
+        facets = [facet for facet in params.get('facets', '').split(',') if facet in SEARCH_FACETS]
+        use_case = SearchArticlesUseCase(
+            search_service=build_search_service(),
+            statistics_service=DjangoStatisticsService(),
+            spelling_corrector=get_spelling_corrector()
+        )
+        try:
+            result = use_case.execute(SearchArticlesDTO(
+                query=params.get('q', ''),
+                page=int(params.get('page', 1)),
+                page_size=int(params.get('page_size', 10)),
+                filters={'status': ArticleStatus.PUBLISHED.value},
+                sort_by=params.get('sort_by') or None,
+                cursor=params.get('cursor') or None,
+                facets=facets or None
+            ))
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(asdict(result))
@@ -1,8 +1,7 @@
 # interfaces/web/forms.py
 from django import forms
 
-from articles.infrastructure.repositories.article.models import DjangoArticle
-  # Your Django model
+from infrastructure.repositories.article.models import DjangoArticle
 
 class ArticleForm(forms.ModelForm):
     class Meta:
@@ -5,9 +5,13 @@ from django.urls import reverse_lazy
 from django.contrib import messages
 from domain.models.article import Article
 from application.use_cases.article_management.create_article import CreateArticleUseCase
-from application.use_cases.article_management.update_article import UpdateArticleUseCase
-from application.use_cases.article_management.publish_article import PublishArticleUseCase
+from application.container import ServiceContainer
+from application.use_cases.article_management.update_article import UpdateArticleUseCase, UpdateArticleDTO
+from application.use_cases.article_management.publish_article import PublishArticleUseCase, PublishArticleDTO
 from application.use_cases.article_management.archive_article import ArchiveArticleUseCase
+from infrastructure.repositories.article.django_article_repository import DjangoArticleRepository
+from infrastructure.services.duplicate_detection.simhash_duplicate_detector import get_duplicate_detector
+from infrastructure.services.search.resilient_search_service import build_search_service
 from interfaces.web.forms import ArticleForm
 
 class ArticleListView(ListView):
@@ -107,17 +111,20 @@ class ArticleUpdateView(LoginRequiredMixin, UpdateView):
         return super().dispatch(request, *args, **kwargs)
     
     def form_valid(self, form):
-        use_case = UpdateArticleUseCase()
+        use_case = UpdateArticleUseCase(
+            article_repository=DjangoArticleRepository(),
+            search_service=build_search_service(),
+            duplicate_detector=get_duplicate_detector()
+        )
         try:
-            article = use_case.execute({
-                'article_id': str(self.object.id),
-                'title': form.cleaned_data['title'],
-                'content': form.cleaned_data['content'],
-                'tags': form.cleaned_data['tags'],
-                'categories': form.cleaned_data['categories'],
-                'status': form.cleaned_data['status'],
-                'editor': self.request.user
-            })
+            article = use_case.execute(UpdateArticleDTO(
+                article_id=str(self.object.id),
+                editor=self.request.user,
+                title=form.cleaned_data['title'],
+                content=form.cleaned_data['content'],
+                tags=form.cleaned_data['tags'],
+                categories=form.cleaned_data['categories']
+            ))
             messages.success(self.request, 'مقاله با موفقیت به‌روزرسانی شد.')
             return redirect('article_detail', slug=article.slug)
         except Exception as e:
@@ -132,12 +139,17 @@ def publish_article(request, slug):
         messages.error(request, 'شما مجوز انتشار این مقاله را ندارید.')
         return redirect('article_detail', slug=slug)
     
-    use_case = PublishArticleUseCase()
+    use_case = PublishArticleUseCase(
+        article_repository=DjangoArticleRepository(),
+        search_service=build_search_service(),
+        notification_service=ServiceContainer.notification(),
+        duplicate_detector=get_duplicate_detector()
+    )
     try:
-        use_case.execute({
-            'article_id': str(article.id),
-            'publisher': request.user
-        })
+        use_case.execute(PublishArticleDTO(
+            article_id=str(article.id),
+            publisher=request.user
+        ))
         messages.success(request, 'مقاله با موفقیت منتشر شد.')
     except Exception as e:
         messages.error(request, f'خطا در انتشار مقاله: {str(e)}')
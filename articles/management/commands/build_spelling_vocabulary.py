@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from infrastructure.services.spelling.symspell_corrector import build_vocabulary, save_vocabulary
+
+class Command(BaseCommand):
+    help = 'ساخت واژگان اصلاح املایی جستجو از مقالات منتشرشده (برای اجرای دوره‌ای با cron)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--path', help='مسیر فایل خروجی (پیش‌فرض SPELLING_CORRECTION[VOCABULARY_PATH])')
+
+    def handle(self, *args, **options):
+        speller = build_vocabulary()
+        path = save_vocabulary(speller, options.get('path'))
+        self.stdout.write(f'words={len(speller)} path={path}')
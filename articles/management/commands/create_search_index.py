@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+from infrastructure.services.search.elasticsearch_adapter import ElasticsearchAdapter
+
+class Command(BaseCommand):
+    help = 'ساخت ایندکس مقالات با نگاشت صریح (keyword برای فیلدهای فیلتر، مرتب‌سازی و facet)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rebuild',
+            action='store_true',
+            help='ساخت ایندکس تازه با نگاشت فعلی از روی دیتابیس و جایگزینی ایندکس موجود'
+        )
+
+    def handle(self, *args, **options):
+        adapter = ElasticsearchAdapter()
+        if options['rebuild']:
+            adapter.rebuild_index()
+            self.stdout.write('ایندکس مقالات از نو ساخته شد')
+        elif adapter.ensure_index():
+            self.stdout.write('ایندکس مقالات ساخته شد')
+        else:
+            # نگاشت ایندکس موجود تغییر نمی‌کند؛ برای اعمال نگاشت جدید از --rebuild استفاده کنید
+            self.stdout.write('ایندکس مقالات از قبل وجود دارد')
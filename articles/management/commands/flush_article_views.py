@@ -0,0 +1,9 @@
+from django.core.management.base import BaseCommand
+from infrastructure.services.statistics.view_counter import get_view_counter
+
+class Command(BaseCommand):
+    help = 'ثبت گروهی بازدیدهای شمرده‌شده در Redis در جدول آمار روزانه (برای اجرای دوره‌ای با cron)'
+
+    def handle(self, *args, **options):
+        written = get_view_counter().flush()
+        self.stdout.write(f'rows={written}')
@@ -0,0 +1,33 @@
+from collections import defaultdict
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from infrastructure.repositories.article.models import DjangoArticleDailyStats, DjangoArticleStats
+from infrastructure.services.statistics.popularity_leaderboard import get_popularity_leaderboard
+
+class Command(BaseCommand):
+    help = 'ساخت دوباره جدول‌های پربازدیدترین مقالات در Redis از روی آمار دیتابیس'
+
+    def handle(self, *args, **options):
+        leaderboard = get_popularity_leaderboard()
+        today = timezone.localdate()
+        since = today - timedelta(days=leaderboard.retention_days - 1)
+
+        daily = defaultdict(dict)
+        rows = DjangoArticleDailyStats.objects.filter(
+            date__gte=since, view_count__gt=0
+        ).values_list('date', 'article_id', 'view_count')
+        for day, article_id, views in rows.iterator(chunk_size=5000):
+            daily[day][str(article_id)] = views
+        for offset in range(leaderboard.retention_days):
+            day = since + timedelta(days=offset)
+            leaderboard.replace_scores(daily.get(day, {}), day)
+
+        totals = {
+            str(article_id): views
+            for article_id, views in DjangoArticleStats.objects.filter(
+                view_count__gt=0
+            ).values_list('article_id', 'view_count').iterator(chunk_size=5000)
+        }
+        leaderboard.replace_scores(totals)
+        self.stdout.write(f'days={len(daily)} articles={len(totals)}')
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand
+from application.services.article_index_reconciler import ArticleIndexReconciler
+from infrastructure.repositories.article.django_article_repository import DjangoArticleRepository
+from infrastructure.repositories.search.django_index_checkpoint_repository import DjangoIndexCheckpointRepository
+from infrastructure.services.search.resilient_search_service import build_search_service
+
+class Command(BaseCommand):
+    help = 'همگام‌سازی تدریجی ایندکس جستجو با مقالات تغییرکرده (برای اجرای دوره‌ای با cron)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument(
+            '--skip-deleted',
+            action='store_true',
+            help='بدون پیمایش کل ایندکس برای یافتن مقالات حذف‌شده از دیتابیس'
+        )
+
+    def handle(self, *args, **options):
+        search_service = build_search_service()
+        if not search_service.supports_reconciliation:
+            # جستجوی دیتابیس در همان تراکنش ذخیره مقاله همگام می‌شود
+            self.stdout.write('موتور جستجوی فعلی نیازی به همگام‌سازی ندارد')
+            return
+
+        reconciler = ArticleIndexReconciler(
+            search_service=search_service,
+            article_repository=DjangoArticleRepository(),
+            checkpoint_repository=DjangoIndexCheckpointRepository(),
+            batch_size=options['batch_size'],
+            prune_deleted=not options['skip_deleted']
+        )
+        stats = reconciler.reconcile()
+        self.stdout.write(
+            f"scanned={stats['scanned']} in_sync={stats['in_sync']} missing={stats['missing']} "
+            f"stale={stats['stale']} orphaned={stats['orphaned']} deleted={stats['deleted']} repaired={stats['repaired']} "
+            f"failed={stats['failed']} high_water_mark={stats['high_water_mark']}"
+        )
+        if not stats['success']:
+            self.stderr.write('برخی اسناد اصلاح نشدند؛ دور بعد دوباره بررسی می‌شوند')
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+from infrastructure.services.statistics.article_stats_summary import refresh_article_stats
+from infrastructure.services.statistics.stats_cache import bump_stats_version
+
+class Command(BaseCommand):
+    help = 'بازسازی خلاصه آمار همه مقالات؛ روزی یک بار اجرا شود تا بازه‌های ۷/۳۰/۳۶۵ روزه جلو بروند'
+
+    def handle(self, *args, **options):
+        rows = refresh_article_stats()
+        bump_stats_version()
+        self.stdout.write(f'rows={len(rows)}')
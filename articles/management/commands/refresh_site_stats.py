@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from infrastructure.services.statistics.site_stats import apply_site_deltas, recompute_site_stats
+
+class Command(BaseCommand):
+    help = 'اعمال تغییرات شمارنده‌های داشبورد (هر چند دقیقه) یا بازشماری کامل با --full (روزانه)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--full', action='store_true', help='بازشماری کامل همه شمارنده‌ها')
+
+    def handle(self, *args, **options):
+        if options['full']:
+            stats = recompute_site_stats()
+            self.stdout.write(' '.join(f'{field}={value}' for field, value in stats.items()))
+            return
+        deltas = apply_site_deltas()
+        self.stdout.write(' '.join(f'{field}={value:+d}' for field, value in deltas.items()) or 'no changes')
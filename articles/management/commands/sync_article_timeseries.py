@@ -0,0 +1,16 @@
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from infrastructure.services.statistics.timeseries_sync import get_timeseries_store, sync_timeseries_from_database
+
+class Command(BaseCommand):
+    help = 'بازنویسی روزهای اخیر سری زمانی مقالات از روی آمار روزانه (برای اجرای دوره‌ای با cron)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=35)
+
+    def handle(self, *args, **options):
+        end = timezone.localdate()
+        start = end - timedelta(days=options['days'] - 1)
+        written = sync_timeseries_from_database(get_timeseries_store(), start, end)
+        self.stdout.write(' '.join(f'{metric}={count}' for metric, count in written.items()))
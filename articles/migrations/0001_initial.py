@@ -0,0 +1,225 @@
+# Generated by Django 4.2.9 on 2026-10-19 14:24
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DjangoArticle',
+            fields=[
+                ('id', models.UUIDField(primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=200)),
+                ('slug', models.SlugField(max_length=200, unique=True)),
+                ('content', models.TextField()),
+                ('status', models.CharField(default='draft', max_length=20)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('published_at', models.DateTimeField(blank=True, null=True)),
+                ('view_count', models.PositiveIntegerField(default=0)),
+                ('content_simhash', models.BigIntegerField(blank=True, null=True)),
+                ('search_fingerprint', models.CharField(blank=True, max_length=40, null=True)),
+                ('author', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'articles',
+                'ordering': ['-published_at', '-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='DjangoIndexCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('high_water_mark', models.DateTimeField(blank=True, null=True)),
+                ('last_article_id', models.CharField(blank=True, max_length=36, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='DjangoSiteStatsSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(default='site', max_length=20, unique=True)),
+                ('total_articles', models.IntegerField(default=0)),
+                ('published_articles', models.IntegerField(default=0)),
+                ('total_comments', models.IntegerField(default=0)),
+                ('approved_comments', models.IntegerField(default=0)),
+                ('pending_comments', models.IntegerField(default=0)),
+                ('rejected_comments', models.IntegerField(default=0)),
+                ('spam_comments', models.IntegerField(default=0)),
+                ('total_users', models.IntegerField(default=0)),
+                ('total_views', models.BigIntegerField(default=0)),
+                ('computed_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'db_table': 'site_stats_snapshot',
+            },
+        ),
+        migrations.CreateModel(
+            name='DjangoSearchQueryRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('normalized_query', models.CharField(max_length=255)),
+                ('granularity', models.CharField(choices=[('hour', 'Hour'), ('day', 'Day')], max_length=4)),
+                ('bucket_start', models.DateTimeField()),
+                ('search_count', models.PositiveIntegerField(default=0)),
+                ('zero_result_count', models.PositiveIntegerField(default=0)),
+                ('total_results', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['granularity', 'bucket_start'], name='articles_dj_granula_01a11a_idx')],
+                'unique_together': {('granularity', 'bucket_start', 'normalized_query')},
+            },
+        ),
+        migrations.CreateModel(
+            name='DjangoSearchLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('query', models.CharField(max_length=255)),
+                ('user_id', models.CharField(blank=True, max_length=36, null=True)),
+                ('timestamp', models.DateTimeField(default=django.utils.timezone.now)),
+                ('results_count', models.PositiveIntegerField(default=0)),
+                ('metadata', models.JSONField(default=dict)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user_id'], name='articles_dj_user_id_36bdfe_idx'), models.Index(fields=['timestamp'], name='articles_dj_timesta_0991c7_idx'), models.Index(fields=['query'], name='articles_dj_query_92b7e4_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='DjangoSavedSearch',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False)),
+                ('user_id', models.CharField(max_length=36)),
+                ('query', models.CharField(blank=True, max_length=255)),
+                ('tags', models.JSONField(default=list)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user_id'], name='articles_dj_user_id_5641aa_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='DjangoArticleStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('view_count', models.PositiveIntegerField(default=0)),
+                ('unique_view_count', models.PositiveIntegerField(default=0)),
+                ('share_count', models.PositiveIntegerField(default=0)),
+                ('average_read_time', models.FloatField(default=0)),
+                ('average_scroll_depth', models.FloatField(default=0)),
+                ('views_7d', models.PositiveIntegerField(default=0)),
+                ('views_30d', models.PositiveIntegerField(default=0)),
+                ('views_365d', models.PositiveIntegerField(default=0)),
+                ('daily_series', models.JSONField(default=list)),
+                ('computed_on', models.DateField(default=django.utils.timezone.localdate)),
+                ('updated_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('article', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='stats_summary', to='articles.djangoarticle')),
+            ],
+            options={
+                'db_table': 'article_stats',
+            },
+        ),
+        migrations.CreateModel(
+            name='DjangoComment',
+            fields=[
+                ('id', models.UUIDField(primary_key=True, serialize=False)),
+                ('content', models.TextField()),
+                ('status', models.CharField(default='pending', max_length=20)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='comments', to='articles.djangoarticle')),
+                ('author', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+                ('parent', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='articles.djangocomment')),
+            ],
+            options={
+                'db_table': 'article_comments',
+                'ordering': ['created_at'],
+                'indexes': [models.Index(fields=['article', 'status'], name='article_com_article_7bc562_idx'), models.Index(fields=['author'], name='article_com_author__8ca7a2_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='DjangoCategory',
+            fields=[
+                ('id', models.UUIDField(primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=100)),
+                ('slug', models.SlugField(max_length=100, unique=True)),
+                ('description', models.TextField(blank=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('parent', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='children', to='articles.djangocategory')),
+            ],
+            options={
+                'db_table': 'categories',
+                'indexes': [models.Index(fields=['parent'], name='categories_parent__7983b2_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='DjangoArticleTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tag_name', models.CharField(max_length=50)),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='articles.djangoarticle')),
+            ],
+            options={
+                'db_table': 'article_tags',
+                'unique_together': {('article', 'tag_name')},
+            },
+        ),
+        migrations.CreateModel(
+            name='DjangoArticleDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('view_count', models.PositiveIntegerField(default=0)),
+                ('unique_view_count', models.PositiveIntegerField(default=0)),
+                ('share_count', models.PositiveIntegerField(default=0)),
+                ('read_time_total', models.FloatField(default=0)),
+                ('read_count', models.PositiveIntegerField(default=0)),
+                ('scroll_depth_total', models.FloatField(default=0)),
+                ('scroll_count', models.PositiveIntegerField(default=0)),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='articles.djangoarticle')),
+            ],
+            options={
+                'db_table': 'article_daily_stats',
+                'indexes': [models.Index(fields=['date'], name='article_dai_date_bb6a5a_idx')],
+                'unique_together': {('article', 'date')},
+            },
+        ),
+        migrations.CreateModel(
+            name='DjangoArticleCategory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('category_id', models.UUIDField()),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='articles.djangoarticle')),
+            ],
+            options={
+                'db_table': 'article_categories',
+                'indexes': [models.Index(fields=['category_id'], name='article_cat_categor_67a7a3_idx')],
+                'unique_together': {('article', 'category_id')},
+            },
+        ),
+        migrations.AddIndex(
+            model_name='djangoarticle',
+            index=models.Index(fields=['status'], name='articles_status_a4f178_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='djangoarticle',
+            index=models.Index(fields=['author'], name='articles_author__a0ff4a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='djangoarticle',
+            index=models.Index(fields=['slug'], name='articles_slug_c8b0c2_idx'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+from django.db import migrations
+
+# نام‌ها با DatabaseFullTextSearchService یکی هستند
+FTS_TABLE = 'articles_fts'
+PG_VECTOR_COLUMN = 'search_vector'
+PG_INDEX_NAME = 'articles_search_vector_gin'
+
+
+def create_search_index(apps, schema_editor):
+    """
+    PostgreSQL: ستون tsvector روی جدول مقالات و ایندکس GIN آن
+    SQLite: جدول مجازی FTS5 برای عنوان و محتوای نرمال‌شده
+    پس از اجرا، اسناد مقالات موجود با rebuild_index سرویس جستجوی دیتابیس ساخته می‌شوند
+    """
+    if schema_editor.connection.vendor == 'postgresql':
+        # ستون بدون پیش‌فرض فقط metadata را تغییر می‌دهد؛ ایندکس بدون قفل نوشتن ساخته می‌شود
+        schema_editor.execute(f"ALTER TABLE articles ADD COLUMN IF NOT EXISTS {PG_VECTOR_COLUMN} tsvector")
+        schema_editor.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {PG_INDEX_NAME} ON articles USING GIN ({PG_VECTOR_COLUMN})"
+        )
+    elif schema_editor.connection.vendor == 'sqlite':
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+            "article_id UNINDEXED, title, content, "
+            "tokenize = 'unicode61 remove_diacritics 2')"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {PG_INDEX_NAME}")
+        schema_editor.execute(f"ALTER TABLE articles DROP COLUMN IF EXISTS {PG_VECTOR_COLUMN}")
+    elif schema_editor.connection.vendor == 'sqlite':
+        schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY داخل تراکنش اجرا نمی‌شود
+    atomic = False
+
+    dependencies = [
+        ('articles', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,83 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_init, post_save, post_delete
+from django.dispatch import receiver
+from infrastructure.repositories.article.models import DjangoArticle
+from infrastructure.repositories.comment.models import DjangoComment
+from infrastructure.services.search.database_fulltext_search import DatabaseFullTextSearchService
+from infrastructure.services.statistics.site_stats import (
+    article_status_delta,
+    comment_status_delta,
+    record_site_delta
+)
+
+def _uses_database_search() -> bool:
+    return settings.SEARCH_CONFIG.get('BACKEND') == 'database'
+
+@receiver(post_save, sender=DjangoArticle)
+def sync_article_search_document(sender, instance, **kwargs):
+    """
+    همگام‌سازی سند جستجوی دیتابیس در همان تراکنش ذخیره مقاله
+    """
+    if _uses_database_search():
+        DatabaseFullTextSearchService().sync_document(
+            instance.id, instance.title, instance.content, instance.status
+        )
+
+@receiver(post_delete, sender=DjangoArticle)
+def remove_article_search_document(sender, instance, **kwargs):
+    """
+    حذف سند جستجوی دیتابیس پس از حذف مقاله
+    """
+    if _uses_database_search():
+        DatabaseFullTextSearchService().remove_article_from_index(instance.id)
+
+
+_UNKNOWN_STATUS = object()
+
+@receiver(post_init, sender=DjangoArticle)
+@receiver(post_init, sender=DjangoComment)
+def remember_loaded_status(sender, instance, **kwargs):
+    """وضعیت هنگام بارگذاری برای تشخیص تغییر وضعیت در post_save"""
+    # فیلد deferred خوانده نمی‌شود تا برای هر نمونه کوئری اضافه اجرا نشود
+    instance._loaded_status = instance.__dict__.get('status', _UNKNOWN_STATUS)
+
+def _record_status_change(instance, created, total_field, status_delta):
+    old_status = None if created else instance._loaded_status
+    # وضعیت قبلی نامعلوم است؛ بازشماری کامل دوره‌ای اختلاف را جبران می‌کند
+    if old_status is _UNKNOWN_STATUS or (not created and old_status == instance.status):
+        return
+    deltas = {total_field: 1} if created else {}
+    for field, value in [*status_delta(old_status, -1).items(), *status_delta(instance.status, 1).items()]:
+        deltas[field] = deltas.get(field, 0) + value
+    instance._loaded_status = instance.status
+    # تغییر فقط پس از commit ثبت می‌شود تا تراکنش‌های برگشت‌خورده شمرده نشوند
+    transaction.on_commit(lambda: record_site_delta(**deltas))
+
+@receiver(post_save, sender=DjangoArticle)
+def count_article_change(sender, instance, created, **kwargs):
+    _record_status_change(instance, created, 'total_articles', article_status_delta)
+
+@receiver(post_save, sender=DjangoComment)
+def count_comment_change(sender, instance, created, **kwargs):
+    _record_status_change(instance, created, 'total_comments', comment_status_delta)
+
+@receiver(post_delete, sender=DjangoArticle)
+def count_article_delete(sender, instance, **kwargs):
+    deltas = {'total_articles': -1, **article_status_delta(instance.status, -1)}
+    transaction.on_commit(lambda: record_site_delta(**deltas))
+
+@receiver(post_delete, sender=DjangoComment)
+def count_comment_delete(sender, instance, **kwargs):
+    deltas = {'total_comments': -1, **comment_status_delta(instance.status, -1)}
+    transaction.on_commit(lambda: record_site_delta(**deltas))
+
+@receiver(post_save, sender=get_user_model())
+def count_new_user(sender, instance, created, **kwargs):
+    if created:
+        transaction.on_commit(lambda: record_site_delta(total_users=1))
+
+@receiver(post_delete, sender=get_user_model())
+def count_deleted_user(sender, instance, **kwargs):
+    transaction.on_commit(lambda: record_site_delta(total_users=-1))
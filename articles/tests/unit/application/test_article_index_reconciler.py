@@ -0,0 +1,75 @@
+# tests/unit/application/test_article_index_reconciler.py
+from django.test import SimpleTestCase
+from application.services.article_index_reconciler import ArticleIndexReconciler
+
+
+class FakeSearchService:
+    def __init__(self, indexed_ids, failing_ids=()):
+        self.indexed_ids = sorted(indexed_ids)
+        self.failing_ids = set(failing_ids)
+
+    def get_indexed_ids(self, after_id=None, limit=500):
+        ids = [article_id for article_id in self.indexed_ids if after_id is None or article_id > after_id]
+        return ids[:limit]
+
+    def bulk_remove_articles(self, article_ids):
+        removed = [article_id for article_id in article_ids if article_id not in self.failing_ids]
+        self.indexed_ids = [article_id for article_id in self.indexed_ids if article_id not in removed]
+        return len(removed)
+
+
+class FakeArticleRepository:
+    def __init__(self, article_ids):
+        self.article_ids = set(article_ids)
+
+    def get_updated_since(self, since, after_id=None, limit=500):
+        return []
+
+    def get_existing_ids(self, article_ids):
+        return self.article_ids & set(article_ids)
+
+
+class FakeCheckpointRepository:
+    def get(self, name):
+        return None, None
+
+    def save(self, name, high_water_mark, last_article_id):
+        pass
+
+
+class ArticleIndexReconcilerTests(SimpleTestCase):
+    def make_reconciler(self, search_service, article_ids, **kwargs):
+        return ArticleIndexReconciler(
+            search_service=search_service,
+            article_repository=FakeArticleRepository(article_ids),
+            checkpoint_repository=FakeCheckpointRepository(),
+            batch_size=2,
+            **kwargs
+        )
+
+    def test_deleted_articles_are_removed_from_index(self):
+        search_service = FakeSearchService(['a', 'b', 'c', 'd', 'e'])
+
+        stats = self.make_reconciler(search_service, ['b', 'd']).reconcile()
+
+        self.assertEqual(search_service.indexed_ids, ['b', 'd'])
+        self.assertEqual(stats['deleted'], 3)
+        self.assertEqual(stats['repaired'], 3)
+        self.assertTrue(stats['success'])
+
+    def test_failed_removal_marks_run_unsuccessful(self):
+        search_service = FakeSearchService(['a', 'b', 'c'], failing_ids=['c'])
+
+        stats = self.make_reconciler(search_service, ['b']).reconcile()
+
+        self.assertEqual(stats['deleted'], 2)
+        self.assertEqual(stats['failed'], 1)
+        self.assertFalse(stats['success'])
+
+    def test_pruning_can_be_skipped(self):
+        search_service = FakeSearchService(['a', 'b'])
+
+        stats = self.make_reconciler(search_service, [], prune_deleted=False).reconcile()
+
+        self.assertEqual(search_service.indexed_ids, ['a', 'b'])
+        self.assertEqual(stats['deleted'], 0)
@@ -0,0 +1,29 @@
+# tests/unit/application/test_article_statistics.py
+from django.test import SimpleTestCase, override_settings
+from application.services.article_statistics import ArticleStatistics
+from domain.services.engagement_scoring import EngagementWeights
+from infrastructure.services.statistics.django_statistics_service import DjangoStatisticsService
+
+VIEWS_ONLY = {
+    'VIEWS': 1.0,
+    'COMMENTS': 0.0,
+    'READ_TIME': 0.0,
+    'VIEWS_CAP': 100,
+    'COMMENTS_CAP': 50,
+    'READ_TIME_CAP': 300,
+}
+
+
+class ArticleStatisticsWeightsTests(SimpleTestCase):
+    @override_settings(ENGAGEMENT_SCORING=VIEWS_ONLY)
+    def test_weights_default_to_configured_scoring(self):
+        statistics = ArticleStatistics(None, None, DjangoStatisticsService())
+
+        self.assertEqual(statistics.engagement_weights, EngagementWeights.from_dict(VIEWS_ONLY))
+        self.assertEqual(statistics._calculate_engagement_score(50, 40, 300), 50.0)
+
+    def test_explicit_weights_are_kept(self):
+        weights = EngagementWeights(views=1.0, comments=0.0, read_time=0.0)
+        statistics = ArticleStatistics(None, None, DjangoStatisticsService(), engagement_weights=weights)
+
+        self.assertIs(statistics.engagement_weights, weights)
@@ -0,0 +1,80 @@
+# tests/unit/application/test_saved_search_notifications.py
+import importlib
+from types import SimpleNamespace
+from django.test import SimpleTestCase
+from core.domain.entities.user import User
+
+# هر دو سرویس ایمیل باید اعلان جستجوی ذخیره‌شده را یکسان بفرستند
+SERVICE_MODULES = (
+    'application.services.email_notification_service',
+    'infrastructure.services.notification',
+)
+
+
+def make_provider(module):
+    class RecordingProvider(module.BaseEmailProvider):
+        def _setup_provider(self):
+            self.sent = []
+
+        def _send_email(self, message):
+            self.sent.append(message)
+            return True
+
+        @property
+        def provider_name(self):
+            return 'recording'
+
+    return RecordingProvider()
+
+
+class FakeUserRepository:
+    def __init__(self, users):
+        self.users = users
+
+    def get(self, user_id):
+        return self.users[str(user_id)]
+
+
+class SavedSearchNotificationTests(SimpleTestCase):
+    def build_service(self, module_name, user):
+        module = importlib.import_module(module_name)
+        provider = make_provider(module)
+        service = module.EmailNotificationService(
+            provider, user_repository=FakeUserRepository({str(user.id): user})
+        )
+        return service, provider
+
+    def test_saved_search_notification_is_sent(self):
+        for module_name in SERVICE_MODULES:
+            with self.subTest(module=module_name):
+                user = User.create(email='reader@example.com', password_hash='x')
+                service, provider = self.build_service(module_name, user)
+                article = SimpleNamespace(id='a1', title='جنگو و پستگرس')
+                saved_searches = [
+                    SimpleNamespace(id='s1', user_id=str(user.id), query='جنگو', tags=[]),
+                    SimpleNamespace(id='s2', user_id=str(user.id), query='پستگرس', tags=[]),
+                ]
+
+                self.assertTrue(service.send_saved_search_notification(str(user.id), article, saved_searches))
+
+                self.assertEqual(len(provider.sent), 1)
+                message = provider.sent[0]
+                self.assertEqual(message.to, 'reader@example.com')
+                self.assertIn('جنگو و پستگرس', message.subject)
+                self.assertIn('جنگو', message.body)
+                self.assertIn('پستگرس', message.body)
+                self.assertEqual(message.metadata['article_id'], 'a1')
+                self.assertEqual(message.metadata['saved_search_ids'], ['s1', 's2'])
+
+    def test_inactive_user_is_not_notified(self):
+        for module_name in SERVICE_MODULES:
+            with self.subTest(module=module_name):
+                user = User.create(email='reader@example.com', password_hash='x')
+                user.is_active = False
+                service, provider = self.build_service(module_name, user)
+                saved_search = SimpleNamespace(id='s1', user_id=str(user.id), query='جنگو', tags=[])
+
+                self.assertFalse(service.send_saved_search_notification(
+                    str(user.id), SimpleNamespace(id='a1', title='t'), [saved_search]
+                ))
+                self.assertEqual(provider.sent, [])
@@ -0,0 +1,40 @@
+# tests/unit/domain/test_article_stats_repository.py
+from django.test import SimpleTestCase
+from domain.entities.article_stats import ArticleStats
+from domain.repositories.article_stats_repository import ArticleStatsRepository
+
+
+class InMemoryArticleStatsRepository(ArticleStatsRepository):
+    def __init__(self):
+        self.rows = {}
+        self.save_calls = 0
+
+    def save(self, stats):
+        self.save_calls += 1
+        self.rows[stats.article_id] = ArticleStats(**vars(stats))
+
+    def get_by_article(self, article_id):
+        return ArticleStats(**vars(self.rows.get(article_id, ArticleStats(article_id))))
+
+
+class DefaultSaveManyTests(SimpleTestCase):
+    def test_adds_and_replaces_per_field(self):
+        repository = InMemoryArticleStatsRepository()
+        repository.save(ArticleStats('a', view_count=10, share_count=1, average_read_time=30.0))
+
+        written = repository.save_many(
+            [
+                ArticleStats('a', view_count=5, share_count=2, average_read_time=40.0),
+                ArticleStats('a', view_count=1, share_count=0, average_read_time=50.0),
+                ArticleStats('b', view_count=3),
+            ],
+            add_fields=('view_count', 'share_count')
+        )
+
+        self.assertEqual(written, 2)
+        self.assertEqual(repository.rows['a'], ArticleStats('a', view_count=16, share_count=3, average_read_time=50.0))
+        self.assertEqual(repository.rows['b'], ArticleStats('b', view_count=3))
+
+    def test_rejects_unknown_fields(self):
+        with self.assertRaises(ValueError):
+            InMemoryArticleStatsRepository().save_many([ArticleStats('a')], add_fields=('article_id',))
@@ -0,0 +1,34 @@
+# tests/unit/domain/test_engagement_scoring.py
+import numpy as np
+from django.test import SimpleTestCase
+from domain.services.engagement_scoring import EngagementWeights, engagement_scores, top_k
+
+
+class EngagementScoringTests(SimpleTestCase):
+    def test_scores_are_capped_and_weighted(self):
+        scores = engagement_scores([0, 500, 5000], [0, 25, 500], [0, 150, 3000])
+
+        np.testing.assert_allclose(scores, [0.0, 50.0, 100.0])
+
+    def test_custom_weights_and_caps(self):
+        weights = EngagementWeights.from_dict({'VIEWS': 1.0, 'COMMENTS': 0.0, 'READ_TIME': 0.0, 'VIEWS_CAP': 10})
+
+        np.testing.assert_allclose(engagement_scores([5], [50], [300], weights), [50.0])
+
+
+class TopKTests(SimpleTestCase):
+    def test_orders_descending_with_index_tiebreak(self):
+        scores = np.array([3.0, 9.0, 1.0, 9.0, 5.0])
+
+        self.assertEqual(top_k(scores, 3).tolist(), [1, 3, 4])
+        self.assertEqual(top_k(scores, 10).tolist(), [1, 3, 4, 0, 2])
+        self.assertEqual(top_k(scores, 0).tolist(), [])
+
+    def test_scales_to_large_batches(self):
+        rng = np.random.default_rng(0)
+        views, comments, read_time = rng.integers(0, 2000, (3, 100_000))
+        scores = engagement_scores(views, comments, read_time)
+
+        best = top_k(scores, 20)
+        self.assertTrue(np.all(np.diff(scores[best]) <= 0))
+        self.assertGreaterEqual(scores[best[-1]], np.partition(scores, -20)[-20])
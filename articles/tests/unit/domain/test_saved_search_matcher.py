@@ -0,0 +1,38 @@
+# tests/unit/domain/test_saved_search_matcher.py
+from django.test import SimpleTestCase
+from domain.services.saved_search_matcher import SavedSearchMatcher
+
+
+def build():
+    matcher = SavedSearchMatcher()
+    matcher.add('django', 'آموزش جنگو')
+    matcher.add('django-rest', 'جنگو', tags=['api'])
+    matcher.add('python-tag', '', tags=['python', 'پایتون'])
+    matcher.add('rust', 'زبان راست')
+    return matcher
+
+
+class SavedSearchMatcherTests(SimpleTestCase):
+    def test_match_requires_all_terms_and_one_of_the_tags(self):
+        matcher = build()
+        self.assertEqual(matcher.match('آموزش جنگو', 'مقدمه', tags=['web']), ['django'])
+        self.assertEqual(matcher.match('جنگو', 'ساخت API', tags=['api']), ['django-rest'])
+        self.assertEqual(
+            matcher.match('راهنما', 'آموزش جنگو و پایتون', tags=['python', 'api']),
+            ['django', 'django-rest', 'python-tag']
+        )
+
+    def test_match_normalizes_persian_letters(self):
+        matcher = build()
+        # ي عربی در تگ با ی فارسی یکی است
+        self.assertEqual(
+            matcher.match('آموزش جنگو', 'ابزارهای زبان راست', tags=['پايتون']),
+            ['django', 'python-tag', 'rust']
+        )
+
+    def test_remove_and_replace_subscription(self):
+        matcher = build()
+        matcher.remove('django')
+        matcher.add('rust', 'راست')
+        self.assertEqual(len(matcher), 3)
+        self.assertEqual(matcher.match('آموزش جنگو', 'راست', tags=[]), ['rust'])
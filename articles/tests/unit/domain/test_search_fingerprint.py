@@ -0,0 +1,34 @@
+# tests/unit/domain/test_search_fingerprint.py
+from datetime import datetime
+from types import SimpleNamespace
+from django.test import SimpleTestCase
+from domain.services.search_fingerprint import search_fingerprint
+
+
+def make_article(**overrides):
+    fields = dict(
+        title='آموزش جنگو',
+        slug='amozsh-jngo',
+        content='متن مقاله',
+        author=SimpleNamespace(id=7),
+        status='published',
+        tags=['django', 'python'],
+        categories=[],
+        published_at=datetime(2024, 1, 1),
+        view_count=10,
+        updated_at=datetime(2024, 1, 2),
+    )
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+class SearchFingerprintTests(SimpleTestCase):
+    def test_fingerprint_ignores_counters_updated_at_and_tag_order(self):
+        article = make_article()
+        touched = make_article(view_count=99, updated_at=datetime(2024, 5, 5), tags=['python', 'django'])
+        self.assertEqual(search_fingerprint(article), search_fingerprint(touched))
+
+    def test_fingerprint_changes_with_searchable_fields(self):
+        article = make_article()
+        self.assertNotEqual(search_fingerprint(article), search_fingerprint(make_article(content='متن جدید')))
+        self.assertNotEqual(search_fingerprint(article), search_fingerprint(make_article(status='archived')))
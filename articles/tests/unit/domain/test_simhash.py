@@ -0,0 +1,47 @@
+# tests/unit/domain/test_simhash.py
+from django.test import SimpleTestCase
+from domain.services.simhash import SimHashIndex, hamming_distance, simhash
+
+ARTICLE = (
+    "جنگو یک فریمورک وب سطح بالا برای پایتون است که توسعه سریع و طراحی تمیز را "
+    "تشویق می‌کند. این فریمورک توسط توسعه‌دهندگان باتجربه ساخته شده و بسیاری از "
+    "دردسرهای توسعه وب را برطرف می‌کند تا بتوانید روی نوشتن برنامه تمرکز کنید "
+    "بدون اینکه نیاز باشد چرخ را از نو اختراع کنید. جنگو رایگان و متن‌باز است. "
+    "سیستم مدیریت پایگاه داده جنگو با یک لایه ORM قدرتمند همراه است که امکان تعریف "
+    "مدل‌ها با کلاس‌های پایتون را فراهم می‌کند و مهاجرت‌ها را به صورت خودکار می‌سازد. "
+    "پنل مدیریت آماده یکی از محبوب‌ترین ویژگی‌های این فریمورک است و بدون نوشتن کد "
+    "اضافه امکان ایجاد ویرایش و حذف داده‌ها را به مدیران سایت می‌دهد. سیستم قالب‌ها "
+    "جداسازی منطق از نمایش را ساده می‌کند و امنیت در برابر حملات رایج مانند تزریق "
+    "کد و جعل درخواست به صورت پیش‌فرض فعال است. جامعه بزرگ کاربران و مستندات کامل "
+    "باعث شده یادگیری و استفاده از جنگو برای تیم‌های کوچک و بزرگ آسان باشد و بسته‌های "
+    "فراوانی برای نیازهای مختلف مانند احراز هویت پرداخت و جستجو در دسترس باشد."
+)
+
+
+class SimHashTests(SimpleTestCase):
+    def test_simhash_ignores_persian_character_variants(self):
+        variant = ARTICLE.replace('ی', 'ي').replace('ک', 'ك')
+        self.assertEqual(simhash(variant), simhash(ARTICLE))
+
+    def test_near_duplicate_is_found_and_unrelated_text_is_not(self):
+        index = SimHashIndex(max_distance=3)
+        index.add('original', simhash(ARTICLE))
+        index.add('other', simhash("آموزش کامل آشپزی ایرانی با دستور پخت قورمه سبزی و فسنجان خانگی"))
+
+        reposted = ARTICLE.replace('رایگان', 'مجانی')
+        matches = index.query(simhash(reposted))
+
+        self.assertEqual([key for key, _ in matches], ['original'])
+
+    def test_remove_and_pairs(self):
+        index = SimHashIndex(max_distance=3)
+        index.add('a', simhash(ARTICLE))
+        index.add('b', simhash(ARTICLE))
+        self.assertEqual(index.pairs(), [('a', 'b', 0)])
+
+        index.remove('b')
+        self.assertEqual(index.pairs(), [])
+        self.assertNotIn('b', index)
+
+    def test_hamming_distance(self):
+        self.assertEqual(hamming_distance(0b1011, 0b0001), 2)
@@ -0,0 +1,27 @@
+# tests/unit/domain/test_symspell.py
+from django.test import SimpleTestCase
+from domain.services.symspell import SymSpell, damerau_levenshtein
+
+
+def build():
+    speller = SymSpell(max_edit_distance=2)
+    speller.add_words({'برنامه': 50, 'نویسی': 40, 'پایتون': 30, 'جنگو': 20, 'جنگل': 5, 'elasticsearch': 3})
+    return speller
+
+
+class SymSpellTests(SimpleTestCase):
+    def test_damerau_levenshtein_counts_transposition_as_one_edit(self):
+        self.assertEqual(damerau_levenshtein('پایتون', 'پاتیون', 2), 1)
+        self.assertEqual(damerau_levenshtein('abc', 'xyz', 1), 2)
+
+    def test_lookup_prefers_closest_then_most_frequent(self):
+        suggestions = build().lookup('جنگا')
+        self.assertEqual([s.term for s in suggestions[:2]], ['جنگو', 'جنگل'])
+        self.assertEqual(suggestions[0].distance, 1)
+
+    def test_correct_query_normalizes_arabic_letters_and_fixes_typos(self):
+        speller = build()
+        self.assertEqual(speller.correct('برنامه نویسی پایتن'), 'برنامه نویسی پایتون')
+        # ي عربی با ی فارسی یکی است و خطا حساب نمی‌شود
+        self.assertIsNone(speller.correct('پايتون'))
+        self.assertEqual(speller.correct('elasticsaerch'), 'elasticsearch')
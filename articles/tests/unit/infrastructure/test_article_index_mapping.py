@@ -0,0 +1,37 @@
+# tests/unit/infrastructure/test_article_index_mapping.py
+from django.test import SimpleTestCase
+from infrastructure.services.search.article_index_mapping import (
+    ARTICLE_INDEX_MAPPINGS,
+    CURSOR_TIEBREAKER,
+    build_facet_aggregations,
+)
+
+
+class ArticleIndexMappingTests(SimpleTestCase):
+    def test_exact_match_fields_are_keywords(self):
+        properties = ARTICLE_INDEX_MAPPINGS['properties']
+        for name in ('id', 'author_id', 'status', 'tags', 'categories'):
+            self.assertEqual(properties[name]['type'], 'keyword', name)
+
+    def test_cursor_tiebreaker_sorts_on_keyword_field(self):
+        properties = ARTICLE_INDEX_MAPPINGS['properties']
+        for name in CURSOR_TIEBREAKER:
+            self.assertEqual(properties[name]['type'], 'keyword')
+
+    def test_term_facets_aggregate_on_keyword_fields(self):
+        properties = ARTICLE_INDEX_MAPPINGS['properties']
+        aggs = build_facet_aggregations(['tags', 'categories', 'author', 'status'], size=5)
+
+        self.assertEqual(set(aggs), {'tags', 'categories', 'author', 'status'})
+        for agg in aggs.values():
+            self.assertEqual(properties[agg['terms']['field']]['type'], 'keyword')
+            self.assertEqual(agg['terms']['size'], 5)
+
+    def test_date_facet_uses_histogram_and_unknown_facets_are_skipped(self):
+        aggs = build_facet_aggregations(['published', 'title', 'unknown'], date_interval='week')
+
+        self.assertEqual(aggs, {
+            'published': {
+                'date_histogram': {'field': 'published_at', 'calendar_interval': 'week', 'min_doc_count': 1}
+            }
+        })
@@ -0,0 +1,53 @@
+# tests/unit/infrastructure/test_async_elasticsearch_adapter.py
+from unittest import mock
+from asgiref.sync import async_to_sync
+from django.test import SimpleTestCase
+from infrastructure.services.search.async_elasticsearch_adapter import AsyncElasticsearchAdapter
+
+
+class EmptyArticleRepository:
+    def get_updated_since(self, since, after_id, limit):
+        return []
+
+
+def async_client(existing_index=True, is_alias=False):
+    client = mock.MagicMock()
+    client.indices.create = mock.AsyncMock()
+    client.indices.refresh = mock.AsyncMock()
+    client.indices.update_aliases = mock.AsyncMock()
+    client.indices.delete = mock.AsyncMock()
+    client.indices.exists = mock.AsyncMock(return_value=existing_index)
+    client.indices.exists_alias = mock.AsyncMock(return_value=is_alias)
+    client.indices.get_alias = mock.AsyncMock(return_value={'articles_20240101000000': {}})
+    return client
+
+
+class AsyncRebuildIndexTests(SimpleTestCase):
+    def build_adapter(self, client):
+        return AsyncElasticsearchAdapter(client=client, article_repository=EmptyArticleRepository())
+
+    def test_rebuild_swaps_alias_to_new_index(self):
+        client = async_client(is_alias=True)
+        adapter = self.build_adapter(client)
+
+        self.assertTrue(async_to_sync(adapter.rebuild_index)())
+
+        new_index = client.indices.create.await_args.kwargs['index']
+        actions = client.indices.update_aliases.await_args.kwargs['body']['actions']
+        self.assertEqual(actions, [
+            {'remove_index': {'index': 'articles_20240101000000'}},
+            {'add': {'index': new_index, 'alias': adapter.index_name}},
+        ])
+        client.indices.delete.assert_not_awaited()
+
+    def test_failed_rebuild_drops_new_index(self):
+        client = async_client(existing_index=False)
+        client.indices.refresh.side_effect = RuntimeError('refresh failed')
+        adapter = self.build_adapter(client)
+
+        with self.assertRaises(RuntimeError):
+            async_to_sync(adapter.rebuild_index)()
+
+        new_index = client.indices.create.await_args.kwargs['index']
+        client.indices.delete.assert_awaited_once_with(index=new_index, ignore=[404])
+        client.indices.update_aliases.assert_not_awaited()
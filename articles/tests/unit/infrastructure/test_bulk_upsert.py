@@ -0,0 +1,52 @@
+# tests/unit/infrastructure/test_bulk_upsert.py
+import uuid
+from datetime import date
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from infrastructure.repositories.article.models import DjangoArticle, DjangoArticleDailyStats
+from infrastructure.repositories.bulk_upsert import bulk_upsert
+
+
+class BulkUpsertTests(TestCase):
+    """article_daily_stats: همه ستون‌ها NOT NULL با پیش‌فرض فقط در Django"""
+
+    @classmethod
+    def setUpTestData(cls):
+        # bulk_create سیگنال ایمیل خوشامد را اجرا نمی‌کند
+        author, = get_user_model().objects.bulk_create([
+            get_user_model()(email='author@example.com', username='author', password_hash='x')
+        ])
+        cls.article = DjangoArticle.objects.create(
+            id=uuid.uuid4(), title='آمار', slug='stats', content='متن', author=author
+        )
+
+    def flush_views(self, count, unique_count):
+        # همان فراخوانی RedisViewCounter.flush
+        return bulk_upsert(
+            DjangoArticleDailyStats,
+            [{'article': str(self.article.id), 'date': date(2024, 1, 1), 'view_count': count, 'unique_view_count': unique_count}],
+            unique_fields=('article', 'date'),
+            add_fields=('view_count',),
+            replace_fields=('unique_view_count',)
+        )
+
+    def test_view_flush_into_empty_table_fills_defaults(self):
+        self.assertEqual(self.flush_views(3, 2), 1)
+
+        row = DjangoArticleDailyStats.objects.get()
+        self.assertEqual((row.view_count, row.unique_view_count), (3, 2))
+        self.assertEqual((row.share_count, row.read_time_total, row.read_count), (0, 0, 0))
+
+    def test_second_flush_adds_and_replaces_without_touching_other_columns(self):
+        self.flush_views(3, 2)
+        bulk_upsert(
+            DjangoArticleDailyStats,
+            [{'article': str(self.article.id), 'date': date(2024, 1, 1), 'read_time_total': 90.0, 'read_count': 1}],
+            unique_fields=('article', 'date'),
+            add_fields=('read_time_total', 'read_count')
+        )
+        self.flush_views(4, 5)
+
+        row = DjangoArticleDailyStats.objects.get()
+        self.assertEqual((row.view_count, row.unique_view_count), (7, 5))
+        self.assertEqual((row.read_time_total, row.read_count), (90.0, 1))
@@ -0,0 +1,83 @@
+# tests/unit/infrastructure/test_database_fulltext_search.py
+import uuid
+from datetime import timedelta
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from infrastructure.repositories.article.models import DjangoArticle
+from infrastructure.services.search.database_fulltext_search import DatabaseFullTextSearchService
+
+
+@override_settings(SEARCH_CONFIG={**settings.SEARCH_CONFIG, 'BACKEND': 'database'})
+class DatabaseFullTextSearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # bulk_create سیگنال ایمیل خوشامد را اجرا نمی‌کند
+        cls.author, = get_user_model().objects.bulk_create([
+            get_user_model()(email='author@example.com', username='author', password_hash='x')
+        ])
+
+    def create_article(self, title, content, status='published'):
+        return DjangoArticle.objects.create(
+            id=uuid.uuid4(),
+            title=title,
+            slug=uuid.uuid4().hex,
+            content=content,
+            author=self.author,
+            status=status,
+            published_at=timezone.now()
+        )
+
+    def test_saved_article_is_searchable_through_migrated_index(self):
+        article = self.create_article('آموزش جنگو', 'ساخت یک کتابخانه کوچک با جنگو')
+        self.create_article('پیش‌نویس جنگو', 'متن پیش‌نویس', status='draft')
+
+        result = DatabaseFullTextSearchService().search_articles('جنگو')
+
+        self.assertEqual([hit.id for hit in result.hits], [str(article.id)])
+        self.assertEqual(result.total_results, 1)
+
+    def test_arabic_letter_variants_match(self):
+        article = self.create_article('كتاب', 'معرفي كتاب')
+
+        result = DatabaseFullTextSearchService().search_articles('کتاب')
+
+        self.assertEqual([hit.id for hit in result.hits], [str(article.id)])
+
+    def test_oldest_sort_orders_by_publish_date(self):
+        newer = self.create_article('جنگو جدید', 'متن')
+        older = self.create_article('جنگو قدیمی', 'متن')
+        DjangoArticle.objects.filter(id=older.id).update(published_at=newer.published_at - timedelta(days=1))
+
+        result = DatabaseFullTextSearchService().search_articles('جنگو', sort_by='oldest')
+
+        self.assertEqual([hit.id for hit in result.hits], [str(older.id), str(newer.id)])
+
+    def test_status_filter_is_applied(self):
+        self.create_article('آموزش جنگو', 'متن')
+
+        result = DatabaseFullTextSearchService().search_articles('جنگو', filters={'status': 'draft'})
+
+        self.assertEqual(result.hits, [])
+
+    def test_unsupported_sort_and_filter_are_rejected(self):
+        service = DatabaseFullTextSearchService()
+
+        with self.assertRaises(ValueError):
+            service.search_articles('جنگو', sort_by='random')
+        with self.assertRaises(ValueError):
+            service.search_articles('جنگو', filters={'language': 'fa'})
+
+    def test_indexed_ids_and_versions_cover_published_documents(self):
+        published = [self.create_article(f'جنگو {number}', 'متن') for number in range(3)]
+        draft = self.create_article('پیش‌نویس', 'متن', status='draft')
+        DjangoArticle.objects.filter(id=published[0].id).update(search_fingerprint='abc')
+        service = DatabaseFullTextSearchService()
+
+        first_page = service.get_indexed_ids(limit=2)
+        second_page = service.get_indexed_ids(after_id=first_page[-1], limit=2)
+        versions = service.get_indexed_versions([str(published[0].id), str(draft.id)])
+
+        self.assertCountEqual(first_page + second_page, [str(article.id) for article in published])
+        self.assertEqual(versions, {str(published[0].id): 'abc'})
@@ -0,0 +1,68 @@
+# tests/unit/infrastructure/test_django_article_stats_repository.py
+import uuid
+from datetime import timedelta
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+from domain.entities.article_stats import ArticleStats
+from infrastructure.repositories.article.django_article_stats_repository import DjangoArticleStatsRepository
+from infrastructure.repositories.article.models import DjangoArticle, DjangoArticleDailyStats
+from infrastructure.services.statistics.article_stats_summary import refresh_article_stats
+
+
+class DjangoArticleStatsRepositoryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # bulk_create سیگنال ایمیل خوشامد را اجرا نمی‌کند
+        author, = get_user_model().objects.bulk_create([
+            get_user_model()(email='author@example.com', username='author', password_hash='x')
+        ])
+        cls.article = DjangoArticle.objects.create(
+            id=uuid.uuid4(), title='آمار', slug='stats', content='متن', author=author
+        )
+        cls.article_id = str(cls.article.id)
+        cls.today = timezone.localdate()
+        # ردیفی که flush بازدیدها برای روز قبل نوشته است
+        DjangoArticleDailyStats.objects.create(
+            article=cls.article,
+            date=cls.today - timedelta(days=1),
+            view_count=10,
+            share_count=2,
+            read_time_total=120,
+            read_count=4
+        )
+
+    def test_replaced_stats_survive_summary_refresh(self):
+        repository = DjangoArticleStatsRepository()
+
+        repository.save_many([ArticleStats(self.article_id, view_count=25, share_count=3, average_read_time=45.0)])
+        refresh_article_stats(today=self.today)
+
+        self.assertEqual(
+            repository.get_by_article(self.article_id),
+            ArticleStats(self.article.id, view_count=25, share_count=3, average_read_time=45.0)
+        )
+
+    def test_added_stats_combine_with_flushed_views(self):
+        repository = DjangoArticleStatsRepository()
+
+        repository.save_many(
+            [ArticleStats(self.article_id, view_count=5, share_count=1, average_read_time=30.0)],
+            add_fields=('view_count', 'share_count')
+        )
+        # flush بعدی بازدیدها روی همان ردیف امروز جمع و خلاصه بازسازی می‌شود
+        DjangoArticleDailyStats.objects.filter(article=self.article, date=self.today).update(view_count=8)
+        refresh_article_stats([self.article_id], self.today)
+
+        stats = repository.get_by_article(self.article_id)
+        self.assertEqual((stats.view_count, stats.share_count, stats.average_read_time), (18, 3, 30.0))
+
+    def test_total_cannot_drop_below_past_days(self):
+        with self.assertRaises(ValueError):
+            DjangoArticleStatsRepository().save(ArticleStats(self.article_id, view_count=3))
+
+    def test_average_read_time_cannot_be_added(self):
+        with self.assertRaises(ValueError):
+            DjangoArticleStatsRepository().save_many(
+                [ArticleStats(self.article_id)], add_fields=('average_read_time',)
+            )
@@ -0,0 +1,36 @@
+# tests/unit/infrastructure/test_heavy_hitters.py
+from django.test import SimpleTestCase
+from infrastructure.services.statistics.heavy_hitters import RollingHeavyHitters, SpaceSaving
+
+
+class SpaceSavingTests(SimpleTestCase):
+    def test_keeps_frequent_items_within_capacity(self):
+        summary = SpaceSaving(capacity=10)
+        for item, count in [('python', 50), ('django', 30), ('redis', 20)]:
+            for _ in range(count):
+                summary.add(item)
+        for noise in range(40):
+            summary.add(f'noise-{noise}')
+
+        self.assertEqual(len(summary), 10)
+        top_items = [item for item, _, _ in summary.top(2)]
+        self.assertEqual(top_items, ['python', 'django'])
+
+    def test_count_never_underestimates(self):
+        summary = SpaceSaving(capacity=2)
+        for item in ['a', 'b', 'c', 'a', 'a']:
+            summary.add(item)
+
+        counts = {item: (count, error) for item, count, error in summary.top(2)}
+        count, error = counts['a']
+        self.assertGreaterEqual(count, 3)
+        self.assertLessEqual(count - error, 3)
+
+
+class RollingHeavyHittersTests(SimpleTestCase):
+    def test_rolling_window_forgets_old_buckets(self):
+        tracker = RollingHeavyHitters(window_seconds=600, bucket_seconds=60, capacity=10)
+        tracker.add('old', count=100, now=0)
+        tracker.add('new', count=5, now=900)
+
+        self.assertEqual(tracker.top(5, now=900), [('new', 5)])
@@ -0,0 +1,44 @@
+# tests/unit/infrastructure/test_resilient_search_service.py
+from django.test import SimpleTestCase, override_settings
+from infrastructure.services.search.circuit_breaker import CircuitBreaker
+from infrastructure.services.search.resilient_search_service import ResilientSearchService
+
+LOCMEM_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+class RejectingSearchService:
+    def search_articles(self, **kwargs):
+        raise ValueError("نشانگر صفحه‌بندی نامعتبر است")
+
+
+class RecordingFallback:
+    def __init__(self):
+        self.calls = []
+
+    def search_articles(self, **kwargs):
+        self.calls.append(kwargs)
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class ResilientSearchServiceTests(SimpleTestCase):
+    def test_invalid_request_does_not_open_circuit(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        service = ResilientSearchService(RejectingSearchService(), RecordingFallback(), breaker=breaker)
+
+        with self.assertRaises(ValueError):
+            service.search_articles('جنگو', cursor='not-a-cursor')
+
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    def test_cursor_request_is_not_restarted_on_fallback(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        breaker.record_failure()
+        fallback = RecordingFallback()
+        service = ResilientSearchService(RejectingSearchService(), fallback, breaker=breaker)
+
+        result = service.search_articles('جنگو', cursor='page-2')
+
+        self.assertTrue(result.is_degraded)
+        self.assertEqual(result.hits, [])
+        self.assertEqual(result.next_cursor, 'page-2')
+        self.assertEqual(fallback.calls, [])
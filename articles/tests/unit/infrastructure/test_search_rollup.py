@@ -0,0 +1,16 @@
+# tests/unit/infrastructure/test_search_rollup.py
+import random
+from django.test import SimpleTestCase
+from infrastructure.repositories.search.search_rollup import stochastic_round
+
+
+class StochasticRoundTests(SimpleTestCase):
+    def test_whole_numbers_are_exact(self):
+        self.assertEqual([stochastic_round(value) for value in (0.0, 1.0, 7.0)], [0, 1, 7])
+
+    def test_sampled_weights_are_not_undercounted(self):
+        random.seed(7)
+        # نرخ نمونه‌برداری ۰٫۳ یعنی وزن ۳٫۳۳؛ round همیشه ۳ می‌داد
+        total = sum(stochastic_round(1 / 0.3) for _ in range(30000))
+
+        self.assertAlmostEqual(total / 100000, 1, delta=0.01)
@@ -0,0 +1,82 @@
+# tests/unit/infrastructure/test_single_flight.py
+import threading
+from django.test import SimpleTestCase
+from infrastructure.services.search.single_flight import SingleFlight
+
+
+def run_concurrently(flight, key, fn, count):
+    results, errors = [], []
+    start = threading.Barrier(count)
+
+    def worker():
+        start.wait()
+        try:
+            results.append(flight.do(key, fn))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    return results, errors
+
+
+class SingleFlightTests(SimpleTestCase):
+    def test_concurrent_identical_calls_share_one_execution(self):
+        flight = SingleFlight()
+        calls = []
+        release = threading.Event()
+
+        def search():
+            calls.append(1)
+            release.wait(1)
+            return 'result'
+
+        threading.Timer(0.2, release.set).start()
+        results, errors = run_concurrently(flight, 'q', search, 8)
+        self.assertEqual(results, ['result'] * 8)
+        self.assertEqual(errors, [])
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flight.in_flight(), 0)
+
+    def test_error_is_shared_and_key_is_released(self):
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def failing():
+            release.wait(1)
+            raise RuntimeError('es down')
+
+        threading.Timer(0.2, release.set).start()
+        results, errors = run_concurrently(flight, 'q', failing, 4)
+        self.assertEqual(results, [])
+        self.assertEqual(len(errors), 4)
+        self.assertEqual(flight.do('q', lambda: 'fresh'), 'fresh')
+
+    def test_different_keys_run_independently(self):
+        flight = SingleFlight()
+        self.assertEqual(flight.do('a', lambda: 1), 1)
+        self.assertEqual(flight.do('b', lambda: 2), 2)
+
+        def invalid():
+            raise ValueError('bad query')
+
+        with self.assertRaises(ValueError):
+            flight.do('c', invalid)
+        self.assertEqual(flight.in_flight(), 0)
+
+    def test_copy_result_gives_each_waiter_its_own_object(self):
+        flight = SingleFlight(copy_result=True)
+        release = threading.Event()
+
+        def search():
+            release.wait(1)
+            return {'hits': ['a']}
+
+        threading.Timer(0.2, release.set).start()
+        results, errors = run_concurrently(flight, 'q', search, 4)
+        self.assertEqual(errors, [])
+        self.assertEqual(results, [{'hits': ['a']}] * 4)
+        self.assertEqual(len({id(result) for result in results}), 4)
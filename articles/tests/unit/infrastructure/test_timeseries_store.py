@@ -0,0 +1,60 @@
+# tests/unit/infrastructure/test_timeseries_store.py
+import tempfile
+from datetime import date
+from django.test import SimpleTestCase
+from infrastructure.services.statistics.timeseries_store import ArticleTimeSeriesStore
+
+
+class ArticleTimeSeriesStoreTests(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = directory.name
+
+    def test_range_spans_monthly_chunks(self):
+        store = ArticleTimeSeriesStore(self.path)
+        store.update('views', ['a', 'b', 'a'], [date(2024, 1, 31), date(2024, 2, 1), date(2024, 2, 1)], [5, 7, 3])
+
+        matrix = store.range('views', date(2024, 1, 30), date(2024, 2, 2))
+
+        self.assertEqual(matrix.shape, (2, 4))
+        self.assertEqual(matrix.tolist(), [[0, 5, 3, 0], [0, 0, 7, 0]])
+
+    def test_accumulate_adds_duplicate_entries(self):
+        store = ArticleTimeSeriesStore(self.path)
+        day = date(2024, 3, 10)
+        store.update('views', ['a', 'a'], [day, day], [2, 3], accumulate=True)
+        store.update('views', ['a'], [day], [1], accumulate=True)
+
+        self.assertEqual(store.totals('views', day, day, ['a']).tolist(), [6.0])
+
+    def test_rows_added_after_a_chunk_was_written(self):
+        store = ArticleTimeSeriesStore(self.path)
+        store.update('views', ['a'], [date(2024, 1, 1)], [4])
+        store.update('views', ['b'], [date(2024, 2, 1)], [9])
+
+        reopened = ArticleTimeSeriesStore(self.path)
+        totals = reopened.totals('views', date(2024, 1, 1), date(2024, 2, 29), ['b', 'missing', 'a'])
+
+        self.assertEqual(totals.tolist(), [9.0, 0.0, 4.0])
+
+    def test_top_and_clear(self):
+        store = ArticleTimeSeriesStore(self.path)
+        days = [date(2024, 5, 1)] * 3
+        store.update('views', ['a', 'b', 'c'], days, [10, 30, 20])
+
+        self.assertEqual(store.top('views', date(2024, 5, 1), date(2024, 5, 31), k=2), [('b', 30.0), ('c', 20.0)])
+
+        store.clear('views', date(2024, 5, 1), date(2024, 5, 1))
+        self.assertEqual(store.daily_totals('views', date(2024, 5, 1), date(2024, 5, 2)).tolist(), [0.0, 0.0])
+
+    def test_reader_sees_articles_added_by_another_store(self):
+        reader = ArticleTimeSeriesStore(self.path)
+        writer = ArticleTimeSeriesStore(self.path)
+        writer.update('views', ['a'], [date(2024, 4, 1)], [2])
+        self.assertEqual(reader.range('views', date(2024, 4, 1), date(2024, 4, 1)).tolist(), [[2]])
+
+        writer.update('views', ['b', 'c'], [date(2024, 4, 1)] * 2, [5, 8])
+
+        self.assertEqual(reader.range('views', date(2024, 4, 1), date(2024, 4, 1)).tolist(), [[2], [5], [8]])
+        self.assertEqual(reader.top('views', date(2024, 4, 1), date(2024, 4, 1), k=1), [('c', 8.0)])
@@ -13,4 +13,29 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+from infrastructure.services.search.client import (  # noqa: E402
+    close_async_elasticsearch_client,
+    get_async_elasticsearch_client,
+)
+
+
+async def application(scope, receive, send):
+    """
+    Django does not handle the ASGI lifespan protocol, so it is answered here:
+    the shared AsyncElasticsearch client is created on startup and its
+    connection pool is closed on shutdown.
+    """
+    if scope['type'] != 'lifespan':
+        return await django_application(scope, receive, send)
+
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            get_async_elasticsearch_client()
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            await close_async_elasticsearch_client()
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
@@ -1,4 +1,5 @@
 import os
+import sys
 from pathlib import Path
 import environ
 from datetime import timedelta
@@ -10,6 +11,9 @@ environ.Env.read_env()
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# لایه‌های اپ articles با ریشه‌های کوتاه (domain.، application.، infrastructure.) ایمپورت می‌شوند
+sys.path.append(str(BASE_DIR / 'articles'))
+
 SECRET_KEY = 'django-insecure-j7@4hld$45*j_&b*0))em!)o1ibj-^se@1=f!=ibt1mq6zo3&r'
 
 DEBUG = True
@@ -127,6 +131,9 @@ REST_FRAMEWORK = {
         'rest_framework_simplejwt.authentication.JWTAuthentication',
     ),
     'DEFAULT_FILTER_BACKENDS': ['django_filters.rest_framework.DjangoFilterBackend'],
+    'DEFAULT_THROTTLE_RATES': {
+        'read_beacon': '60/min',  # درخواست‌های بیکن زمان مطالعه برای هر IP
+    },
 }
 
 # تنظیمات JWT
@@ -162,6 +169,7 @@ ARTICLE_ERROR_CONFIG = {
     'MAX_TITLE_LENGTH': 200,
     'MIN_CONTENT_LENGTH': 300,
     'MAX_TAGS': 5,
+    'DUPLICATE_MAX_DISTANCE': 3,  # حداکثر فاصله همینگ SimHash برای تکراری شمردن محتوا
 }
 
 COMMENT_ERROR_CONFIG = {
@@ -173,15 +181,101 @@ COMMENT_ERROR_CONFIG = {
 
 # تنظیمات جستجو
 SEARCH_CONFIG = {
+    'BACKEND': env('SEARCH_BACKEND', default='elasticsearch'),  # یا 'database' برای جستجوی تمام‌متن خود دیتابیس
     'MIN_SEARCH_LENGTH': 3,
     'MAX_RESULTS': 50,
     'HIGHLIGHT_TAG': '<mark>',
+    'HIGHLIGHT_FRAGMENT_SIZE': 150,  # حداکثر طول هر قطعه هایلایت (کاراکتر)
+    'HIGHLIGHT_FRAGMENTS': 2,        # تعداد قطعات هایلایت برای هر نتیجه
+    'USE_POINT_IN_TIME': False,      # استفاده از point-in-time برای صفحه‌بندی با نشانگر
+    'PIT_KEEP_ALIVE': '1m',
+    'FACET_SIZE': 10,                # تعداد مقادیر برتر در هر facet
+    'FACET_DATE_INTERVAL': 'month',
+}
+
+# تنظیمات تاب‌آوری جستجو (قطع‌کننده مدار و جستجوی جایگزین دیتابیس)
+SEARCH_RESILIENCE = {
+    'REQUEST_TIMEOUT': 1.0,     # سقف زمان هر درخواست جستجو به Elasticsearch (ثانیه)
+    'LATENCY_BUDGET': 0.5,      # پاسخ کندتر از این مقدار خطا شمرده می‌شود (ثانیه)
+    'FAILURE_THRESHOLD': 5,     # تعداد خطای پشت سر هم تا باز شدن مدار
+    'RESET_TIMEOUT': 30.0,      # مدت باز ماندن مدار پیش از درخواست آزمایشی (ثانیه)
+    'STALE_TTL': 60 * 60,       # نگهداری آخرین نتیجه سالم برای سرو در زمان قطعی
+}
+
+# ادغام جستجوهای هم‌زمان یکسان (کاهش جهش بار در زمان اخبار داغ)
+SEARCH_COALESCING = {
+    'CROSS_PROCESS': False,  # ادغام بین پروسه‌ها با قفل کوتاه و انتشار نتیجه در Redis
+    'LOCK_TIMEOUT': 2.0,     # حداکثر انتظار پیروها برای نتیجه رهبر (ثانیه)
+    'RESULT_TTL': 2.0,       # نگهداری نتیجه منتشرشده برای پیروهای دیررس (ثانیه)
+}
+
+# تنظیمات اصلاح املایی جستجوهای بی‌نتیجه («منظورتان ... بود؟»)
+SPELLING_CORRECTION = {
+    'MAX_EDIT_DISTANCE': 2,
+    'VOCABULARY_SIZE': 20000,   # پرتکرارترین کلمات مقالات منتشرشده
+    'MIN_WORD_COUNT': 2,        # کلمات کم‌تکرار (اغلب خودشان غلط املایی هستند) حذف می‌شوند
+    # فایل واژگان ساخته‌شده با دستور build_spelling_vocabulary (برای اجرای دوره‌ای با cron)
+    'VOCABULARY_PATH': env('SPELLING_VOCABULARY_PATH', default=str(BASE_DIR / 'var' / 'spelling' / 'vocabulary.pickle')),
+    'RELOAD_CHECK_INTERVAL': 60,  # فاصله بررسی تغییر فایل واژگان در هر پروسه (ثانیه)
+}
+
+# تنظیمات بافر لاگ جستجو (درج گروهی به جای یک INSERT در هر جستجو)
+SEARCH_LOG_BUFFER = {
+    'MAX_QUEUE_SIZE': 10000,  # در صورت پر بودن صف، لاگ‌های جدید دور ریخته می‌شوند
+    'BATCH_SIZE': 500,
+    'FLUSH_INTERVAL': 5.0,    # ثانیه
+    'SAMPLE_RATE': 1.0,       # در ترافیک بسیار بالا می‌توان فقط بخشی از جستجوها را ثبت کرد
+    'MAX_RETRIES': 3,         # تعداد تلاش دوباره برای بسته‌ای که نوشتن آن شکست خورده
+    'MAX_RETRY_ROWS': 5000,   # حداکثر ردیف‌های منتظر تلاش دوباره؛ بیش از آن دور ریخته می‌شوند
+}
+
+# تنظیمات شمارش بازدید در Redis (ثبت گروهی با دستور flush_article_views)
+VIEW_COUNTER = {
+    'KEY_TTL': 2 * 24 * 60 * 60,  # نگهداری شمارنده‌ها و HyperLogLog هر روز (ثانیه)
+    'FLUSH_BATCH_SIZE': 1000,     # تعداد مقاله/روز در هر upsert
+}
+
+# جدول پربازدیدترین مقالات در sorted set های Redis
+POPULARITY_LEADERBOARD = {
+    'RETENTION_DAYS': 366,          # نگهداری sorted set روزانه (برای بازه سالانه)
+    'TRENDING_DAYS': 7,
+    'TRENDING_HALF_LIFE_DAYS': 1.0,  # وزن بازدیدهای هر روز قدیمی‌تر نسبت به روز بعد
+    'WINDOW_TTL': {'week': 60, 'month': 5 * 60, 'year': 60 * 60, 'trending': 60},  # ثانیه
+}
+
+# سری زمانی آرایه‌ای آمار مقالات (فایل‌های .npy ماهانه)
+ARTICLE_TIMESERIES = {
+    'ROOT': env('ARTICLE_TIMESERIES_ROOT', default=str(BASE_DIR / 'var' / 'timeseries')),
+}
+
+# وزن‌ها و سقف‌های نمره تعامل مقالات (نمره ۰ تا ۱۰۰)
+ENGAGEMENT_SCORING = {
+    'VIEWS': 0.4,
+    'COMMENTS': 0.3,
+    'READ_TIME': 0.3,
+    'VIEWS_CAP': 1000,
+    'COMMENTS_CAP': 50,
+    'READ_TIME_CAP': 300,  # ثانیه
+}
+
+# دریافت گروهی رویدادهای زمان مطالعه و عمق اسکرول از مرورگر
+READ_BEACON = {
+    'MAX_EVENTS_PER_REQUEST': 50,
+    'MAX_READ_TIME': 2 * 60 * 60,  # زمان‌های بیشتر (تب باز مانده) رد می‌شوند (ثانیه)
+    'FLUSH_INTERVAL': 10.0,        # ثانیه
+    'MAX_PENDING_KEYS': 100000,    # سقف تعداد مقاله/روز در انتظار ثبت در هر پروسه
+    'MAX_EVENTS_PER_CLIENT': 300,  # سقف رویدادهای پذیرفته‌شده از هر IP در هر پنجره
+    'CLIENT_WINDOW': 60,           # طول پنجره سقف رویدادها (ثانیه)
 }
 
 # تنظیمات کش
 CACHE_TTL = {
     'ARTICLE_DETAIL': 60 * 15,  # 15 دقیقه
     'ARTICLE_LIST': 60 * 5,     # 5 دقیقه
+    'SEARCH_RESULTS': 60,       # 1 دقیقه (هم‌اندازه PIT_KEEP_ALIVE)
+    'AUTHOR_STATS': 60 * 10,    # 10 دقیقه؛ با ثبت آمار جدید زودتر بی‌اعتبار می‌شود
+    'CATEGORY_STATS': 60 * 10,
+    'ENGAGEMENT_LEADERBOARD': 60 * 10,
 }
 
 
@@ -190,3 +284,16 @@ ELASTICSEARCH_DSL = {
         'hosts': 'localhost:9200'
     },
 }
+
+ELASTICSEARCH_URL = env('ELASTICSEARCH_URL', default='http://localhost:9200')
+ELASTICSEARCH_USER = env('ELASTICSEARCH_USER', default='elastic')
+ELASTICSEARCH_PASSWORD = env('ELASTICSEARCH_PASSWORD', default='')
+
+# تنظیمات کلاینت مشترک Elasticsearch (یک connection pool برای هر پروسه)
+ELASTICSEARCH_CLIENT = {
+    'MAX_CONNECTIONS': 25,   # حداکثر اتصال‌های باز به ازای هر نود
+    'TIMEOUT': 5,            # زمان انتظار هر درخواست (ثانیه)
+    'MAX_RETRIES': 2,
+    'RETRY_ON_TIMEOUT': False,  # تکرار درخواست کند فقط زمان انتظار worker را چند برابر می‌کند
+    'HTTP_COMPRESS': True,
+}